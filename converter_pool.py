@@ -0,0 +1,273 @@
+import asyncio
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import ConversionResult
+from docling.document_converter import DocumentConverter
+
+
+class ConverterPoolBusy(Exception):
+    """คิวรอ converter เต็ม หรือรอเกินเวลาที่กำหนด (ให้ endpoint ตอบ 503)"""
+
+
+class ConverterPool:
+    """
+    Pool ของ DocumentConverter ที่โหลดโมเดลไว้แล้ว (thread-safe)
+
+    - size: จำนวน converter (= จำนวน pipeline ที่โหลดโมเดลไว้พร้อมกัน)
+    - max_waiting: จำนวน request ที่รอ converter ได้พร้อมกัน เกินนี้จะ raise ConverterPoolBusy ทันที
+    - acquire_timeout: เวลารอ converter สูงสุด (วินาที), None = รอจนกว่าจะได้
+    """
+
+    def __init__(
+        self,
+        size=1,
+        max_waiting=8,
+        acquire_timeout=None,
+        preload_formats=(InputFormat.PDF,),
+        converter_factory=DocumentConverter,
+    ):
+        if size < 1:
+            raise ValueError("ConverterPool size must be >= 1")
+        self.size = size
+        self.max_waiting = max_waiting
+        self.acquire_timeout = acquire_timeout
+        self.preload_formats = tuple(preload_formats)
+        self._converter_factory = converter_factory
+
+        self._cond = threading.Condition()
+        self._idle = []
+        self._created = 0
+        self._waiting = 0
+        self._closed = False
+        # future ของ aconvert ที่รอ converter อยู่บน event loop: [(loop, future), ...]
+        self._async_waiters = []
+
+    @classmethod
+    def from_env(cls):
+        """สร้าง pool จาก Environment Variable (ตั้งค่าใน .env ได้)"""
+        timeout = os.getenv("CONVERTER_POOL_TIMEOUT")
+        return cls(
+            size=int(os.getenv("CONVERTER_POOL_SIZE", "1")),
+            max_waiting=int(os.getenv("CONVERTER_POOL_MAX_WAITING", "8")),
+            acquire_timeout=float(timeout) if timeout else None,
+        )
+
+    # --------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------
+    def _new_converter(self):
+        converter = self._converter_factory()
+        # โหลดโมเดล (layout / TableFormer / OCR) ไว้ล่วงหน้า ไม่ต้องรอตอนมี request
+        for fmt in self.preload_formats:
+            converter.initialize_pipeline(fmt)
+        return converter
+
+    def preload(self):
+        """สร้าง converter ให้ครบ size ตัว (เรียกตอน startup)"""
+        while True:
+            with self._cond:
+                if self._closed or self._created >= self.size:
+                    return
+                self._created += 1
+            try:
+                converter = self._new_converter()
+            except Exception:
+                with self._cond:
+                    self._created -= 1
+                raise
+            with self._cond:
+                self._idle.append(converter)
+                self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._idle.clear()
+            self._cond.notify_all()
+            self._wake_async_waiters()
+
+    # --------------------------------------------------
+    # Checkout / Checkin
+    # --------------------------------------------------
+    def acquire(self):
+        create_new = False
+        with self._cond:
+            if self._closed:
+                raise ConverterPoolBusy("Converter pool is closed")
+            if not self._idle and self._created < self.size:
+                # ยังสร้างไม่ครบ (ไม่ได้ preload) -> สร้างเพิ่มแบบ lazy
+                self._created += 1
+                create_new = True
+            elif not self._idle:
+                if self._waiting >= self.max_waiting:
+                    raise ConverterPoolBusy(
+                        f"Too many requests waiting for a converter ({self._waiting})"
+                    )
+                self._waiting += 1
+                try:
+                    deadline = (
+                        time.monotonic() + self.acquire_timeout
+                        if self.acquire_timeout is not None
+                        else None
+                    )
+                    while not self._idle and not self._closed:
+                        remaining = (
+                            deadline - time.monotonic() if deadline is not None else None
+                        )
+                        if remaining is not None and remaining <= 0:
+                            raise ConverterPoolBusy(
+                                f"Timed out after {self.acquire_timeout}s waiting for a converter"
+                            )
+                        self._cond.wait(remaining)
+                    if self._closed:
+                        raise ConverterPoolBusy("Converter pool is closed")
+                finally:
+                    self._waiting -= 1
+            if not create_new:
+                return self._idle.pop()
+
+        try:
+            return self._new_converter()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, converter):
+        with self._cond:
+            if self._closed:
+                return
+            self._idle.append(converter)
+            self._cond.notify()
+            self._wake_async_waiters()
+
+    def _wake_async_waiters(self):
+        # ปลุกทุกตัวให้ลองใหม่ (ตัวที่ถูก cancel ไปแล้วจะไม่ทำให้ตัวอื่นค้าง) - เรียกขณะถือ self._cond
+        for loop, waiter in self._async_waiters:
+            loop.call_soon_threadsafe(_set_waiter_done, waiter)
+        self._async_waiters.clear()
+
+    async def _aacquire(self):
+        """
+        acquire แบบ async: รอ converter ว่างบน event loop โดยไม่กิน thread ระหว่างรอ
+        ถ้าถูก cancel ระหว่างสร้าง converter แบบ lazy converter ที่สร้างเสร็จจะถูกคืนเข้า pool
+        """
+        loop = asyncio.get_running_loop()
+        deadline = (
+            loop.time() + self.acquire_timeout if self.acquire_timeout is not None else None
+        )
+        waiting = False
+        try:
+            while True:
+                with self._cond:
+                    if self._closed:
+                        raise ConverterPoolBusy("Converter pool is closed")
+                    if self._idle:
+                        return self._idle.pop()
+                    if self._created < self.size:
+                        # ยังสร้างไม่ครบ (ไม่ได้ preload) -> สร้างเพิ่มแบบ lazy
+                        self._created += 1
+                        break
+                    if not waiting:
+                        if self._waiting >= self.max_waiting:
+                            raise ConverterPoolBusy(
+                                f"Too many requests waiting for a converter ({self._waiting})"
+                            )
+                        self._waiting += 1
+                        waiting = True
+                    waiter = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+
+                remaining = deadline - loop.time() if deadline is not None else None
+                try:
+                    if remaining is not None and remaining <= 0:
+                        raise asyncio.TimeoutError
+                    await asyncio.wait_for(waiter, remaining)
+                except asyncio.TimeoutError:
+                    raise ConverterPoolBusy(
+                        f"Timed out after {self.acquire_timeout}s waiting for a converter"
+                    ) from None
+                finally:
+                    with self._cond:
+                        if (loop, waiter) in self._async_waiters:
+                            self._async_waiters.remove((loop, waiter))
+        finally:
+            if waiting:
+                with self._cond:
+                    self._waiting -= 1
+
+        # โหลดโมเดลบน thread แยก; shield ไว้เพื่อให้รู้ผลของการสร้างแม้ request ถูก cancel
+        creating = loop.run_in_executor(None, self._new_converter)
+        try:
+            return await asyncio.shield(creating)
+        except asyncio.CancelledError:
+            creating.add_done_callback(self._created_after_cancel)
+            raise
+        except Exception:
+            self._creation_failed()
+            raise
+
+    def _created_after_cancel(self, creating):
+        if creating.cancelled() or creating.exception() is not None:
+            self._creation_failed()
+        else:
+            self.release(creating.result())
+
+    def _creation_failed(self):
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+            self._wake_async_waiters()
+
+    @contextmanager
+    def checkout(self):
+        converter = self.acquire()
+        try:
+            yield converter
+        finally:
+            self.release(converter)
+
+    def convert(self, source, **kwargs):
+        """Checkout converter -> convert -> คืน converter (blocking, เรียกผ่าน asyncio.to_thread)"""
+        with self.checkout() as converter:
+            return converter.convert(source, **kwargs)
+
+    async def aconvert(self, source, **kwargs):
+        """
+        แปลงเอกสารด้วย async API ของ DocumentConverter (convert_async)
+        - การรอ converter ว่างทำบน event loop และการแปลงรันบน executor ของ converter เอง
+          ไม่ใช้ thread pool กลางของ event loop (ยกเว้นตอนสร้าง converter แบบ lazy)
+        - ถ้า request ถูก cancel (เช่น client ตัดการเชื่อมต่อ) pipeline จะหยุดป้อนหน้าใหม่ทันที
+        - convert_async จะจบก็ต่อเมื่อการแปลงบน executor หยุดทำงานแล้ว
+          converter จึงถูกคืนเข้า pool หลังจากนั้นเท่านั้น (ไม่ถูกใช้ซ้อนกับ request ถัดไป)
+        """
+        # รอ converter ว่าง (จำนวนที่รอถูกจำกัดด้วย max_waiting)
+        converter = await self._aacquire()
+        try:
+            result = None
+            async for item in converter.convert_async(source, **kwargs):
+                if isinstance(item, ConversionResult):
+                    result = item
+            return result
+        finally:
+            self.release(converter)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "max_waiting": self.max_waiting,
+            }
+
+
+def _set_waiter_done(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
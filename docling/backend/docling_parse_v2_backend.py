@@ -202,17 +202,20 @@ class DoclingParseV2PageBackend(PdfPageBackend):
             padbox.t = page_size.height - padbox.t
 
         with pypdfium2_lock:
-            image = (
-                self._ppage.render(
-                    scale=scale * 1.5,
-                    rotation=0,  # no additional rotation
-                    crop=padbox.as_tuple(),
-                )
-                .to_pil()
-                .resize(
-                    size=(round(cropbox.width * scale), round(cropbox.height * scale))
-                )
-            )  # We resize the image from 1.5x the given scale to make it sharper.
+            bitmap = self._ppage.render(
+                scale=scale * 1.5,
+                rotation=0,  # no additional rotation
+                crop=padbox.as_tuple(),
+            )
+            # Copied out of the bitmap buffer, so that pdfium frees it under the lock
+            rendered = bitmap.to_pil().copy()
+            bitmap.close()
+
+        # We resize the image from 1.5x the given scale to make it sharper.
+        # The resize does not touch pdfium, so it runs outside of the lock.
+        image = rendered.resize(
+            size=(round(cropbox.width * scale), round(cropbox.height * scale))
+        )
 
         return image
 
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union
 
 import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import SegmentedPdfPage, TextCell
 from docling_parse.pdf_parser import DoclingPdfParser, PdfDocument
@@ -12,8 +13,10 @@ from PIL import Image
 from pypdfium2 import PdfPage
 
 from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
+from docling.backend.pypdfium2_backend import get_page_object_rects
 from docling.datamodel.backend_options import PdfBackendOptions
 from docling.datamodel.base_models import Size
+from docling.utils.cell_index import TextCellIndex
 from docling.utils.locks import pypdfium2_lock
 
 if TYPE_CHECKING:
@@ -47,6 +50,7 @@ class DoclingParseV4PageBackend(PdfPageBackend):
         self._keep_images = keep_images
 
         self._dpage: Optional[SegmentedPdfPage] = None
+        self._textline_index: Optional[TextCellIndex] = None
         self._unloaded = False
         self.valid = (self._ppage is not None) and (self._dp_doc is not None)
 
@@ -77,31 +81,27 @@ class DoclingParseV4PageBackend(PdfPageBackend):
     def is_valid(self) -> bool:
         return self.valid
 
-    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+    def _get_textline_index(self) -> TextCellIndex:
         self._ensure_parsed()
         assert self._dpage is not None
 
+        # OCR and layout postprocessing replace the textline cells of the parsed
+        # page, so the index is rebuilt whenever they changed.
+        cells = self._dpage.textline_cells
+        index = self._textline_index
+        if index is None or index.source is not cells or len(index) != len(cells):
+            index = TextCellIndex(cells, page_height=self._dpage.dimension.height)
+            self._textline_index = index
+        return index
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
         # Find intersecting cells on the page
         text_piece = ""
-        page_size = self.get_size()
-
-        scale = (
-            1  # FIX - Replace with param in get_text_in_rect across backends (optional)
-        )
-
-        for i, cell in enumerate(self._dpage.textline_cells):
-            cell_bbox = (
-                cell.rect.to_bounding_box()
-                .to_top_left_origin(page_height=page_size.height)
-                .scaled(scale)
-            )
-
-            overlap_frac = cell_bbox.intersection_over_self(bbox)
-
-            if overlap_frac > 0.5:
-                if len(text_piece) > 0:
-                    text_piece += " "
-                text_piece += cell.text
+        index = self._get_textline_index()
+        for i in index.cells_in_bbox(bbox, ios=0.5):
+            if len(text_piece) > 0:
+                text_piece += " "
+            text_piece += index.cells[i].text
 
         return text_piece
 
@@ -133,6 +133,13 @@ class DoclingParseV4PageBackend(PdfPageBackend):
 
                 yield cropbox
 
+    def get_path_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
+        # The parser runs without keep_lines, so the paths are read with pdfium
+        for rect in get_page_object_rects(
+            self._ppage, self.get_size(), pdfium_c.FPDF_PAGEOBJ_PATH
+        ):
+            yield rect.scaled(scale=scale)
+
     def get_page_image(
         self, scale: float = 1, cropbox: Optional[BoundingBox] = None
     ) -> Image.Image:
@@ -155,17 +162,20 @@ class DoclingParseV4PageBackend(PdfPageBackend):
             padbox.t = page_size.height - padbox.t
 
         with pypdfium2_lock:
-            image = (
-                self._ppage.render(
-                    scale=scale * 1.5,
-                    rotation=0,  # no additional rotation
-                    crop=padbox.as_tuple(),
-                )
-                .to_pil()
-                .resize(
-                    size=(round(cropbox.width * scale), round(cropbox.height * scale))
-                )
-            )  # We resize the image from 1.5x the given scale to make it sharper.
+            bitmap = self._ppage.render(
+                scale=scale * 1.5,
+                rotation=0,  # no additional rotation
+                crop=padbox.as_tuple(),
+            )
+            # Copied out of the bitmap buffer, so that pdfium frees it under the lock
+            rendered = bitmap.to_pil().copy()
+            bitmap.close()
+
+        # We resize the image from 1.5x the given scale to make it sharper.
+        # The resize does not touch pdfium, so it runs outside of the lock.
+        image = rendered.resize(
+            size=(round(cropbox.width * scale), round(cropbox.height * scale))
+        )
 
         return image
 
@@ -186,6 +196,7 @@ class DoclingParseV4PageBackend(PdfPageBackend):
 
         self._ppage = None
         self._dpage = None
+        self._textline_index = None
         self._dp_doc = None
 
 
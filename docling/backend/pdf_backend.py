@@ -31,6 +31,13 @@ class PdfPageBackend(ABC):
     def get_bitmap_rects(self, float: int = 1) -> Iterable[BoundingBox]:
         pass
 
+    def get_path_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
+        """Bounding boxes of the vector paths (rules, borders, shapes) of the page.
+
+        Raises NotImplementedError for backends which cannot list them.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_page_image(
         self, scale: float = 1, cropbox: Optional[BoundingBox] = None
@@ -93,6 +93,54 @@ def get_pdf_page_geometry(
         )
 
 
+def get_page_object_rects(
+    ppage: pdfium.PdfPage, page_size: Size, object_type: int
+) -> list[BoundingBox]:
+    """
+    Bounding boxes of the page objects of one type, in top-left origin.
+
+    Args:
+        ppage: pypdfium2 PdfPage object
+        page_size: Size of the page, as seen after the page rotation
+        object_type: The pdfium object type, e.g. FPDF_PAGEOBJ_IMAGE
+
+    Returns:
+        The bounding boxes of the objects, with the page rotation applied
+    """
+    # Collect the positions first, so the lock is not held while they are converted
+    with pypdfium2_lock:
+        rotation = ppage.get_rotation()
+        positions = [obj.get_pos() for obj in ppage.get_objects(filter=[object_type])]
+
+    rects = []
+    for pos in positions:
+        if rotation == 90:
+            pos = (
+                pos[1],
+                page_size.height - pos[2],
+                pos[3],
+                page_size.height - pos[0],
+            )
+        elif rotation == 180:
+            pos = (
+                page_size.width - pos[2],
+                page_size.height - pos[3],
+                page_size.width - pos[0],
+                page_size.height - pos[1],
+            )
+        elif rotation == 270:
+            pos = (
+                page_size.width - pos[3],
+                pos[0],
+                page_size.width - pos[1],
+                pos[2],
+            )
+
+        rect = BoundingBox.from_tuple(pos, origin=CoordOrigin.BOTTOMLEFT)
+        rects.append(rect.to_top_left_origin(page_height=page_size.height))
+    return rects
+
+
 if TYPE_CHECKING:
     from docling.datamodel.document import InputDocument
 
@@ -129,29 +177,32 @@ class PyPdfiumPageBackend(PdfPageBackend):
 
         page_size = self.get_size()
 
+        # Only read from pdfium under the lock, build the cells afterwards
         with pypdfium2_lock:
+            text_rects = []
             for i in range(self.text_page.count_rects()):
                 rect = self.text_page.get_rect(i)
-                text_piece = self.text_page.get_text_bounded(*rect)
-                x0, y0, x1, y1 = rect
-                cells.append(
-                    TextCell(
-                        index=cell_counter,
-                        text=text_piece,
-                        orig=text_piece,
-                        from_ocr=False,
-                        rect=BoundingRectangle.from_bounding_box(
-                            BoundingBox(
-                                l=x0,
-                                b=y0,
-                                r=x1,
-                                t=y1,
-                                coord_origin=CoordOrigin.BOTTOMLEFT,
-                            )
-                        ).to_top_left_origin(page_size.height),
-                    )
+                text_rects.append((rect, self.text_page.get_text_bounded(*rect)))
+
+        for (x0, y0, x1, y1), text_piece in text_rects:
+            cells.append(
+                TextCell(
+                    index=cell_counter,
+                    text=text_piece,
+                    orig=text_piece,
+                    from_ocr=False,
+                    rect=BoundingRectangle.from_bounding_box(
+                        BoundingBox(
+                            l=x0,
+                            b=y0,
+                            r=x1,
+                            t=y1,
+                            coord_origin=CoordOrigin.BOTTOMLEFT,
+                        )
+                    ).to_top_left_origin(page_size.height),
                 )
-                cell_counter += 1
+            )
+            cell_counter += 1
 
         # PyPdfium2 produces very fragmented cells, with sub-word level boundaries, in many PDFs.
         # The cell merging code below is to clean this up.
@@ -254,40 +305,18 @@ class PyPdfiumPageBackend(PdfPageBackend):
 
     def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
         AREA_THRESHOLD = 0  # 32 * 32
-        page_size = self.get_size()
-
-        with pypdfium2_lock:
-            rotation = self._ppage.get_rotation()
-            for obj in self._ppage.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE]):
-                pos = obj.get_pos()
-                if rotation == 90:
-                    pos = (
-                        pos[1],
-                        page_size.height - pos[2],
-                        pos[3],
-                        page_size.height - pos[0],
-                    )
-                elif rotation == 180:
-                    pos = (
-                        page_size.width - pos[2],
-                        page_size.height - pos[3],
-                        page_size.width - pos[0],
-                        page_size.height - pos[1],
-                    )
-                elif rotation == 270:
-                    pos = (
-                        page_size.width - pos[3],
-                        pos[0],
-                        page_size.width - pos[1],
-                        pos[2],
-                    )
-
-                cropbox = BoundingBox.from_tuple(
-                    pos, origin=CoordOrigin.BOTTOMLEFT
-                ).to_top_left_origin(page_height=page_size.height)
-                if cropbox.area() > AREA_THRESHOLD:
-                    cropbox = cropbox.scaled(scale=scale)
-                    yield cropbox
+        for cropbox in get_page_object_rects(
+            self._ppage, self.get_size(), pdfium_c.FPDF_PAGEOBJ_IMAGE
+        ):
+            if cropbox.area() > AREA_THRESHOLD:
+                cropbox = cropbox.scaled(scale=scale)
+                yield cropbox
+
+    def get_path_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
+        for rect in get_page_object_rects(
+            self._ppage, self.get_size(), pdfium_c.FPDF_PAGEOBJ_PATH
+        ):
+            yield rect.scaled(scale=scale)
 
     def get_text_in_rect(self, bbox: BoundingBox) -> str:
         with pypdfium2_lock:
@@ -347,17 +376,20 @@ class PyPdfiumPageBackend(PdfPageBackend):
             padbox.t = page_size.height - padbox.t
 
         with pypdfium2_lock:
-            image = (
-                self._ppage.render(
-                    scale=scale * 1.5,
-                    rotation=0,  # no additional rotation
-                    crop=padbox.as_tuple(),
-                )
-                .to_pil()
-                .resize(
-                    size=(round(cropbox.width * scale), round(cropbox.height * scale))
-                )
-            )  # We resize the image from 1.5x the given scale to make it sharper.
+            bitmap = self._ppage.render(
+                scale=scale * 1.5,
+                rotation=0,  # no additional rotation
+                crop=padbox.as_tuple(),
+            )
+            # Copied out of the bitmap buffer, so that pdfium frees it under the lock
+            rendered = bitmap.to_pil().copy()
+            bitmap.close()
+
+        # We resize the image from 1.5x the given scale to make it sharper.
+        # The resize does not touch pdfium, so it runs outside of the lock.
+        image = rendered.resize(
+            size=(round(cropbox.width * scale), round(cropbox.height * scale))
+        )
 
         return image
 
@@ -219,6 +219,8 @@ class VlmPrediction(BaseModel):
     num_tokens: Optional[int] = None
     stop_reason: VlmStopReason = VlmStopReason.UNSPECIFIED
     input_prompt: Optional[str] = None
+    input_image_bytes: Optional[int] = None  # encoded image sent to API models
+    input_image_encode_time: float = -1
 
 
 class ContainerElement(
@@ -293,6 +295,13 @@ class ItemAndImageEnrichmentElement(BaseModel):
     image: Image
 
 
+class LayoutPath(str, Enum):
+    """How the layout of a page was obtained."""
+
+    MODEL = "model"
+    TEXT_FAST_PATH = "text_fast_path"
+
+
 class Page(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -302,6 +311,7 @@ class Page(BaseModel):
     parsed_page: Optional[SegmentedPdfPage] = None
     predictions: PagePredictions = PagePredictions()
     assembled: Optional[AssembledUnit] = None
+    layout_path: Optional[LayoutPath] = None  # Set when the text fast path is enabled
 
     _backend: Optional["PdfPageBackend"] = (
         None  # Internal PDF backend. By default it is cleared during assembling.
@@ -75,6 +75,7 @@ from docling.datamodel.base_models import (
     Page,
 )
 from docling.datamodel.settings import DocumentLimits
+from docling.utils.page_raster_cache import PageRasterCache
 from docling.utils.profiling import ProfilingItem
 from docling.utils.utils import create_file_hash
 
@@ -261,10 +262,14 @@ class ConversionAssets(BaseModel):
     def save(
         self,
         *,
-        filename: Union[str, Path],
+        filename: Union[str, Path, BytesIO],
         indent: Optional[int] = 2,
     ):
-        """Serialize the full ConversionAssets to JSON."""
+        """Serialize the full ConversionAssets to JSON.
+
+        The assets are written as a ZIP archive to `filename`, which may also be an
+        in-memory `BytesIO` buffer.
+        """
         if isinstance(filename, str):
             filename = Path(filename)
         # Build an in-memory ZIP archive containing JSON for each asset
@@ -325,13 +330,16 @@ class ConversionAssets(BaseModel):
 
         # Persist the ZIP to disk
         buf.seek(0)
+        if isinstance(filename, BytesIO):
+            filename.write(buf.getvalue())
+            return
         if filename.parent and not filename.parent.exists():
             filename.parent.mkdir(parents=True, exist_ok=True)
         with filename.open("wb") as f:
             f.write(buf.getvalue())
 
     @classmethod
-    def load(cls, filename: Union[str, Path]) -> "ConversionAssets":
+    def load(cls, filename: Union[str, Path, BytesIO]) -> "ConversionAssets":
         """Load a ConversionAssets."""
         if isinstance(filename, str):
             filename = Path(filename)
@@ -418,6 +426,9 @@ class ConversionResult(ConversionAssets):
     input: InputDocument
     assembled: AssembledUnit = AssembledUnit()
 
+    # Page renderings shared by the enrichment models, only set while enriching
+    _page_rasters: Optional[PageRasterCache] = None
+
 
 class _DummyBackend(AbstractDocumentBackend):
     def __init__(self, *args, **kwargs):
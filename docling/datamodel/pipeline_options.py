@@ -29,6 +29,7 @@ from docling.datamodel.pipeline_options_asr_model import (
     InlineAsrOptions,
 )
 from docling.datamodel.pipeline_options_vlm_model import (
+    ApiImageEncodingOptions,
     ApiVlmOptions,
     InferenceFramework,
     InlineVlmOptions,
@@ -76,6 +77,21 @@ class TableStructureOptions(BaseTableStructureOptions):
     mode: TableFormerMode = TableFormerMode.ACCURATE
 
 
+class OcrCacheOptions(BaseModel):
+    """Options for caching OCR results.
+
+    Results are keyed by the exact pixels of the rendered region together with the
+    OCR engine, its options and the render scale, so repeated regions, like the
+    letterhead of generated documents or a resubmitted file, are recognized once.
+    """
+
+    enabled: bool = False
+    max_entries: int = Field(default=10_000, ge=1)
+    # SQLite file keeping the results across runs and processes, None keeps them in
+    # memory only
+    path: Optional[Path] = None
+
+
 class OcrOptions(BaseOptions):
     """OCR options."""
 
@@ -84,6 +100,10 @@ class OcrOptions(BaseOptions):
     bitmap_area_threshold: float = (
         0.05  # percentage of the area for a bitmap to processed with OCR
     )
+    cache: OcrCacheOptions = OcrCacheOptions()
+
+    # Fields which do not change the recognized text, left out of the OCR cache key
+    cache_key_exclude: ClassVar[set[str]] = {"cache"}
 
 
 class OcrAutoOptions(OcrOptions):
@@ -132,6 +152,15 @@ class RapidOcrOptions(OcrOptions):
     # Dictionary to overwrite or pass-through additional parameters
     rapidocr_params: Dict[str, Any] = Field(default_factory=dict)
 
+    # RapidOCR engines recognizing OCR regions in parallel. They are created on
+    # demand, and each one loads its own copy of the models.
+    num_workers: int = Field(default=1, ge=1)
+
+    cache_key_exclude: ClassVar[set[str]] = OcrOptions.cache_key_exclude | {
+        "print_verbose",
+        "num_workers",
+    }
+
     model_config = ConfigDict(
         extra="forbid",
     )
@@ -153,6 +182,15 @@ class EasyOcrOptions(OcrOptions):
 
     suppress_mps_warnings: bool = True
 
+    # EasyOCR readers recognizing OCR regions in parallel. They are created on
+    # demand, and each one loads its own copy of the models (on the GPU if used).
+    num_workers: int = Field(default=1, ge=1)
+
+    cache_key_exclude: ClassVar[set[str]] = OcrOptions.cache_key_exclude | {
+        "suppress_mps_warnings",
+        "num_workers",
+    }
+
     model_config = ConfigDict(
         extra="forbid",
         protected_namespaces=(),
@@ -169,6 +207,13 @@ class TesseractCliOcrOptions(OcrOptions):
     psm: Optional[int] = (
         None  # Page Segmentation Mode (0-13), defaults to tesseract's default
     )
+    # tesseract processes running at once. Each one recognizes a share of the OCR
+    # regions of a batch, passed to it as an image list.
+    num_processes: int = Field(default=1, ge=1)
+
+    cache_key_exclude: ClassVar[set[str]] = OcrOptions.cache_key_exclude | {
+        "num_processes"
+    }
 
     model_config = ConfigDict(
         extra="forbid",
@@ -184,6 +229,13 @@ class TesseractOcrOptions(OcrOptions):
     psm: Optional[int] = (
         None  # Page Segmentation Mode (0-13), defaults to tesseract's default
     )
+    # Reader/OSD pairs recognizing OCR regions in parallel. They are created on
+    # demand, and each one holds its own copy of the language models.
+    num_readers: int = Field(default=1, ge=1)
+
+    cache_key_exclude: ClassVar[set[str]] = OcrOptions.cache_key_exclude | {
+        "num_readers"
+    }
 
     model_config = ConfigDict(
         extra="forbid",
@@ -220,6 +272,7 @@ class PictureDescriptionApiOptions(PictureDescriptionBaseOptions):
     params: Dict[str, Any] = {}
     timeout: float = 20
     concurrency: int = 1
+    image_encoding: ApiImageEncodingOptions = ApiImageEncodingOptions()
 
     prompt: str = "Describe this image in a few sentences."
     provenance: str = ""
@@ -332,6 +385,20 @@ class LayoutOptions(BaseLayoutOptions):
     model_spec: LayoutModelConfig = DOCLING_LAYOUT_HERON
 
 
+class TextFastPathOptions(BaseModel):
+    """Options for the heuristic layout of born-digital text pages.
+
+    When enabled, pages with well parsed text, no bitmaps and no table-like ruling
+    lines skip the layout model and get their clusters from the text lines. The
+    path taken is recorded in `Page.layout_path`.
+    """
+
+    enabled: bool = False
+    min_parse_score: float = 0.95  # Lowest parse_score of a fast-path page
+    max_bitmap_coverage: float = 0.0  # Fraction of the page covered by bitmaps
+    max_ruling_lines: int = 2  # Tolerated rules, e.g. under a header or a footer
+
+
 class AsrPipelineOptions(PipelineOptions):
     asr_options: Union[InlineAsrOptions] = asr_model_specs.WHISPER_TINY
 
@@ -339,7 +406,7 @@ class AsrPipelineOptions(PipelineOptions):
 class VlmExtractionPipelineOptions(PipelineOptions):
     """Options for extraction pipeline."""
 
-    vlm_options: Union[InlineVlmOptions] = NU_EXTRACT_2B_TRANSFORMERS
+    vlm_options: Union[InlineVlmOptions, ApiVlmOptions] = NU_EXTRACT_2B_TRANSFORMERS
 
 
 class PdfPipelineOptions(PaginatedPipelineOptions):
@@ -357,6 +424,7 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
     table_structure_options: BaseTableStructureOptions = TableStructureOptions()
     ocr_options: OcrOptions = OcrAutoOptions()
     layout_options: BaseLayoutOptions = LayoutOptions()
+    text_fast_path: TextFastPathOptions = TextFastPathOptions()
 
     images_scale: float = 1.0
     generate_page_images: bool = False
@@ -385,6 +453,12 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
     # Backpressure and queue control
     queue_max_size: int = 100
 
+    # Page sharding: documents with more pages than page_shard_size are split into
+    # shards of that size, built in page_shard_workers worker processes (each with
+    # its own models and backend) and merged before assembly. None disables it.
+    page_shard_size: Optional[int] = None
+    page_shard_workers: int = 4
+
 
 class ProcessingPipeline(str, Enum):
     LEGACY = "legacy"
@@ -2,7 +2,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
 from docling_core.types.doc.page import SegmentedPage
-from pydantic import AnyUrl, BaseModel, ConfigDict
+from pydantic import AnyUrl, BaseModel, ConfigDict, Field
 from transformers import StoppingCriteria
 from typing_extensions import deprecated
 
@@ -115,6 +115,26 @@ class HuggingFaceVlmOptions(InlineVlmOptions):
     pass
 
 
+class ApiImageFormat(str, Enum):
+    PNG = "png"
+    JPEG = "jpeg"
+    WEBP = "webp"
+
+
+class ApiImageEncodingOptions(BaseModel):
+    """How images are encoded into the requests of the API models.
+
+    PNG is lossless, JPEG and WebP make much smaller requests for scanned pages and
+    photos and are faster to encode.
+    """
+
+    format: ApiImageFormat = ApiImageFormat.PNG
+    quality: int = Field(default=85, ge=1, le=100)  # JPEG and WebP only
+    # Downscale so that the longer side has at most this many pixels
+    max_side: Optional[int] = Field(default=None, ge=1)
+    grayscale: bool = False  # e.g. for pages of text
+
+
 class ApiVlmOptions(BaseVlmOptions):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -129,6 +149,8 @@ class ApiVlmOptions(BaseVlmOptions):
     concurrency: int = 1
     response_format: ResponseFormat
 
+    image_encoding: ApiImageEncodingOptions = ApiImageEncodingOptions()
+
     stop_strings: List[str] = []
     custom_stopping_criteria: List[Union[GenerationStopper]] = []
     track_input_prompt: bool = False
@@ -27,12 +27,30 @@ class DocumentLimits(BaseModel):
 
 class BatchConcurrencySettings(BaseModel):
     doc_batch_size: int = 1  # Number of documents processed in one batch. Should be >= doc_batch_concurrency
-    doc_batch_concurrency: int = 1  # Number of parallel threads processing documents. Warning: Experimental! No benefit expected without free-threaded python.
+    doc_batch_concurrency: int = 1  # Number of parallel threads processing documents. Documents in the StandardPdfPipeline share its stage threads, so layout/table batches fill across documents. Warning: Experimental!
+    doc_process_workers: int = 0  # Number of worker processes used by convert_all, each with its own pipelines. 0 disables the process pool. Warning: Experimental!
+    doc_process_max_tasks: int = 0  # Documents converted by a worker process before it is replaced. 0 keeps workers alive.
+    doc_async_workers: int = 4  # Threads running conversions started with DocumentConverter.convert_async / aconvert_all.
     page_batch_size: int = 4  # Number of pages processed in one batch.
     page_batch_concurrency: int = 1  # Currently unused.
     elements_batch_size: int = (
         16  # Number of elements processed in one batch, in enrichment models.
     )
+    page_raster_cache_mb: int = (
+        512  # Memory (MB) for the page renderings enrichment crops are cut from.
+    )
+    api_max_connections_per_host: int = (
+        32  # Connections per server, and request threads, of the API models.
+    )
+    api_max_retries: int = (
+        3  # Retries of API requests failing to connect or answered with 429/5xx.
+    )
+    api_retry_backoff: float = (
+        0.5  # Base (seconds) of the exponential backoff between API retries.
+    )
+    # Memory (MB) for images already encoded for API requests, reused when the same
+    # image is sent again. Off by default: every image sent is hashed when it is on.
+    api_image_cache_mb: int = 0
 
     # To force models into single core: export OMP_NUM_THREADS=1
 
@@ -1,16 +1,20 @@
+import asyncio
+import contextvars
 import hashlib
 import logging
 import sys
 import threading
 import time
 import warnings
-from collections.abc import Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Type, Union
+from typing import Any, Optional, Type, Union
 
 from pydantic import ConfigDict, model_validator, validate_call
 from typing_extensions import Self
@@ -64,6 +68,14 @@ from docling.pipeline.asr_pipeline import AsrPipeline
 from docling.pipeline.base_pipeline import BasePipeline
 from docling.pipeline.simple_pipeline import SimplePipeline
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.conversion_control import (
+    ConversionControl,
+    PageProgressEvent,
+    reset_conversion_control,
+    set_conversion_control,
+)
+from docling.utils.process_pool import ConversionProcessPool
+from docling.utils.result_cache import ConversionResultCache
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
@@ -182,6 +194,7 @@ class DocumentConverter:
         self,
         allowed_formats: Optional[list[InputFormat]] = None,
         format_options: Optional[dict[InputFormat, FormatOption]] = None,
+        result_cache: Optional[ConversionResultCache] = None,
     ):
         self.allowed_formats = (
             allowed_formats if allowed_formats is not None else list(InputFormat)
@@ -223,6 +236,14 @@ class DocumentConverter:
         self.initialized_pipelines: dict[
             tuple[Type[BasePipeline], str], BasePipeline
         ] = {}
+        # Opt-in cache of conversion results, looked up before any pipeline runs
+        self.result_cache = result_cache
+        # Worker processes for settings.perf.doc_process_workers, started lazily
+        self._process_pool: Optional[ConversionProcessPool] = None
+        self._process_pool_lock = threading.Lock()
+        # Bounded executor running convert_async / aconvert_all, started lazily
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+        self._async_executor_lock = threading.Lock()
 
     def _get_initialized_pipelines(
         self,
@@ -236,6 +257,40 @@ class DocumentConverter:
             options_str.encode("utf-8"), usedforsecurity=False
         ).hexdigest()
 
+    def _get_process_pool(self) -> ConversionProcessPool:
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ConversionProcessPool(
+                    allowed_formats=self.allowed_formats,
+                    format_options=self.format_to_options,
+                    num_workers=settings.perf.doc_process_workers,
+                    max_tasks_per_worker=settings.perf.doc_process_max_tasks or None,
+                    result_cache=self.result_cache,
+                )
+                weakref.finalize(self, self._process_pool.terminate)
+            return self._process_pool
+
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        with self._async_executor_lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=settings.perf.doc_async_workers,
+                    thread_name_prefix="docling-async",
+                )
+            return self._async_executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes started for `settings.perf.doc_process_workers`
+        and the executor of the async API."""
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.close()
+        with self._async_executor_lock:
+            executor, self._async_executor = self._async_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def initialize_pipeline(self, format: InputFormat):
         """Initialize the conversion pipeline for the selected format."""
         pipeline = self._get_pipeline(doc_format=format)
@@ -306,6 +361,100 @@ class DocumentConverter:
                 "Conversion failed because the provided file has no recognizable format or it wasn't in the list of allowed formats."
             )
 
+    async def convert_async(
+        self,
+        source: Union[Path, str, DocumentStream],
+        headers: Optional[dict[str, str]] = None,
+        raises_on_error: bool = True,
+        max_num_pages: int = sys.maxsize,
+        max_file_size: int = sys.maxsize,
+        page_range: PageRange = DEFAULT_PAGE_RANGE,
+    ) -> AsyncIterator[Union[PageProgressEvent, ConversionResult]]:
+        """Async variant of :py:meth:`convert`, see :py:meth:`aconvert_all`."""
+        async for item in self.aconvert_all(
+            [source],
+            headers=headers,
+            raises_on_error=raises_on_error,
+            max_num_pages=max_num_pages,
+            max_file_size=max_file_size,
+            page_range=page_range,
+        ):
+            yield item
+
+    async def aconvert_all(
+        self,
+        source: Iterable[Union[Path, str, DocumentStream]],
+        headers: Optional[dict[str, str]] = None,
+        raises_on_error: bool = True,
+        max_num_pages: int = sys.maxsize,
+        max_file_size: int = sys.maxsize,
+        page_range: PageRange = DEFAULT_PAGE_RANGE,
+    ) -> AsyncIterator[Union[PageProgressEvent, ConversionResult]]:
+        """Convert documents without blocking the event loop.
+
+        Yields a `PageProgressEvent` for every page leaving the pipeline, and each
+        `ConversionResult` once its document is done. The conversion runs on a
+        dedicated executor of `settings.perf.doc_async_workers` threads, so callers
+        beyond that limit wait without holding a thread. Closing the iterator or
+        cancelling the awaiting task cancels the conversion: no new pages are fed
+        to the pipeline stages and the document is aborted. The iterator only
+        finishes once the conversion has stopped running.
+        """
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue[Any] = asyncio.Queue()
+        finished = object()
+
+        def emit(item: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(events.put_nowait, item)
+            except RuntimeError:  # event loop already closed
+                pass
+
+        control = ConversionControl(on_page=emit)
+
+        def run() -> None:
+            token = set_conversion_control(control)
+            try:
+                for conv_res in self.convert_all(
+                    source,
+                    headers=headers,
+                    raises_on_error=raises_on_error,
+                    max_num_pages=max_num_pages,
+                    max_file_size=max_file_size,
+                    page_range=page_range,
+                ):
+                    emit(conv_res)
+                    if control.cancelled:
+                        break
+                emit(finished)
+            except BaseException as exc:
+                emit(exc)
+            finally:
+                reset_conversion_control(token)
+
+        run_future = loop.run_in_executor(
+            self._get_async_executor(), contextvars.copy_context().run, run
+        )
+        try:
+            while (item := await events.get()) is not finished:
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # No-op once the conversion is complete
+            control.cancel()
+            # Only hand control back once the run has stopped, so the pipeline is
+            # idle for the caller's next conversion. A repeated cancel does not cut
+            # the wait short, it is raised afterwards.
+            cancelled = False
+            while not run_future.done():
+                try:
+                    await asyncio.wait([run_future])
+                except asyncio.CancelledError:
+                    cancelled = True
+            if cancelled:
+                raise asyncio.CancelledError
+
     @validate_call(config=ConfigDict(strict=True))
     def convert_string(
         self,
@@ -337,40 +486,64 @@ class DocumentConverter:
     def _convert(
         self, conv_input: _DocumentConversionInput, raises_on_error: bool
     ) -> Iterator[ConversionResult]:
+        if settings.perf.doc_process_workers > 0:
+            # Convert in worker processes, so PDF parsing is not serialized by
+            # the process-wide pypdfium2 lock
+            _log.info("Going to convert documents in worker processes...")
+            yield from self._get_process_pool().convert(
+                conv_input.path_or_stream_iterator,
+                headers=conv_input.headers,
+                limits=conv_input.limits,
+                raises_on_error=raises_on_error,
+            )
+            return
+
         start_time = time.monotonic()
+        process_func = partial(self._process_document, raises_on_error=raises_on_error)
+
+        if settings.perf.doc_batch_concurrency > 1 and settings.perf.doc_batch_size > 1:
+            # Keep up to doc_batch_size documents in flight on doc_batch_concurrency
+            # threads. Documents handled by the StandardPdfPipeline share one stage
+            # graph, so their pages fill the layout and table batches together.
+            # Results are yielded in input order.
+            _log.info("Going to convert documents concurrently...")
+            with ThreadPoolExecutor(
+                max_workers=settings.perf.doc_batch_concurrency
+            ) as pool:
+                in_flight: deque[Future[ConversionResult]] = deque()
+                try:
+                    for in_doc in conv_input.docs(self.format_to_options):
+                        # Run in a copy of this context, so the documents see
+                        # the caller's conversion control
+                        in_flight.append(
+                            pool.submit(
+                                contextvars.copy_context().run, process_func, in_doc
+                            )
+                        )
+                        if len(in_flight) >= settings.perf.doc_batch_size:
+                            yield in_flight.popleft().result()
+                    while in_flight:
+                        yield in_flight.popleft().result()
+                finally:
+                    for fut in in_flight:
+                        fut.cancel()
+            return
 
         for input_batch in chunkify(
             conv_input.docs(self.format_to_options),
             settings.perf.doc_batch_size,  # pass format_options
         ):
             _log.info("Going to convert document batch...")
-            process_func = partial(
-                self._process_document, raises_on_error=raises_on_error
-            )
-
-            if (
-                settings.perf.doc_batch_concurrency > 1
-                and settings.perf.doc_batch_size > 1
+            for item in map(
+                process_func,
+                input_batch,
             ):
-                with ThreadPoolExecutor(
-                    max_workers=settings.perf.doc_batch_concurrency
-                ) as pool:
-                    for item in pool.map(
-                        process_func,
-                        input_batch,
-                    ):
-                        yield item
-            else:
-                for item in map(
-                    process_func,
-                    input_batch,
-                ):
-                    elapsed = time.monotonic() - start_time
-                    start_time = time.monotonic()
-                    _log.info(
-                        f"Finished converting document {item.input.file.name} in {elapsed:.2f} sec."
-                    )
-                    yield item
+                elapsed = time.monotonic() - start_time
+                start_time = time.monotonic()
+                _log.info(
+                    f"Finished converting document {item.input.file.name} in {elapsed:.2f} sec."
+                )
+                yield item
 
     def _get_pipeline(self, doc_format: InputFormat) -> Optional[BasePipeline]:
         """Retrieve or initialize a pipeline, reusing instances based on class and options."""
@@ -425,13 +598,38 @@ class DocumentConverter:
 
         return conv_res
 
+    def _get_result_cache_key(self, in_doc: InputDocument) -> Optional[str]:
+        if self.result_cache is None:
+            return None
+        fopt = self.format_to_options.get(in_doc.format)
+        if fopt is None or fopt.pipeline_options is None:
+            return None
+        return self.result_cache.make_key(
+            in_doc,
+            pipeline_cls=fopt.pipeline_cls,
+            options_hash=self._get_pipeline_options_hash(fopt.pipeline_options),
+        )
+
     def _execute_pipeline(
         self, in_doc: InputDocument, raises_on_error: bool
     ) -> ConversionResult:
         if in_doc.valid:
+            cache_key = self._get_result_cache_key(in_doc)
+            if cache_key is not None:
+                assert self.result_cache is not None
+                cached_res = self.result_cache.get(cache_key, in_doc)
+                if cached_res is not None:
+                    # Warm hit: neither the pipeline nor the backend is needed
+                    _log.info(f"Using cached conversion result for {in_doc.file}")
+                    in_doc._backend.unload()
+                    return cached_res
+
             pipeline = self._get_pipeline(in_doc.format)
             if pipeline is not None:
                 conv_res = pipeline.execute(in_doc, raises_on_error=raises_on_error)
+                if cache_key is not None:
+                    assert self.result_cache is not None
+                    self.result_cache.put(cache_key, conv_res)
             else:
                 if raises_on_error:
                     raise ConversionError(
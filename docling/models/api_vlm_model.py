@@ -1,5 +1,5 @@
+import logging
 from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 import numpy as np
@@ -14,9 +14,13 @@ from docling.models.utils.generation_utils import GenerationStopper
 from docling.utils.api_image_request import (
     api_image_request,
     api_image_request_streaming,
+    encode_image,
+    map_requests,
 )
 from docling.utils.profiling import TimeRecorder
 
+_log = logging.getLogger(__name__)
+
 
 class ApiVlmModel(BaseVlmPageModel):
     # Override the vlm_options type annotation from BaseVlmPageModel
@@ -132,6 +136,14 @@ class ApiVlmModel(BaseVlmPageModel):
             if image.mode != "RGB":
                 image = image.convert("RGB")
 
+            encoded = encode_image(image, self.vlm_options.image_encoding)
+            _log.debug(
+                f"Encoded {image.width}x{image.height} image as "
+                f"{encoded.mime_type}: {len(encoded.data)} bytes in "
+                f"{encoded.encode_time * 1000:.1f} ms"
+                + (" (cached)" if encoded.cached else "")
+            )
+
             stop_reason = VlmStopReason.UNSPECIFIED
 
             if self.vlm_options.custom_stopping_criteria:
@@ -148,7 +160,7 @@ class ApiVlmModel(BaseVlmPageModel):
 
                 # Streaming path with early abort support
                 page_tags, num_tokens = api_image_request_streaming(
-                    image=image,
+                    image=encoded,
                     prompt=prompt_text,
                     url=self.vlm_options.url,
                     timeout=self.timeout,
@@ -159,7 +171,7 @@ class ApiVlmModel(BaseVlmPageModel):
             else:
                 # Non-streaming fallback (existing behavior)
                 page_tags, num_tokens, stop_reason = api_image_request(
-                    image=image,
+                    image=encoded,
                     prompt=prompt_text,
                     url=self.vlm_options.url,
                     timeout=self.timeout,
@@ -174,7 +186,10 @@ class ApiVlmModel(BaseVlmPageModel):
                 num_tokens=num_tokens,
                 stop_reason=stop_reason,
                 input_prompt=input_prompt,
+                input_image_bytes=len(encoded.data),
+                input_image_encode_time=encoded.encode_time,
             )
 
-        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-            yield from executor.map(_process_single_image, zip(images, prompts))
+        yield from map_requests(
+            _process_single_image, zip(images, prompts), self.concurrency
+        )
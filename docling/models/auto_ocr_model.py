@@ -1,6 +1,6 @@
 import logging
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Optional, Type
 
@@ -50,6 +50,7 @@ class OcrAutoModel(BaseOcrModel):
                         options=OcrMacOptions(
                             bitmap_area_threshold=self.options.bitmap_area_threshold,
                             force_full_page_ocr=self.options.force_full_page_ocr,
+                            cache=self.options.cache,
                         ),
                         accelerator_options=accelerator_options,
                     )
@@ -69,6 +70,7 @@ class OcrAutoModel(BaseOcrModel):
                             backend="onnxruntime",
                             bitmap_area_threshold=self.options.bitmap_area_threshold,
                             force_full_page_ocr=self.options.force_full_page_ocr,
+                            cache=self.options.cache,
                         ),
                         accelerator_options=accelerator_options,
                     )
@@ -88,6 +90,7 @@ class OcrAutoModel(BaseOcrModel):
                         options=EasyOcrOptions(
                             bitmap_area_threshold=self.options.bitmap_area_threshold,
                             force_full_page_ocr=self.options.force_full_page_ocr,
+                            cache=self.options.cache,
                         ),
                         accelerator_options=accelerator_options,
                     )
@@ -107,6 +110,7 @@ class OcrAutoModel(BaseOcrModel):
                             backend="torch",
                             bitmap_area_threshold=self.options.bitmap_area_threshold,
                             force_full_page_ocr=self.options.force_full_page_ocr,
+                            cache=self.options.cache,
                         ),
                         accelerator_options=accelerator_options,
                     )
@@ -127,6 +131,13 @@ class OcrAutoModel(BaseOcrModel):
             return
         yield from self._engine(conv_res, page_batch)
 
+    def process_documents(
+        self, batches: Sequence[tuple[ConversionResult, Sequence[Page]]]
+    ) -> list[list[Page]]:
+        if not self.enabled or self._engine is None:
+            return [list(pages) for _, pages in batches]
+        return self._engine.process_documents(batches)
+
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
         return OcrAutoOptions
@@ -26,6 +26,16 @@ class BaseLayoutModel(BasePageModel, BaseModelWithOptions, ABC):
     ) -> Sequence[LayoutPrediction]:
         """Produce layout predictions for the provided pages."""
 
+    def predict_layout_documents(
+        self,
+        batches: Sequence[tuple[ConversionResult, Sequence[Page]]],
+    ) -> list[Sequence[LayoutPrediction]]:
+        """Produce layout predictions for the pages of several documents.
+
+        The default implementation calls :py:meth:`predict_layout` once per document.
+        """
+        return [self.predict_layout(conv_res, pages) for conv_res, pages in batches]
+
     def __call__(
         self,
         conv_res: ConversionResult,
@@ -37,3 +47,16 @@ class BaseLayoutModel(BasePageModel, BaseModelWithOptions, ABC):
         for page, prediction in zip(pages, predictions):
             page.predictions.layout = prediction
             yield page
+
+    def process_documents(
+        self, batches: Sequence[tuple[ConversionResult, Sequence[Page]]]
+    ) -> list[list[Page]]:
+        batches = [(conv_res, list(pages)) for conv_res, pages in batches]
+        results: list[list[Page]] = []
+        for (_, pages), predictions in zip(
+            batches, self.predict_layout_documents(batches)
+        ):
+            for page, prediction in zip(pages, predictions):
+                page.predictions.layout = prediction
+            results.append(list(pages))
+        return results
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Any, Generic, Optional, Protocol, Type, Union
 
 import numpy as np
@@ -42,6 +42,18 @@ class BasePageModel(ABC):
     ) -> Iterable[Page]:
         pass
 
+    def process_documents(
+        self, batches: Sequence[tuple[ConversionResult, Sequence[Page]]]
+    ) -> list[list[Page]]:
+        """Process page batches belonging to several documents.
+
+        Used by the threaded pipeline stages when pages of concurrent documents
+        meet in one stage batch. Models which can share a single inference call
+        across documents override this; by default each document is processed
+        on its own.
+        """
+        return [list(self(conv_res, pages)) for conv_res, pages in batches]
+
 
 class BaseVlmModel(ABC):
     """Base class for Vision-Language Models that adds image processing capability."""
@@ -214,9 +226,15 @@ class BaseItemAndImageEnrichmentModel(
         )
 
         page_ix = element_prov.page_no - conv_res.pages[0].page_no - 1
-        cropped_image = conv_res.pages[page_ix].get_image(
-            scale=self.images_scale, cropbox=expanded_bbox
-        )
+        page = conv_res.pages[page_ix]
+        if conv_res._page_rasters is not None:
+            cropped_image = conv_res._page_rasters.get_image(
+                page, scale=self.images_scale, cropbox=expanded_bbox
+            )
+        else:
+            cropped_image = page.get_image(
+                scale=self.images_scale, cropbox=expanded_bbox
+            )
 
         # Allow for images being embedded without the page backend or page images
         if cropped_image is None and isinstance(element, PictureItem):
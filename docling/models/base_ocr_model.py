@@ -1,12 +1,15 @@
 import copy
 import logging
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Type
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Type
 
 import numpy as np
-from docling_core.types.doc import BoundingBox, CoordOrigin
+from docling_core.types.doc import BoundingBox, CoordOrigin, Size
 from docling_core.types.doc.page import TextCell
 from PIL import Image, ImageDraw
 from rtree import index
@@ -17,10 +20,26 @@ from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import OcrOptions
 from docling.datamodel.settings import settings
 from docling.models.base_model import BaseModelWithOptions, BasePageModel
+from docling.utils.ocr_cache import OcrCache, shift_cells
+from docling.utils.profiling import TimeRecorder
 
 _log = logging.getLogger(__name__)
 
 
+@dataclass
+class OcrRegion:
+    """A rectangle of a page to OCR, as scheduled by :py:class:`BaseOcrModel`."""
+
+    conv_res: ConversionResult
+    page: Page
+    rect: BoundingBox  # page coordinates, top-left origin
+    index: int  # position among the OCR rectangles of the page
+    image: Optional[Image.Image] = None  # the rectangle rendered at the model scale
+    cells: List[TextCell] = field(default_factory=list)  # page coordinates
+    # Set by the engine when recognition failed, so the empty result is not cached
+    failed: bool = False
+
+
 class BaseOcrModel(BasePageModel, BaseModelWithOptions):
     def __init__(
         self,
@@ -30,72 +49,165 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
         options: OcrOptions,
         accelerator_options: AcceleratorOptions,
     ):
-        # Make sure any delay/error from import occurs on ocr model init and not first use
-        from scipy.ndimage import binary_dilation, find_objects, label
+        if not self._implements_ocr():
+            raise TypeError(
+                f"Can't instantiate {type(self).__name__}: OCR models must "
+                "implement _ocr_regions (or their own __call__)"
+            )
 
         self.enabled = enabled
         self.options = options
+        self.scale: float = 3  # multiplier for 72 dpi == 216 dpi.
+        # Number of region batches recognized concurrently. Models raising it must
+        # make _ocr_regions thread-safe, e.g. with one engine instance per thread.
+        self.num_workers: int = 1
+        self._cache: Optional[OcrCache] = None  # opened on first use
+
+    # Bitmaps are grown by this many pixels (at 72 dpi) before touching ones are
+    # merged, matching a dilation with a 20x20 structuring element
+    OCR_RECT_GROW = (10, 9)  # before, after
+
+    @staticmethod
+    def find_ocr_rects(
+        size: Size, bitmap_rects: Iterable[BoundingBox]
+    ) -> tuple[float, List[BoundingBox]]:
+        """Merge nearby bitmaps into regions.
+
+        Returns the fraction of the page covered by the (dilated) bitmaps and the
+        bounding boxes of the merged regions.
+
+        The bitmaps are handled as inclusive rectangles on the 72 dpi pixel grid of
+        the page, grown by `OCR_RECT_GROW` and merged when they overlap or share an
+        edge, with a sweep over x and a union-find. The coverage is the area of their
+        union. Memory stays linear in the number of bitmaps, plus one count per
+        pixel of the page.
+        """
+        width, height = round(size.width), round(size.height)
+        boxes = np.array(
+            [[round(v) for v in rect.as_tuple()] for rect in bitmap_rects],
+            dtype=np.int64,
+        ).reshape(-1, 4)
+
+        # Drop what falls outside the page, then clip, grow and clip again
+        before, after = BaseOcrModel.OCR_RECT_GROW
+        upper = np.array([width - 1, height - 1, width - 1, height - 1])
+        lower = np.maximum(boxes[:, :2], 0)
+        higher = np.minimum(boxes[:, 2:], upper[:2])
+        boxes = boxes[np.all(lower <= higher, axis=1)]
+        boxes = np.clip(boxes, 0, upper)
+        if len(boxes) == 0:
+            return (0.0, [])
+        boxes = np.clip(boxes + np.array([-before, -before, after, after]), 0, upper)
+        x0, y0, x1, y1 = boxes.T
+
+        page_area = size.width * size.height
+        if np.any(np.all(boxes == [0, 0, width - 1, height - 1], axis=1)):
+            # A bitmap spans the whole page and absorbs all others
+            return (
+                (width * height) / page_area,
+                [
+                    BoundingBox(
+                        l=0,
+                        t=0,
+                        r=width - 1,
+                        b=height - 1,
+                        coord_origin=CoordOrigin.TOPLEFT,
+                    )
+                ],
+            )
+
+        # Rectangles are connected when they overlap on one axis and overlap or
+        # touch on the other, as pixels are 4-connected. Sweeping over x, only the
+        # rectangles still reaching the current one on x are candidates.
+        parent = np.arange(len(boxes))
+
+        def find(ix: np.ndarray) -> np.ndarray:
+            roots = parent[ix]
+            while not np.array_equal(up := parent[roots], roots):
+                roots = up
+            return roots
+
+        active = np.empty(0, dtype=np.int64)
+        for j in np.argsort(x0, kind="stable"):
+            active = active[x1[active] + 1 >= x0[j]]
+            # Touching on y is enough where the rectangles overlap on x
+            slack = (x0[j] <= x1[active]).astype(np.int64)
+            hits = active[(y0[active] <= y1[j] + slack) & (y0[j] <= y1[active] + slack)]
+            if len(hits) > 0:
+                hit_roots = find(hits)
+                root = hit_roots.min()
+                parent[hit_roots] = root
+                parent[hits] = root
+                parent[j] = root
+            active = np.append(active, j)
+
+        _, groups = np.unique(find(np.arange(len(boxes))), return_inverse=True)
+        num_groups = int(groups.max()) + 1
+
+        left = np.full(num_groups, width)
+        top = np.full(num_groups, height)
+        right = np.full(num_groups, -1)
+        bottom = np.full(num_groups, -1)
+        np.minimum.at(left, groups, x0)
+        np.minimum.at(top, groups, y0)
+        np.maximum.at(right, groups, x1)
+        np.maximum.at(bottom, groups, y1)
+
+        # Order the regions by their first pixel in row-major order
+        top_row = y0 == top[groups]
+        first_x = np.full(num_groups, width)
+        np.minimum.at(first_x, groups[top_row], x0[top_row])
+        order = np.lexsort((first_x, top))
+
+        bounding_boxes = [
+            BoundingBox(
+                l=int(left[g]),
+                t=int(top[g]),
+                r=int(right[g]),
+                b=int(bottom[g]),
+                coord_origin=CoordOrigin.TOPLEFT,
+            )
+            for g in order
+        ]
+
+        # Area of the union, from a page sized count of the rectangles over each
+        # pixel, accumulated from their corners
+        counts = np.zeros((height + 1, width + 1), dtype=np.int32)
+        np.add.at(counts, (y0, x0), 1)
+        np.add.at(counts, (y0, x1 + 1), -1)
+        np.add.at(counts, (y1 + 1, x0), -1)
+        np.add.at(counts, (y1 + 1, x1 + 1), 1)
+        np.cumsum(counts, axis=0, out=counts)
+        np.cumsum(counts, axis=1, out=counts)
+        area = np.count_nonzero(counts)
+
+        return (area / page_area, bounding_boxes)  # fraction covered  # boxes
 
     # Computes the optimum amount and coordinates of rectangles to OCR on a given page
     def get_ocr_rects(self, page: Page) -> List[BoundingBox]:
-        from scipy.ndimage import binary_dilation, find_objects, label
-
         BITMAP_COVERAGE_TRESHOLD = 0.75
         assert page.size is not None
 
-        def find_ocr_rects(size, bitmap_rects):
-            image = Image.new(
-                "1", (round(size.width), round(size.height))
-            )  # '1' mode is binary
-
-            # Draw all bitmap rects into a binary image
-            draw = ImageDraw.Draw(image)
-            for rect in bitmap_rects:
-                x0, y0, x1, y1 = rect.as_tuple()
-                x0, y0, x1, y1 = round(x0), round(y0), round(x1), round(y1)
-                draw.rectangle([(x0, y0), (x1, y1)], fill=1)
-
-            np_image = np.array(image)
-
-            # Dilate the image by 10 pixels to merge nearby bitmap rectangles
-            structure = np.ones(
-                (20, 20)
-            )  # Create a 20x20 structure element (10 pixels in all directions)
-            np_image = binary_dilation(np_image > 0, structure=structure)
-
-            # Find the connected components
-            labeled_image, num_features = label(
-                np_image > 0
-            )  # Label black (0 value) regions
-
-            # Find enclosing bounding boxes for each connected component.
-            slices = find_objects(labeled_image)
-            bounding_boxes = [
+        if self.options.force_full_page_ocr:
+            # No need to look at the bitmaps
+            return [
                 BoundingBox(
-                    l=slc[1].start,
-                    t=slc[0].start,
-                    r=slc[1].stop - 1,
-                    b=slc[0].stop - 1,
+                    l=0,
+                    t=0,
+                    r=page.size.width,
+                    b=page.size.height,
                     coord_origin=CoordOrigin.TOPLEFT,
                 )
-                for slc in slices
             ]
 
-            # Compute area fraction on page covered by bitmaps
-            area_frac = np.sum(np_image > 0) / (size.width * size.height)
-
-            return (area_frac, bounding_boxes)  # fraction covered  # boxes
-
         if page._backend is not None:
             bitmap_rects = page._backend.get_bitmap_rects()
         else:
             bitmap_rects = []
-        coverage, ocr_rects = find_ocr_rects(page.size, bitmap_rects)
+        coverage, ocr_rects = self.find_ocr_rects(page.size, bitmap_rects)
 
         # return full-page rectangle if page is dominantly covered with bitmaps
-        if self.options.force_full_page_ocr or coverage > max(
-            BITMAP_COVERAGE_TRESHOLD, self.options.bitmap_area_threshold
-        ):
+        if coverage > max(BITMAP_COVERAGE_TRESHOLD, self.options.bitmap_area_threshold):
             return [
                 BoundingBox(
                     l=0,
@@ -215,11 +327,170 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
             out_file = out_path / f"ocr_page_{page.page_no:05}.png"
             image.save(str(out_file), format="png")
 
-    @abstractmethod
+    # Maximum number of regions handed to one _ocr_regions call. None splits the
+    # regions evenly over the workers. Models with batch inference raise it.
+    regions_per_call: ClassVar[Optional[int]] = 1
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
-        pass
+        yield from self.process_documents([(conv_res, list(page_batch))])[0]
+
+    def process_documents(
+        self, batches: Sequence[tuple[ConversionResult, Sequence[Page]]]
+    ) -> list[list[Page]]:
+        """OCR the pages of several documents with the region scheduler.
+
+        The OCR rectangles of all pages are collected, sorted by size and recognized
+        in batches of `regions_per_call` by up to `num_workers` threads. The cells
+        are then merged into their pages, in the order of the page rectangles.
+        """
+        batches = [(conv_res, list(pages)) for conv_res, pages in batches]
+        if not self.enabled:
+            return [pages for _, pages in batches]
+        if type(self)._ocr_regions is BaseOcrModel._ocr_regions:
+            # Models with their own __call__, e.g. from plugins
+            if not self._implements_ocr():
+                raise TypeError(
+                    f"{type(self).__name__} implements neither _ocr_regions "
+                    "nor __call__"
+                )
+            return super().process_documents(batches)
+
+        page_rects: dict[int, List[BoundingBox]] = {}
+        regions: List[OcrRegion] = []
+        for conv_res, pages in batches:
+            with TimeRecorder(conv_res, "ocr"):
+                for page in pages:
+                    assert page._backend is not None
+                    if not page._backend.is_valid():
+                        continue
+                    ocr_rects = self.get_ocr_rects(page)
+                    page_rects[id(page)] = ocr_rects
+                    regions.extend(
+                        OcrRegion(conv_res=conv_res, page=page, rect=rect, index=ix)
+                        for ix, rect in enumerate(ocr_rects)
+                        if rect.area() > 0  # Skip zero area boxes
+                    )
+
+        if regions and self._cache is None:
+            self._cache = OcrCache.from_options(self.options.cache)
+        if regions:
+            with ExitStack() as stack:
+                for conv_res, _ in batches:
+                    stack.enter_context(TimeRecorder(conv_res, "ocr"))
+                self.recognize_regions(regions)
+            if self._cache is not None:
+                _log.debug(f"OCR cache: {self._cache.stats()}")
+
+        page_regions: dict[int, List[OcrRegion]] = {}
+        for region in regions:
+            page_regions.setdefault(id(region.page), []).append(region)
+
+        for conv_res, pages in batches:
+            for page in pages:
+                if id(page) not in page_rects:
+                    continue
+                with TimeRecorder(conv_res, "ocr"):
+                    ocr_cells = [
+                        cell
+                        for region in sorted(
+                            page_regions.get(id(page), []), key=lambda r: r.index
+                        )
+                        for cell in region.cells
+                    ]
+                    # Post-process the cells
+                    self.post_process_cells(ocr_cells, page)
+
+                # DEBUG code:
+                if settings.debug.visualize_ocr:
+                    self.draw_ocr_rects_and_cells(conv_res, page, page_rects[id(page)])
+
+        return [pages for _, pages in batches]
+
+    def recognize_regions(self, regions: Sequence[OcrRegion]) -> None:
+        """Fill the cells of the regions, largest regions first.
+
+        Sorting keeps regions of similar size together, so batched inference pads
+        little, and starts the longest recognitions first when running in parallel.
+        """
+        ordered = sorted(regions, key=lambda r: r.rect.area(), reverse=True)
+        if self.regions_per_call is None:
+            # Deal the regions round-robin, so the workers get similar loads
+            num_chunks = min(max(1, self.num_workers), len(ordered))
+            chunks = [ordered[i::num_chunks] for i in range(num_chunks)]
+        else:
+            size = self.regions_per_call
+            chunks = [ordered[i : i + size] for i in range(0, len(ordered), size)]
+
+        if self.num_workers <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                self._render_and_ocr(chunk)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.num_workers, len(chunks)),
+                thread_name_prefix="ocr",
+            ) as executor:
+                # list() re-raises the first error of the workers
+                list(executor.map(self._render_and_ocr, chunks))
+
+    def _render_and_ocr(self, regions: List[OcrRegion]) -> None:
+        for region in regions:
+            assert region.page._backend is not None
+            region.image = region.page._backend.get_page_image(
+                scale=self.scale, cropbox=region.rect
+            )
+        try:
+            if self._cache is None:
+                self._ocr_regions(regions)
+            else:
+                self._ocr_regions_cached(regions, self._cache)
+        finally:
+            for region in regions:
+                region.image = None
+
+    def _cache_engine_key(self) -> str:
+        # The key covers everything the result depends on besides the pixels
+        options = self.options.model_dump_json(exclude=self.options.cache_key_exclude)
+        return f"{type(self).__name__}:{self.scale}:{options}"
+
+    def _ocr_regions_cached(self, regions: List[OcrRegion], cache: OcrCache) -> None:
+        engine = self._cache_engine_key()
+        keys = {}
+        misses = []
+        for region in regions:
+            assert region.image is not None
+            keys[id(region)] = OcrCache.make_key(region.image, engine)
+            cells = cache.get(keys[id(region)])
+            if cells is None:
+                misses.append(region)
+            else:
+                region.cells = shift_cells(cells, region.rect.l, region.rect.t)
+
+        if not misses:
+            return
+        self._ocr_regions(misses)
+        for region in misses:
+            if region.failed:
+                continue
+            # Cells are kept relative to the region, which may sit anywhere on a page
+            if all(c.rect.coord_origin == CoordOrigin.TOPLEFT for c in region.cells):
+                cells = shift_cells(region.cells, -region.rect.l, -region.rect.t)
+                cache.put(keys[id(region)], cells)
+
+    def _ocr_regions(self, regions: List[OcrRegion]) -> None:
+        """Recognize the rendered `image` of each region and set its `cells`.
+
+        Models implement this, or override `__call__` with their own page loop.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def _implements_ocr(cls) -> bool:
+        return (
+            cls._ocr_regions is not BaseOcrModel._ocr_regions
+            or cls.__call__ is not BaseOcrModel.__call__
+        )
 
     @classmethod
     @abstractmethod
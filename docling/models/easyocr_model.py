@@ -1,7 +1,6 @@
 import logging
 import warnings
 import zipfile
-from collections.abc import Iterable
 from pathlib import Path
 from typing import List, Optional, Type
 
@@ -10,16 +9,14 @@ from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import BoundingRectangle, TextCell
 
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-from docling.datamodel.base_models import Page
-from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
     EasyOcrOptions,
     OcrOptions,
 )
 from docling.datamodel.settings import settings
-from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.base_ocr_model import BaseOcrModel, OcrRegion
 from docling.utils.accelerator_utils import decide_device
-from docling.utils.profiling import TimeRecorder
+from docling.utils.engine_pool import EnginePool
 from docling.utils.utils import download_url_with_progress
 
 _log = logging.getLogger(__name__)
@@ -27,6 +24,7 @@ _log = logging.getLogger(__name__)
 
 class EasyOcrModel(BaseOcrModel):
     _model_repo_folder = "EasyOcr"
+    regions_per_call = None  # same-size crops are batched in _ocr_regions
 
     def __init__(
         self,
@@ -78,17 +76,25 @@ class EasyOcrModel(BaseOcrModel):
                 download_enabled = False
                 model_storage_directory = str(artifacts_path / self._model_repo_folder)
 
-            with warnings.catch_warnings():
-                if self.options.suppress_mps_warnings:
-                    warnings.filterwarnings("ignore", message=".*pin_memory.*MPS.*")
-                self.reader = easyocr.Reader(
-                    lang_list=self.options.lang,
-                    gpu=use_gpu,
-                    model_storage_directory=model_storage_directory,
-                    recog_network=self.options.recog_network,
-                    download_enabled=download_enabled,
-                    verbose=False,
-                )
+            def create_reader() -> "easyocr.Reader":
+                with warnings.catch_warnings():
+                    if self.options.suppress_mps_warnings:
+                        warnings.filterwarnings("ignore", message=".*pin_memory.*MPS.*")
+                    return easyocr.Reader(
+                        lang_list=self.options.lang,
+                        gpu=use_gpu,
+                        model_storage_directory=model_storage_directory,
+                        recog_network=self.options.recog_network,
+                        download_enabled=download_enabled,
+                        verbose=False,
+                    )
+
+            # One reader per worker thread, as readers are not thread-safe
+            self.num_workers = self.options.num_workers
+            self._readers = EnginePool(create_reader, self.options.num_workers)
+            # Create the first reader now, so that errors show up at init
+            with self._readers.checkout() as reader:
+                self.reader = reader
 
     @staticmethod
     def download_models(
@@ -126,74 +132,55 @@ class EasyOcrModel(BaseOcrModel):
 
         return local_dir
 
-    def __call__(
-        self, conv_res: ConversionResult, page_batch: Iterable[Page]
-    ) -> Iterable[Page]:
-        if not self.enabled:
-            yield from page_batch
-            return
-
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
+    def _ocr_regions(self, regions: List[OcrRegion]) -> None:
+        # Crops of the same size go through EasyOCR as one batched inference
+        groups: dict[tuple[int, int], List[OcrRegion]] = {}
+        for region in regions:
+            assert region.image is not None
+            groups.setdefault(region.image.size, []).append(region)
+
+        with self._readers.checkout() as reader:
+            for group in groups.values():
+                self._ocr_group(reader, group)
+
+    def _ocr_group(self, reader, group: List[OcrRegion]) -> None:
+        images = [numpy.array(region.image) for region in group]
+
+        with warnings.catch_warnings():
+            if self.options.suppress_mps_warnings:
+                warnings.filterwarnings("ignore", message=".*pin_memory.*MPS.*")
+
+            if len(images) == 1:
+                results = [reader.readtext(images[0])]
             else:
-                with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
+                results = reader.readtext_batched(images)
+
+        del images
+
+        for region, result in zip(group, results):
+            ocr_rect = region.rect
+            region.cells = [
+                TextCell(
+                    index=ix,
+                    text=line[1],
+                    orig=line[1],
+                    from_ocr=True,
+                    confidence=line[2],
+                    rect=BoundingRectangle.from_bounding_box(
+                        BoundingBox.from_tuple(
+                            coord=(
+                                (line[0][0][0] / self.scale) + ocr_rect.l,
+                                (line[0][0][1] / self.scale) + ocr_rect.t,
+                                (line[0][2][0] / self.scale) + ocr_rect.l,
+                                (line[0][2][1] / self.scale) + ocr_rect.t,
+                            ),
+                            origin=CoordOrigin.TOPLEFT,
                         )
-                        im = numpy.array(high_res_image)
-
-                        with warnings.catch_warnings():
-                            if self.options.suppress_mps_warnings:
-                                warnings.filterwarnings(
-                                    "ignore", message=".*pin_memory.*MPS.*"
-                                )
-
-                            result = self.reader.readtext(im)
-
-                        del high_res_image
-                        del im
-
-                        cells = [
-                            TextCell(
-                                index=ix,
-                                text=line[1],
-                                orig=line[1],
-                                from_ocr=True,
-                                confidence=line[2],
-                                rect=BoundingRectangle.from_bounding_box(
-                                    BoundingBox.from_tuple(
-                                        coord=(
-                                            (line[0][0][0] / self.scale) + ocr_rect.l,
-                                            (line[0][0][1] / self.scale) + ocr_rect.t,
-                                            (line[0][2][0] / self.scale) + ocr_rect.l,
-                                            (line[0][2][1] / self.scale) + ocr_rect.t,
-                                        ),
-                                        origin=CoordOrigin.TOPLEFT,
-                                    )
-                                ),
-                            )
-                            for ix, line in enumerate(result)
-                            if line[2] >= self.options.confidence_threshold
-                        ]
-                        all_ocr_cells.extend(cells)
-
-                    # Post-process the cells
-                    self.post_process_cells(all_ocr_cells, page)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+                    ),
+                )
+                for ix, line in enumerate(result)
+                if line[2] >= self.options.confidence_threshold
+            ]
 
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
@@ -2,6 +2,7 @@ import copy
 import logging
 import warnings
 from collections.abc import Sequence
+from contextlib import ExitStack
 from pathlib import Path
 from typing import List, Optional, Union
 
@@ -154,96 +155,113 @@ class LayoutModel(BaseLayoutModel):
         conv_res: ConversionResult,
         pages: Sequence[Page],
     ) -> Sequence[LayoutPrediction]:
-        # Convert to list to ensure predictable iteration
-        pages = list(pages)
+        return self.predict_layout_documents([(conv_res, pages)])[0]
 
-        # Separate valid and invalid pages
-        valid_pages = []
+    def predict_layout_documents(
+        self,
+        batches: Sequence[tuple[ConversionResult, Sequence[Page]]],
+    ) -> list[Sequence[LayoutPrediction]]:
+        # Convert to lists to ensure predictable iteration
+        batches = [(conv_res, list(pages)) for conv_res, pages in batches]
+
+        # Collect valid pages of all documents, so they share one batched inference
         valid_page_images: List[Union[Image.Image, np.ndarray]] = []
 
-        for page in pages:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                continue
+        for _, pages in batches:
+            for page in pages:
+                assert page._backend is not None
+                if not page._backend.is_valid():
+                    continue
 
-            assert page.size is not None
-            page_image = page.get_image(scale=1.0)
-            assert page_image is not None
+                assert page.size is not None
+                page_image = page.get_image(scale=1.0)
+                assert page_image is not None
 
-            valid_pages.append(page)
-            valid_page_images.append(page_image)
+                valid_page_images.append(page_image)
 
         # Process all valid pages with batch prediction
         batch_predictions = []
         if valid_page_images:
-            with TimeRecorder(conv_res, "layout"):
+            with ExitStack() as stack:
+                for conv_res, _ in batches:
+                    stack.enter_context(TimeRecorder(conv_res, "layout"))
                 batch_predictions = self.layout_predictor.predict_batch(  # type: ignore[attr-defined]
                     valid_page_images
                 )
 
         # Process each page with its predictions
-        layout_predictions: list[LayoutPrediction] = []
+        all_layout_predictions: list[Sequence[LayoutPrediction]] = []
         valid_page_idx = 0
-        for page in pages:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                existing_prediction = page.predictions.layout or LayoutPrediction()
-                page.predictions.layout = existing_prediction
-                layout_predictions.append(existing_prediction)
-                continue
-
-            page_predictions = batch_predictions[valid_page_idx]
-            valid_page_idx += 1
-
-            clusters = []
-            for ix, pred_item in enumerate(page_predictions):
-                label = DocItemLabel(
-                    pred_item["label"].lower().replace(" ", "_").replace("-", "_")
-                )  # Temporary, until docling-ibm-model uses docling-core types
-                cluster = Cluster(
-                    id=ix,
-                    label=label,
-                    confidence=pred_item["confidence"],
-                    bbox=BoundingBox.model_validate(pred_item),
-                    cells=[],
-                )
-                clusters.append(cluster)
-
-            if settings.debug.visualize_raw_layout:
-                self.draw_clusters_and_cells_side_by_side(
-                    conv_res, page, clusters, mode_prefix="raw"
+        for conv_res, pages in batches:
+            layout_predictions: list[LayoutPrediction] = []
+            for page in pages:
+                assert page._backend is not None
+                if not page._backend.is_valid():
+                    existing_prediction = page.predictions.layout or LayoutPrediction()
+                    page.predictions.layout = existing_prediction
+                    layout_predictions.append(existing_prediction)
+                    continue
+
+                page_predictions = batch_predictions[valid_page_idx]
+                valid_page_idx += 1
+
+                layout_predictions.append(
+                    self._postprocess_page_prediction(conv_res, page, page_predictions)
                 )
+            all_layout_predictions.append(layout_predictions)
+
+        return all_layout_predictions
+
+    def _postprocess_page_prediction(
+        self, conv_res: ConversionResult, page: Page, page_predictions: list[dict]
+    ) -> LayoutPrediction:
+        clusters = []
+        for ix, pred_item in enumerate(page_predictions):
+            label = DocItemLabel(
+                pred_item["label"].lower().replace(" ", "_").replace("-", "_")
+            )  # Temporary, until docling-ibm-model uses docling-core types
+            cluster = Cluster(
+                id=ix,
+                label=label,
+                confidence=pred_item["confidence"],
+                bbox=BoundingBox.model_validate(pred_item),
+                cells=[],
+            )
+            clusters.append(cluster)
 
-            # Apply postprocessing
-            processed_clusters, processed_cells = LayoutPostprocessor(
-                page, clusters, self.options
-            ).postprocess()
-            # Note: LayoutPostprocessor updates page.cells and page.parsed_page internally
-
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore",
-                    "Mean of empty slice|invalid value encountered in scalar divide",
-                    RuntimeWarning,
-                    "numpy",
-                )
+        if settings.debug.visualize_raw_layout:
+            self.draw_clusters_and_cells_side_by_side(
+                conv_res, page, clusters, mode_prefix="raw"
+            )
 
-                conv_res.confidence.pages[page.page_no].layout_score = float(
-                    np.mean([c.confidence for c in processed_clusters])
-                )
+        # Apply postprocessing
+        processed_clusters, processed_cells = LayoutPostprocessor(
+            page, clusters, self.options
+        ).postprocess()
+        # Note: LayoutPostprocessor updates page.cells and page.parsed_page internally
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                "Mean of empty slice|invalid value encountered in scalar divide",
+                RuntimeWarning,
+                "numpy",
+            )
 
-                conv_res.confidence.pages[page.page_no].ocr_score = float(
-                    np.mean([c.confidence for c in processed_cells if c.from_ocr])
-                )
+            conv_res.confidence.pages[page.page_no].layout_score = float(
+                np.mean([c.confidence for c in processed_clusters])
+            )
 
-            prediction = LayoutPrediction(clusters=processed_clusters)
-            page.predictions.layout = prediction
+            conv_res.confidence.pages[page.page_no].ocr_score = float(
+                np.mean([c.confidence for c in processed_cells if c.from_ocr])
+            )
 
-            if settings.debug.visualize_layout:
-                self.draw_clusters_and_cells_side_by_side(
-                    conv_res, page, processed_clusters, mode_prefix="postprocessed"
-                )
+        prediction = LayoutPrediction(clusters=processed_clusters)
+        page.predictions.layout = prediction
 
-            layout_predictions.append(prediction)
+        if settings.debug.visualize_layout:
+            self.draw_clusters_and_cells_side_by_side(
+                conv_res, page, processed_clusters, mode_prefix="postprocessed"
+            )
 
-        return layout_predictions
+        return prediction
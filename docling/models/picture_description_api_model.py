@@ -1,5 +1,4 @@
 from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Type, Union
 
@@ -12,7 +11,7 @@ from docling.datamodel.pipeline_options import (
 )
 from docling.exceptions import OperationNotAllowed
 from docling.models.picture_description_base_model import PictureDescriptionBaseModel
-from docling.utils.api_image_request import api_image_request
+from docling.utils.api_image_request import api_image_request, map_requests
 
 
 class PictureDescriptionApiModel(PictureDescriptionBaseModel):
@@ -57,10 +56,10 @@ class PictureDescriptionApiModel(PictureDescriptionBaseModel):
                 url=self.options.url,
                 timeout=self.options.timeout,
                 headers=self.options.headers,
+                encoding=self.options.image_encoding,
                 **self.options.params,
             )
 
             return page_tags
 
-        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-            yield from executor.map(_api_request, images)
+        yield from map_requests(_api_request, images, self.concurrency)
@@ -1,23 +1,20 @@
 import logging
-from collections.abc import Iterable
 from pathlib import Path
-from typing import Literal, Optional, Type, TypedDict
+from typing import List, Literal, Optional, Type, TypedDict
 
 import numpy
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import BoundingRectangle, TextCell
 
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-from docling.datamodel.base_models import Page
-from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
     OcrOptions,
     RapidOcrOptions,
 )
 from docling.datamodel.settings import settings
-from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.base_ocr_model import BaseOcrModel, OcrRegion
 from docling.utils.accelerator_utils import decide_device
-from docling.utils.profiling import TimeRecorder
+from docling.utils.engine_pool import EnginePool
 from docling.utils.utils import download_url_with_progress
 
 _log = logging.getLogger(__name__)
@@ -202,9 +199,14 @@ class RapidOcrModel(BaseOcrModel):
                 _log.debug("Overwriting RapidOCR params with user-provided values.")
                 params.update(user_params)
 
-            self.reader = RapidOCR(
-                params=params,
+            # One engine per worker thread, as engines are not thread-safe
+            self.num_workers = self.options.num_workers
+            self._readers = EnginePool(
+                lambda: RapidOCR(params=params), self.options.num_workers
             )
+            # Create the first engine now, so that errors show up at init
+            with self._readers.checkout() as reader:
+                self.reader = reader
 
     @staticmethod
     def download_models(
@@ -230,82 +232,49 @@ class RapidOcrModel(BaseOcrModel):
 
         return local_dir
 
-    def __call__(
-        self, conv_res: ConversionResult, page_batch: Iterable[Page]
-    ) -> Iterable[Page]:
-        if not self.enabled:
-            yield from page_batch
-            return
+    def _ocr_regions(self, regions: List[OcrRegion]) -> None:
+        with self._readers.checkout() as reader:
+            self._ocr_regions_with(reader, regions)
 
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        im = numpy.array(high_res_image)
-                        result = self.reader(
-                            im,
-                            use_det=self.options.use_det,
-                            use_cls=self.options.use_cls,
-                            use_rec=self.options.use_rec,
-                        )
-                        if result is None or result.boxes is None:
-                            _log.warning("RapidOCR returned empty result!")
-                            continue
-                        result = list(
-                            zip(result.boxes.tolist(), result.txts, result.scores)
-                        )
-
-                        del high_res_image
-                        del im
-
-                        if result is not None:
-                            cells = [
-                                TextCell(
-                                    index=ix,
-                                    text=line[1],
-                                    orig=line[1],
-                                    confidence=line[2],
-                                    from_ocr=True,
-                                    rect=BoundingRectangle.from_bounding_box(
-                                        BoundingBox.from_tuple(
-                                            coord=(
-                                                (line[0][0][0] / self.scale)
-                                                + ocr_rect.l,
-                                                (line[0][0][1] / self.scale)
-                                                + ocr_rect.t,
-                                                (line[0][2][0] / self.scale)
-                                                + ocr_rect.l,
-                                                (line[0][2][1] / self.scale)
-                                                + ocr_rect.t,
-                                            ),
-                                            origin=CoordOrigin.TOPLEFT,
-                                        )
-                                    ),
-                                )
-                                for ix, line in enumerate(result)
-                            ]
-                            all_ocr_cells.extend(cells)
-
-                    # Post-process the cells
-                    self.post_process_cells(all_ocr_cells, page)
+    def _ocr_regions_with(self, reader, regions: List[OcrRegion]) -> None:
+        for region in regions:
+            ocr_rect = region.rect
+            im = numpy.array(region.image)
+            result = reader(
+                im,
+                use_det=self.options.use_det,
+                use_cls=self.options.use_cls,
+                use_rec=self.options.use_rec,
+            )
+            del im
 
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
+            if result is None or result.boxes is None:
+                _log.warning("RapidOCR returned empty result!")
+                region.failed = True
+                continue
+            lines = list(zip(result.boxes.tolist(), result.txts, result.scores))
 
-                yield page
+            region.cells = [
+                TextCell(
+                    index=ix,
+                    text=line[1],
+                    orig=line[1],
+                    confidence=line[2],
+                    from_ocr=True,
+                    rect=BoundingRectangle.from_bounding_box(
+                        BoundingBox.from_tuple(
+                            coord=(
+                                (line[0][0][0] / self.scale) + ocr_rect.l,
+                                (line[0][0][1] / self.scale) + ocr_rect.t,
+                                (line[0][2][0] / self.scale) + ocr_rect.l,
+                                (line[0][2][1] / self.scale) + ocr_rect.t,
+                            ),
+                            origin=CoordOrigin.TOPLEFT,
+                        )
+                    ),
+                )
+                for ix, line in enumerate(lines)
+            ]
 
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
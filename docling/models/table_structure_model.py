@@ -1,19 +1,19 @@
-import copy
 import warnings
 from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Optional
 
 import numpy
-from docling_core.types.doc import BoundingBox, DocItemLabel, TableCell
-from docling_core.types.doc.page import (
-    BoundingRectangle,
-    TextCellUnit,
-)
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, TableCell
 from PIL import ImageDraw
 
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-from docling.datamodel.base_models import Page, Table, TableStructurePrediction
+from docling.datamodel.base_models import (
+    Cluster,
+    Page,
+    Table,
+    TableStructurePrediction,
+)
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
     TableFormerMode,
@@ -23,6 +23,7 @@ from docling.datamodel.settings import settings
 from docling.models.base_table_model import BaseTableStructureModel
 from docling.models.utils.hf_model_download import download_hf_model
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.cell_index import TextCellIndex
 from docling.utils.profiling import TimeRecorder
 
 
@@ -171,6 +172,79 @@ class TableStructureModel(BaseTableStructureModel):
             out_file = out_path / f"table_struct_page_{page.page_no:05}.png"
             image.save(str(out_file), format="png")
 
+    def _get_table_tokens(
+        self, table_cluster: Cluster, word_index: Optional[TextCellIndex]
+    ) -> list[dict]:
+        # Check if word-level cells are available from backend:
+        if word_index is not None:
+            idxs = word_index.cells_in_bbox(table_cluster.bbox, ios=0.8)
+            if len(idxs) > 0:
+                boxes = (word_index.boxes[idxs] * self.scale).tolist()
+                return [
+                    {
+                        "id": cell.index,
+                        "text": cell.text,
+                        "bbox": {
+                            "l": left,
+                            "t": top,
+                            "r": right,
+                            "b": bottom,
+                            "coord_origin": CoordOrigin.TOPLEFT,
+                        },
+                    }
+                    for cell, (left, top, right, bottom) in zip(
+                        (word_index.cells[i] for i in idxs), boxes
+                    )
+                    # Only allow non empty strings (spaces) into the cells of a table
+                    if len(cell.text.strip()) > 0
+                ]
+            # In case word-level cells yield empty, fall through
+
+        # Otherwise - we use normal (line/phrase) cells
+        return [
+            {
+                "id": c.index,
+                "text": c.text,
+                "bbox": c.rect.to_bounding_box().scaled(scale=self.scale).model_dump(),
+            }
+            for c in table_cluster.cells
+            if len(c.text.strip()) > 0
+        ]
+
+    def _to_table(self, page: Page, table_cluster: Cluster, table_out: dict) -> Table:
+        assert page._backend is not None
+        table_cells = []
+        for element in table_out["tf_responses"]:
+            if not self.do_cell_matching:
+                the_bbox = BoundingBox.model_validate(element["bbox"]).scaled(
+                    1 / self.scale
+                )
+                text_piece = page._backend.get_text_in_rect(the_bbox)
+                element["bbox"]["token"] = text_piece
+
+            tc = TableCell.model_validate(element)
+            if tc.bbox is not None:
+                tc.bbox = tc.bbox.scaled(1 / self.scale)
+            table_cells.append(tc)
+
+        assert "predict_details" in table_out
+
+        # Retrieving cols/rows, after post processing:
+        num_rows = table_out["predict_details"].get("num_rows", 0)
+        num_cols = table_out["predict_details"].get("num_cols", 0)
+        otsl_seq = table_out["predict_details"].get("prediction", {}).get("rs_seq", [])
+
+        return Table(
+            otsl_seq=otsl_seq,
+            table_cells=table_cells,
+            num_rows=num_rows,
+            num_cols=num_cols,
+            id=table_cluster.id,
+            page_no=page.page_no,
+            cluster=table_cluster,
+            label=table_cluster.label,
+        )
+
     def predict_tables(
         self,
         conv_res: ConversionResult,
@@ -196,21 +270,13 @@ class TableStructureModel(BaseTableStructureModel):
                 table_prediction = TableStructurePrediction()
                 page.predictions.tablestructure = table_prediction
 
-                in_tables = [
-                    (
-                        cluster,
-                        [
-                            round(cluster.bbox.l) * self.scale,
-                            round(cluster.bbox.t) * self.scale,
-                            round(cluster.bbox.r) * self.scale,
-                            round(cluster.bbox.b) * self.scale,
-                        ],
-                    )
+                table_clusters = [
+                    cluster
                     for cluster in page.predictions.layout.clusters
                     if cluster.label
                     in [DocItemLabel.TABLE, DocItemLabel.DOCUMENT_INDEX]
                 ]
-                if not in_tables:
+                if not table_clusters:
                     predictions.append(table_prediction)
                     continue
 
@@ -220,79 +286,49 @@ class TableStructureModel(BaseTableStructureModel):
                     "image": numpy.asarray(page.get_image(scale=self.scale)),
                 }
 
-                for table_cluster, tbl_box in in_tables:
-                    # Check if word-level cells are available from backend:
-                    sp = page._backend.get_segmented_page()
-                    if sp is not None:
-                        tcells = sp.get_cells_in_bbox(
-                            cell_unit=TextCellUnit.WORD,
-                            bbox=table_cluster.bbox,
-                        )
-                        if len(tcells) == 0:
-                            # In case word-level cells yield empty
-                            tcells = table_cluster.cells
+                # The predictor matches every table of a call against the same
+                # page tokens, and the matching depends on all of them (orphan cells,
+                # size limits). Tables are therefore grouped by their tokens, so
+                # that tables with the same tokens share one predictor call, which
+                # resizes the page image once for all of them.
+                sp = page._backend.get_segmented_page()
+                word_index = (
+                    TextCellIndex(sp.word_cells, page_height=sp.dimension.height)
+                    if sp is not None
+                    else None
+                )
+                groups: list[tuple[list[dict], list[int]]] = []
+                for idx, table_cluster in enumerate(table_clusters):
+                    tokens = self._get_table_tokens(table_cluster, word_index)
+                    for group_tokens, group_idxs in groups:
+                        if group_tokens == tokens:
+                            group_idxs.append(idx)
+                            break
                     else:
-                        # Otherwise - we use normal (line/phrase) cells
-                        tcells = table_cluster.cells
-                    tokens = []
-                    for c in tcells:
-                        # Only allow non empty strings (spaces) into the cells of a table
-                        if len(c.text.strip()) > 0:
-                            new_cell = copy.deepcopy(c)
-                            new_cell.rect = BoundingRectangle.from_bounding_box(
-                                new_cell.rect.to_bounding_box().scaled(scale=self.scale)
-                            )
-                            tokens.append(
-                                {
-                                    "id": new_cell.index,
-                                    "text": new_cell.text,
-                                    "bbox": new_cell.rect.to_bounding_box().model_dump(),
-                                }
-                            )
-                    page_input["tokens"] = tokens
+                        groups.append((tokens, [idx]))
 
+                table_outs: dict[int, dict] = {}
+                for tokens, idxs in groups:
+                    page_input["tokens"] = tokens
+                    tbl_boxes = [
+                        [
+                            round(table_clusters[idx].bbox.l) * self.scale,
+                            round(table_clusters[idx].bbox.t) * self.scale,
+                            round(table_clusters[idx].bbox.r) * self.scale,
+                            round(table_clusters[idx].bbox.b) * self.scale,
+                        ]
+                        for idx in idxs
+                    ]
                     tf_output = self.tf_predictor.multi_table_predict(
-                        page_input, [tbl_box], do_matching=self.do_cell_matching
-                    )
-                    table_out = tf_output[0]
-                    table_cells = []
-                    for element in table_out["tf_responses"]:
-                        if not self.do_cell_matching:
-                            the_bbox = BoundingBox.model_validate(
-                                element["bbox"]
-                            ).scaled(1 / self.scale)
-                            text_piece = page._backend.get_text_in_rect(the_bbox)
-                            element["bbox"]["token"] = text_piece
-
-                        tc = TableCell.model_validate(element)
-                        if tc.bbox is not None:
-                            tc.bbox = tc.bbox.scaled(1 / self.scale)
-                        table_cells.append(tc)
-
-                    assert "predict_details" in table_out
-
-                    # Retrieving cols/rows, after post processing:
-                    num_rows = table_out["predict_details"].get("num_rows", 0)
-                    num_cols = table_out["predict_details"].get("num_cols", 0)
-                    otsl_seq = (
-                        table_out["predict_details"]
-                        .get("prediction", {})
-                        .get("rs_seq", [])
+                        page_input, tbl_boxes, do_matching=self.do_cell_matching
                     )
+                    table_outs.update(zip(idxs, tf_output))
 
-                    tbl = Table(
-                        otsl_seq=otsl_seq,
-                        table_cells=table_cells,
-                        num_rows=num_rows,
-                        num_cols=num_cols,
-                        id=table_cluster.id,
-                        page_no=page.page_no,
-                        cluster=table_cluster,
-                        label=table_cluster.label,
+                for idx, table_cluster in enumerate(table_clusters):
+                    table_prediction.table_map[table_cluster.id] = self._to_table(
+                        page, table_cluster, table_outs[idx]
                     )
 
-                    table_prediction.table_map[table_cluster.id] = tbl
-
                 if settings.debug.visualize_tables:
                     self.draw_table_and_cells(
                         conv_res,
@@ -4,35 +4,33 @@ import logging
 import os
 import subprocess
 import tempfile
-from collections.abc import Iterable
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen
-from typing import List, Optional, Tuple, Type
+from typing import Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
-import pandas as pd
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import TextCell
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
-from docling.datamodel.base_models import Page
-from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
     OcrOptions,
     TesseractCliOcrOptions,
 )
-from docling.datamodel.settings import settings
-from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.base_ocr_model import BaseOcrModel, OcrRegion
 from docling.utils.ocr_utils import (
     map_tesseract_script,
     parse_tesseract_orientation,
     tesseract_box_to_bounding_rectangle,
 )
-from docling.utils.profiling import TimeRecorder
 
 _log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class TesseractOcrCliModel(BaseOcrModel):
+    regions_per_call = None  # one image list per worker
+
     def __init__(
         self,
         enabled: bool,
@@ -55,6 +53,7 @@ class TesseractOcrCliModel(BaseOcrModel):
         self._tesseract_languages: Optional[List[str]] = None
         self._script_prefix: Optional[str] = None
         self._is_auto: bool = "auto" in self.options.lang
+        self.num_workers = self.options.num_processes
 
         if self.enabled:
             try:
@@ -99,77 +98,97 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         return name, version
 
-    def _run_tesseract(self, ifilename: str, osd: Optional[pd.DataFrame]):
+    def _run_image_list(
+        self,
+        make_cmd: Callable[[str], List[str]],
+        image_files: List[str],
+        parse_output: Callable[[str], Dict[int, _T]],
+    ) -> List[Optional[_T]]:
         r"""
-        Run tesseract CLI
+        Run tesseract once on a list of images, the result is None for failed images
         """
-        cmd = [self.options.tesseract_cmd]
-        if self._is_auto and osd is not None:
-            lang = self._parse_language(osd)
+        results: List[Optional[_T]] = [None] * len(image_files)
+        start = 0
+        while start < len(image_files):
+            remaining = image_files[start:]
+            list_file = f"{remaining[0]}.list.txt"
+            with open(list_file, "w", encoding="utf-8") as fw:
+                fw.write("\n".join(remaining) + "\n")
+
+            cmd = make_cmd(list_file)
+            _log.info("command: {}".format(" ".join(cmd)))
+            output = subprocess.run(cmd, capture_output=True)
+            parsed = parse_output(output.stdout.decode("utf-8"))
+
+            done = 0
+            while done in parsed:
+                results[start + done] = parsed[done]
+                done += 1
+            if done == len(remaining):
+                break
+
+            # Tesseract stops at the first image it fails on, carry on after it
+            _log.debug(
+                "tesseract failed on %s:\n %s",
+                remaining[done],
+                output.stderr.decode("utf-8", errors="replace"),
+            )
+            start += done + 1
+
+        return results
+
+    def _run_tesseract(
+        self, image_files: List[str], lang: Optional[str]
+    ) -> List[Optional[List[Dict[str, str]]]]:
+        r"""
+        Run tesseract CLI, returns the TSV rows with text of each image
+        """
+
+        def make_cmd(list_file: str) -> List[str]:
+            cmd = [self.options.tesseract_cmd]
             if lang is not None:
                 cmd.append("-l")
                 cmd.append(lang)
-        elif self.options.lang is not None and len(self.options.lang) > 0:
-            cmd.append("-l")
-            cmd.append("+".join(self.options.lang))
-
-        if self.options.path is not None:
-            cmd.append("--tessdata-dir")
-            cmd.append(self.options.path)
-
-        # Add PSM option if specified in the configuration
-        if self.options.psm is not None:
-            cmd.extend(["--psm", str(self.options.psm)])
-
-        cmd += [ifilename, "stdout", "tsv"]
-        _log.info("command: {}".format(" ".join(cmd)))
-
-        output = subprocess.run(cmd, stdout=PIPE, stderr=DEVNULL, check=True)
 
-        # _log.info(output)
+            if self.options.path is not None:
+                cmd.append("--tessdata-dir")
+                cmd.append(self.options.path)
 
-        # Decode the byte string to a regular string
-        decoded_data = output.stdout.decode("utf-8")
-        # _log.info(decoded_data)
-
-        # Read the TSV file generated by Tesseract
-        df_result = pd.read_csv(
-            io.StringIO(decoded_data), quoting=csv.QUOTE_NONE, sep="\t"
-        )
-
-        # Display the dataframe (optional)
-        # _log.info("df: ", df.head())
+            # Add PSM option if specified in the configuration
+            if self.options.psm is not None:
+                cmd.extend(["--psm", str(self.options.psm)])
 
-        # Filter rows that contain actual text (ignore header or empty rows)
-        df_filtered = df_result[
-            df_result["text"].notna() & (df_result["text"].apply(str).str.strip() != "")
-        ]
+            cmd += [list_file, "stdout", "tsv"]
+            return cmd
 
-        return df_filtered
+        return self._run_image_list(make_cmd, image_files, _parse_tsv)
 
-    def _perform_osd(self, ifilename: str) -> pd.DataFrame:
+    def _perform_osd(self, image_files: List[str]) -> List[Optional[Dict[str, str]]]:
         r"""
-        Run tesseract in PSM 0 mode to detect the language
+        Run tesseract in PSM 0 mode to detect the orientation and script
         """
 
-        cmd = [self.options.tesseract_cmd]
-        cmd.extend(["--psm", "0", "-l", "osd", ifilename, "stdout"])
-        _log.info("command: {}".format(" ".join(cmd)))
-        output = subprocess.run(cmd, capture_output=True, check=True)
-        decoded_data = output.stdout.decode("utf-8")
-        df_detected = pd.read_csv(
-            io.StringIO(decoded_data), sep=":", header=None, names=["key", "value"]
-        )
-        return df_detected
+        def make_cmd(list_file: str) -> List[str]:
+            cmd = [self.options.tesseract_cmd]
+            cmd.extend(["--psm", "0", "-l", "osd", list_file, "stdout"])
+            return cmd
 
-    def _parse_language(self, df_osd: pd.DataFrame) -> Optional[str]:
+        return self._run_image_list(make_cmd, image_files, _parse_osd)
+
+    def _get_lang(self, osd: Optional[Dict[str, str]]) -> Optional[str]:
+        if self._is_auto and osd is not None:
+            return self._parse_language(osd)
+        elif self.options.lang is not None and len(self.options.lang) > 0:
+            return "+".join(self.options.lang)
+        return None
+
+    def _parse_language(self, osd: Dict[str, str]) -> Optional[str]:
         assert self._tesseract_languages is not None
-        scripts = df_osd.loc[df_osd["key"] == "Script"].value.tolist()
-        if len(scripts) == 0:
+        if "Script" not in osd:
             _log.warning("Tesseract cannot detect the script of the page")
             return None
 
-        script = map_tesseract_script(scripts[0].strip())
+        script = map_tesseract_script(osd["Script"])
         lang = f"{self._script_prefix}{script}"
 
         # Check if the detected language has been installed
@@ -194,8 +213,9 @@ class TesseractOcrCliModel(BaseOcrModel):
         _log.info("command: {}".format(" ".join(cmd)))
         output = subprocess.run(cmd, stdout=PIPE, stderr=DEVNULL, check=True)
         decoded_data = output.stdout.decode("utf-8")
-        df_list = pd.read_csv(io.StringIO(decoded_data), header=None)
-        self._tesseract_languages = df_list[0].tolist()[1:]
+        # The first line is a title, the languages follow one per line
+        lines = [line.strip() for line in decoded_data.splitlines()]
+        self._tesseract_languages = [line for line in lines[1:] if line]
 
         # Decide the script prefix
         if any(lang.startswith("script/") for lang in self._tesseract_languages):
@@ -205,127 +225,142 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         self._script_prefix = script_prefix
 
-    def __call__(
-        self, conv_res: ConversionResult, page_batch: Iterable[Page]
-    ) -> Iterable[Page]:
-        if not self.enabled:
-            yield from page_batch
-            return
-
-        for page_i, page in enumerate(page_batch):
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect_i, ocr_rect in enumerate(ocr_rects):
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
+    def _ocr_regions(self, regions: List[OcrRegion]) -> None:
+        # All regions go through one OSD and one OCR invocation per language
+        with tempfile.TemporaryDirectory(prefix="docling_tesseract_") as tmp_dir:
+            image_files = []
+            image_sizes = []
+            for ix, region in enumerate(regions):
+                assert region.image is not None
+                fname = os.path.join(tmp_dir, f"region_{ix:05}.png")
+                region.image.save(fname)
+                image_files.append(fname)
+                image_sizes.append(region.image.size)
+
+            orientations = [0] * len(regions)
+            lang_groups: Dict[Optional[str], List[int]] = {}
+            for ix, (region, osd) in enumerate(
+                zip(regions, self._perform_osd(image_files))
+            ):
+                if osd is None:
+                    _log.error(
+                        "OSD failed (doc %s, page: %s, OCR rectangle: %s)",
+                        region.conv_res.input.file,
+                        region.page.page_no,
+                        region.index,
+                    )
+                    # Skipping if OSD fail when in auto mode, otherwise proceed
+                    # to OCR in the hope OCR will succeed while OSD failed
+                    if self._is_auto:
+                        region.failed = True
+                        continue
+                else:
+                    orientations[ix] = _parse_orientation(osd)
+                    if orientations[ix] != 0:
+                        assert region.image is not None
+                        rotated = region.image.rotate(-orientations[ix], expand=True)
+                        rotated.save(image_files[ix])
+                        image_sizes[ix] = rotated.size
+                lang_groups.setdefault(self._get_lang(osd), []).append(ix)
+
+            for lang, indices in lang_groups.items():
+                results = self._run_tesseract([image_files[ix] for ix in indices], lang)
+                for ix, rows in zip(indices, results):
+                    region = regions[ix]
+                    if rows is None:
+                        _log.error(
+                            "tesseract OCR failed (doc %s, page: %s, "
+                            "OCR rectangle: %s)",
+                            region.conv_res.input.file,
+                            region.page.page_no,
+                            region.index,
                         )
-                        try:
-                            with tempfile.NamedTemporaryFile(
-                                suffix=".png", mode="w+b", delete=False
-                            ) as image_file:
-                                fname = image_file.name
-                                high_res_image.save(image_file)
-                            doc_orientation = 0
-                            df_osd: Optional[pd.DataFrame] = None
-                            try:
-                                df_osd = self._perform_osd(fname)
-                                doc_orientation = _parse_orientation(df_osd)
-                            except subprocess.CalledProcessError as exc:
-                                _log.error(
-                                    "OSD failed (doc %s, page: %s, "
-                                    "OCR rectangle: %s, processed image file %s):\n %s",
-                                    conv_res.input.file,
-                                    page_i,
-                                    ocr_rect_i,
-                                    image_file,
-                                    exc.stderr,
-                                )
-                                # Skipping if OSD fail when in auto mode, otherwise proceed
-                                # to OCR in the hope OCR will succeed while OSD failed
-                                if self._is_auto:
-                                    continue
-                            if doc_orientation != 0:
-                                high_res_image = high_res_image.rotate(
-                                    -doc_orientation, expand=True
-                                )
-                                high_res_image.save(fname)
-                            try:
-                                df_result = self._run_tesseract(fname, df_osd)
-                            except subprocess.CalledProcessError as exc:
-                                _log.error(
-                                    "tesseract OCR failed (doc %s, page: %s, "
-                                    "OCR rectangle: %s, processed image file %s):\n %s",
-                                    conv_res.input.file,
-                                    page_i,
-                                    ocr_rect_i,
-                                    image_file,
-                                    exc.stderr,
-                                )
-                                continue
-                        finally:
-                            if os.path.exists(fname):
-                                os.remove(fname)
-
-                        # _log.info(df_result)
-
-                        # Print relevant columns (bounding box and text)
-                        for ix, row in df_result.iterrows():
-                            text = row["text"]
-                            conf = row["conf"]
-
-                            left, top = float(row["left"]), float(row["top"])
-                            right = left + float(row["width"])
-                            bottom = top + row["height"]
-                            bbox = BoundingBox(
-                                l=left,
-                                t=top,
-                                r=right,
-                                b=bottom,
-                                coord_origin=CoordOrigin.TOPLEFT,
-                            )
-                            rect = tesseract_box_to_bounding_rectangle(
-                                bbox,
-                                original_offset=ocr_rect,
-                                scale=self.scale,
-                                orientation=doc_orientation,
-                                im_size=high_res_image.size,
-                            )
-                            cell = TextCell(
-                                index=ix,
-                                text=str(text),
-                                orig=str(text),
-                                from_ocr=True,
-                                confidence=conf / 100.0,
-                                rect=rect,
-                            )
-                            all_ocr_cells.append(cell)
-
-                    # Post-process the cells
-                    self.post_process_cells(all_ocr_cells, page)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+                        region.failed = True
+                        continue
+                    region.cells = self._to_cells(
+                        region, rows, orientations[ix], image_sizes[ix]
+                    )
+
+    def _to_cells(
+        self,
+        region: OcrRegion,
+        rows: List[Dict[str, str]],
+        orientation: int,
+        im_size: Tuple[int, int],
+    ) -> List[TextCell]:
+        cells = []
+        for ix, row in enumerate(rows):
+            text = row["text"]
+            conf = float(row["conf"])
+
+            left, top = float(row["left"]), float(row["top"])
+            right = left + float(row["width"])
+            bottom = top + float(row["height"])
+            bbox = BoundingBox(
+                l=left,
+                t=top,
+                r=right,
+                b=bottom,
+                coord_origin=CoordOrigin.TOPLEFT,
+            )
+            rect = tesseract_box_to_bounding_rectangle(
+                bbox,
+                original_offset=region.rect,
+                scale=self.scale,
+                orientation=orientation,
+                im_size=im_size,
+            )
+            cells.append(
+                TextCell(
+                    index=ix,
+                    text=text,
+                    orig=text,
+                    from_ocr=True,
+                    confidence=conf / 100.0,
+                    rect=rect,
+                )
+            )
+        return cells
 
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
         return TesseractCliOcrOptions
 
 
-def _parse_orientation(df_osd: pd.DataFrame) -> int:
-    # For strictly optimal performance with invariant dataframe format:
-    mask = df_osd["key"].to_numpy() == "Orientation in degrees"
-    orientation_val = df_osd["value"].to_numpy()[mask][0]
-    orientation = parse_tesseract_orientation(orientation_val.strip())
-    return orientation
+def _parse_orientation(osd: Dict[str, str]) -> int:
+    return parse_tesseract_orientation(osd["Orientation in degrees"])
+
+
+def _parse_osd(output: str) -> Dict[int, Dict[str, str]]:
+    """The OSD "key: value" lines of each image, by 0-based position in the list."""
+    pages: Dict[int, Dict[str, str]] = {}
+    page: Optional[Dict[str, str]] = None
+    for line in output.splitlines():
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key, value = key.strip(), value.strip()
+        if key == "Page number":
+            page = pages.setdefault(int(value), {})
+        elif page is not None:
+            page[key] = value
+    return pages
+
+
+def _parse_tsv(output: str) -> Dict[int, List[Dict[str, str]]]:
+    """The TSV rows with text of each image, by 0-based position in the list."""
+    reader = csv.reader(io.StringIO(output), delimiter="\t", quoting=csv.QUOTE_NONE)
+    header = next(reader, None)
+    if header is None:
+        return {}
+
+    pages: Dict[int, List[Dict[str, str]]] = {}
+    for values in reader:
+        if len(values) != len(header):
+            continue
+        row = dict(zip(header, values))
+        # Every image has a page level row, also when no text is found
+        rows = pages.setdefault(int(row["page_num"]) - 1, [])
+        if row["text"].strip() != "":
+            rows.append(row)
+    return pages
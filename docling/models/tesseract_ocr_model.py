@@ -1,31 +1,45 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional, Type
+from typing import TYPE_CHECKING, List, Optional, Type
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import TextCell
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
-from docling.datamodel.base_models import Page
-from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
     OcrOptions,
     TesseractOcrOptions,
 )
-from docling.datamodel.settings import settings
-from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.base_ocr_model import BaseOcrModel, OcrRegion
+from docling.utils.engine_pool import EnginePool
 from docling.utils.ocr_utils import (
     map_tesseract_script,
     parse_tesseract_orientation,
     tesseract_box_to_bounding_rectangle,
 )
-from docling.utils.profiling import TimeRecorder
+
+if TYPE_CHECKING:
+    import tesserocr
 
 _log = logging.getLogger(__name__)
 
 
+@dataclass
+class _TesseractReaders:
+    """A main reader, its OSD reader and the readers of the scripts it detected."""
+
+    reader: tesserocr.PyTessBaseAPI
+    osd_reader: tesserocr.PyTessBaseAPI
+    script_readers: dict[str, tesserocr.PyTessBaseAPI] = field(default_factory=dict)
+
+    def end(self) -> None:
+        for reader in [self.reader, self.osd_reader, *self.script_readers.values()]:
+            reader.End()
+
+
 class TesseractOcrModel(BaseOcrModel):
     def __init__(
         self,
@@ -43,8 +57,7 @@ class TesseractOcrModel(BaseOcrModel):
         self.options: TesseractOcrOptions
         self._is_auto: bool = "auto" in self.options.lang
         self.scale = 3  # multiplier for 72 dpi == 216 dpi.
-        self.reader = None
-        self.script_readers: dict[str, tesserocr.PyTessBaseAPI] = {}
+        self._readers: Optional[EnginePool[_TesseractReaders]] = None
 
         if self.enabled:
             install_errmsg = (
@@ -90,8 +103,6 @@ class TesseractOcrModel(BaseOcrModel):
                 "oem": tesserocr.OEM.DEFAULT,
             }
 
-            self.osd_reader = None
-
             if self.options.path is not None:
                 tesserocr_kwargs["path"] = self.options.path
 
@@ -99,163 +110,141 @@ class TesseractOcrModel(BaseOcrModel):
             main_psm = (
                 self.options.psm if self.options.psm is not None else tesserocr.PSM.AUTO
             )
-            if lang == "auto":
-                self.reader = tesserocr.PyTessBaseAPI(psm=main_psm, **tesserocr_kwargs)
-            else:
-                self.reader = tesserocr.PyTessBaseAPI(
-                    lang=lang,
-                    psm=main_psm,
-                    **tesserocr_kwargs,
+
+            def create_readers() -> _TesseractReaders:
+                if lang == "auto":
+                    reader = tesserocr.PyTessBaseAPI(psm=main_psm, **tesserocr_kwargs)
+                else:
+                    reader = tesserocr.PyTessBaseAPI(
+                        lang=lang,
+                        psm=main_psm,
+                        **tesserocr_kwargs,
+                    )
+                # OSD reader must use PSM.OSD_ONLY for orientation detection
+                osd_reader = tesserocr.PyTessBaseAPI(
+                    lang="osd", psm=tesserocr.PSM.OSD_ONLY, **tesserocr_kwargs
                 )
-            # OSD reader must use PSM.OSD_ONLY for orientation detection
-            self.osd_reader = tesserocr.PyTessBaseAPI(
-                lang="osd", psm=tesserocr.PSM.OSD_ONLY, **tesserocr_kwargs
-            )
+                return _TesseractReaders(reader=reader, osd_reader=osd_reader)
+
             self.reader_RIL = tesserocr.RIL
+            self.num_workers = self.options.num_readers
+            self._readers = EnginePool(
+                create_readers, self.options.num_readers, close=_TesseractReaders.end
+            )
+            # Create the first readers now, so that errors show up at init
+            with self._readers.checkout():
+                pass
 
     def __del__(self):
-        if self.reader is not None:
-            # Finalize the tesseractAPI
-            self.reader.End()
-        for script in self.script_readers:
-            self.script_readers[script].End()
-
-    def __call__(
-        self, conv_res: ConversionResult, page_batch: Iterable[Page]
-    ) -> Iterable[Page]:
-        if not self.enabled:
-            yield from page_batch
-            return
-
-        for page_i, page in enumerate(page_batch):
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
+        if self._readers is not None:
+            # Finalize the tesseractAPIs
+            self._readers.close()
+
+    def _ocr_regions(self, regions: List[OcrRegion]) -> None:
+        assert self._readers is not None
+        with self._readers.checkout() as readers:
+            self._ocr_regions_with(readers, regions)
+
+    def _ocr_regions_with(
+        self, readers: _TesseractReaders, regions: List[OcrRegion]
+    ) -> None:
+        assert self._tesserocr_languages is not None
+
+        for region in regions:
+            ocr_rect = region.rect
+            high_res_image = region.image
+            assert high_res_image is not None
+
+            local_reader = readers.reader
+            readers.osd_reader.SetImage(high_res_image)
+
+            doc_orientation = 0
+            osd = readers.osd_reader.DetectOrientationScript()
+
+            # No text, or Orientation and Script detection failure
+            if osd is None:
+                _log.error(
+                    "OSD failed for doc (doc %s, page: %s, OCR rectangle: %s)",
+                    region.conv_res.input.file,
+                    region.page.page_no,
+                    region.index,
+                )
+                # Skipping if OSD fail when in auto mode, otherwise proceed
+                # to OCR in the hope OCR will succeed while OSD failed
+                if self._is_auto:
+                    region.failed = True
+                    continue
             else:
-                with TimeRecorder(conv_res, "ocr"):
-                    assert self.reader is not None
-                    assert self.osd_reader is not None
-                    assert self._tesserocr_languages is not None
-
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect_i, ocr_rect in enumerate(ocr_rects):
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-
-                        local_reader = self.reader
-                        self.osd_reader.SetImage(high_res_image)
-
-                        doc_orientation = 0
-                        osd = self.osd_reader.DetectOrientationScript()
-
-                        # No text, or Orientation and Script detection failure
-                        if osd is None:
-                            _log.error(
-                                "OSD failed for doc (doc %s, page: %s, "
-                                "OCR rectangle: %s)",
-                                conv_res.input.file,
-                                page_i,
-                                ocr_rect_i,
-                            )
-                            # Skipping if OSD fail when in auto mode, otherwise proceed
-                            # to OCR in the hope OCR will succeed while OSD failed
-                            if self._is_auto:
-                                continue
-                        else:
-                            doc_orientation = parse_tesseract_orientation(
-                                osd["orient_deg"]
-                            )
-                            if doc_orientation != 0:
-                                high_res_image = high_res_image.rotate(
-                                    -doc_orientation, expand=True
-                                )
-                        if self._is_auto:
-                            script = osd["script_name"]
-                            script = map_tesseract_script(script)
-                            lang = f"{self.script_prefix}{script}"
-
-                            # Check if the detected language is present in the system
-                            if lang not in self._tesserocr_languages:
-                                msg = f"Tesseract detected the script '{script}' and language '{lang}'."
-                                msg += " However this language is not installed in your system and will be ignored."
-                                _log.warning(msg)
-                            else:
-                                if script not in self.script_readers:
-                                    import tesserocr
-
-                                    self.script_readers[script] = (
-                                        tesserocr.PyTessBaseAPI(
-                                            path=self.reader.GetDatapath(),
-                                            lang=lang,
-                                            psm=self.options.psm
-                                            if self.options.psm is not None
-                                            else tesserocr.PSM.AUTO,
-                                            init=True,
-                                            oem=tesserocr.OEM.DEFAULT,
-                                        )
-                                    )
-                                local_reader = self.script_readers[script]
-
-                        local_reader.SetImage(high_res_image)
-                        boxes = local_reader.GetComponentImages(
-                            self.reader_RIL.TEXTLINE, True
+                doc_orientation = parse_tesseract_orientation(osd["orient_deg"])
+                if doc_orientation != 0:
+                    high_res_image = high_res_image.rotate(
+                        -doc_orientation, expand=True
+                    )
+            if self._is_auto:
+                script = osd["script_name"]
+                script = map_tesseract_script(script)
+                lang = f"{self.script_prefix}{script}"
+
+                # Check if the detected language is present in the system
+                if lang not in self._tesserocr_languages:
+                    msg = f"Tesseract detected the script '{script}' and language '{lang}'."
+                    msg += " However this language is not installed in your system and will be ignored."
+                    _log.warning(msg)
+                else:
+                    if script not in readers.script_readers:
+                        import tesserocr
+
+                        readers.script_readers[script] = tesserocr.PyTessBaseAPI(
+                            path=readers.reader.GetDatapath(),
+                            lang=lang,
+                            psm=self.options.psm
+                            if self.options.psm is not None
+                            else tesserocr.PSM.AUTO,
+                            init=True,
+                            oem=tesserocr.OEM.DEFAULT,
                         )
+                    local_reader = readers.script_readers[script]
+
+            local_reader.SetImage(high_res_image)
+            boxes = local_reader.GetComponentImages(self.reader_RIL.TEXTLINE, True)
+
+            cells = []
+            for ix, (im, box, _, _) in enumerate(boxes):
+                # Set the area of interest. Tesseract uses Bottom-Left for the origin
+                local_reader.SetRectangle(box["x"], box["y"], box["w"], box["h"])
+
+                # Extract text within the bounding box
+                text = local_reader.GetUTF8Text().strip()
+                confidence = local_reader.MeanTextConf()
+                left, top = box["x"], box["y"]
+                right = left + box["w"]
+                bottom = top + box["h"]
+                bbox = BoundingBox(
+                    l=left,
+                    t=top,
+                    r=right,
+                    b=bottom,
+                    coord_origin=CoordOrigin.TOPLEFT,
+                )
+                rect = tesseract_box_to_bounding_rectangle(
+                    bbox,
+                    original_offset=ocr_rect,
+                    scale=self.scale,
+                    orientation=doc_orientation,
+                    im_size=high_res_image.size,
+                )
+                cells.append(
+                    TextCell(
+                        index=ix,
+                        text=text,
+                        orig=text,
+                        from_ocr=True,
+                        confidence=confidence,
+                        rect=rect,
+                    )
+                )
 
-                        cells = []
-                        for ix, (im, box, _, _) in enumerate(boxes):
-                            # Set the area of interest. Tesseract uses Bottom-Left for the origin
-                            local_reader.SetRectangle(
-                                box["x"], box["y"], box["w"], box["h"]
-                            )
-
-                            # Extract text within the bounding box
-                            text = local_reader.GetUTF8Text().strip()
-                            confidence = local_reader.MeanTextConf()
-                            left, top = box["x"], box["y"]
-                            right = left + box["w"]
-                            bottom = top + box["h"]
-                            bbox = BoundingBox(
-                                l=left,
-                                t=top,
-                                r=right,
-                                b=bottom,
-                                coord_origin=CoordOrigin.TOPLEFT,
-                            )
-                            rect = tesseract_box_to_bounding_rectangle(
-                                bbox,
-                                original_offset=ocr_rect,
-                                scale=self.scale,
-                                orientation=doc_orientation,
-                                im_size=high_res_image.size,
-                            )
-                            cells.append(
-                                TextCell(
-                                    index=ix,
-                                    text=text,
-                                    orig=text,
-                                    from_ocr=True,
-                                    confidence=confidence,
-                                    rect=rect,
-                                )
-                            )
-
-                        # del high_res_image
-                        all_ocr_cells.extend(cells)
-
-                    # Post-process the cells
-                    self.post_process_cells(all_ocr_cells, page)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+            region.cells = cells
 
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
@@ -0,0 +1,199 @@
+import logging
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+import numpy as np
+from docling_core.types.doc import BoundingBox, DocItemLabel
+from docling_core.types.doc.page import TextCell
+
+from docling.datamodel.base_models import Cluster, LayoutPath, LayoutPrediction, Page
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import TextFastPathOptions
+from docling.models.base_model import BasePageModel
+from docling.models.base_ocr_model import BaseOcrModel
+from docling.utils.cell_index import TextCellIndex
+from docling.utils.profiling import TimeRecorder
+
+_log = logging.getLogger(__name__)
+
+
+class TextFastPathLayoutModel(BasePageModel):
+    """Layout stage which skips the layout model on plain born-digital text pages.
+
+    Each page is classified by its parse score, its bitmap coverage and the ruling
+    lines drawn on it. Pages with well parsed text, no bitmaps and no table-like
+    rules get clusters grouped from their text lines, all other pages go to the
+    wrapped layout model. The path taken is recorded in `Page.layout_path`.
+    """
+
+    RULE_MAX_THICKNESS = 3.0  # points
+    RULE_MIN_LENGTH = 0.1  # fraction of the page width
+    SHAPE_MIN_AREA = 0.01  # fraction of the page area
+    PARAGRAPH_GAP = 0.8  # vertical gap between lines, in line heights
+    HEADING_SCALE = 1.15  # line height of headings over the body line height
+    MARGIN = 0.06  # page header and footer bands, as fraction of the page height
+    BULLETS = ("•", "◦", "▪", "‣", "·", "-", "–", "*")  # noqa: RUF001
+
+    def __init__(self, layout_model: BasePageModel, options: TextFastPathOptions):
+        self.layout_model = layout_model
+        self.options = options
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        yield from self.process_documents([(conv_res, list(page_batch))])[0]
+
+    def process_documents(
+        self, batches: Sequence[tuple[ConversionResult, Sequence[Page]]]
+    ) -> list[list[Page]]:
+        batches = [(conv_res, list(pages)) for conv_res, pages in batches]
+
+        model_batches: list[tuple[ConversionResult, list[Page]]] = []
+        for conv_res, pages in batches:
+            model_pages = []
+            with TimeRecorder(conv_res, "text_fast_path"):
+                for page in pages:
+                    reason = self.full_path_reason(conv_res, page)
+                    if reason is None:
+                        page.predictions.layout = self.predict_text_layout(page)
+                        page.layout_path = LayoutPath.TEXT_FAST_PATH
+                    else:
+                        _log.debug(
+                            f"Page {page.page_no} goes through the layout model: "
+                            f"{reason}"
+                        )
+                        page.layout_path = LayoutPath.MODEL
+                        model_pages.append(page)
+            if model_pages:
+                model_batches.append((conv_res, model_pages))
+
+        # The remaining pages of all documents still share one layout model call
+        if model_batches:
+            self.layout_model.process_documents(model_batches)
+
+        return [pages for _, pages in batches]
+
+    def full_path_reason(self, conv_res: ConversionResult, page: Page) -> Optional[str]:
+        """Why the page needs the layout model, or None if the fast path will do."""
+        if page._backend is None or not page._backend.is_valid():
+            return "invalid page"
+        assert page.size is not None
+
+        if any(cell.from_ocr for cell in page.cells):
+            return "OCR text"
+
+        parse_score = conv_res.confidence.pages[page.page_no].parse_score
+        if not parse_score >= self.options.min_parse_score:  # also catches NaN
+            return f"parse score {parse_score:.2f}"
+
+        bitmap_rects = list(page._backend.get_bitmap_rects())
+        if bitmap_rects and self.options.max_bitmap_coverage <= 0:
+            return "bitmaps"
+        coverage, _ = BaseOcrModel.find_ocr_rects(page.size, bitmap_rects)
+        if coverage > self.options.max_bitmap_coverage:
+            return f"bitmap coverage {coverage:.2f}"
+
+        try:
+            path_rects = list(page._backend.get_path_rects())
+        except NotImplementedError:
+            return "vector paths not available from the backend"
+
+        page_area = page.size.width * page.size.height
+        ruling_lines = 0
+        for rect in path_rects:
+            thickness = min(rect.width, rect.height)
+            length = max(rect.width, rect.height)
+            if thickness <= self.RULE_MAX_THICKNESS:
+                if length >= self.RULE_MIN_LENGTH * page.size.width:
+                    ruling_lines += 1
+            elif rect.area() >= self.SHAPE_MIN_AREA * page_area:
+                return "vector graphics"
+        if ruling_lines > self.options.max_ruling_lines:
+            return f"{ruling_lines} ruling lines"
+
+        return None
+
+    def predict_text_layout(self, page: Page) -> LayoutPrediction:
+        """Group the text lines of the page into paragraph clusters."""
+        assert page.size is not None
+        cells = [cell for cell in page.cells if len(cell.text.strip()) > 0]
+        boxes = TextCellIndex(cells, page_height=page.size.height).boxes
+        heights = boxes[:, 3] - boxes[:, 1]
+        line_height = float(np.median(heights)) if len(cells) > 0 else 0.0
+
+        blocks: list[list[int]] = []
+        for ix in range(len(cells)):
+            if blocks and self._continues_block(boxes, blocks[-1], ix, line_height):
+                blocks[-1].append(ix)
+            else:
+                blocks.append([ix])
+
+        clusters = []
+        for block in blocks:
+            left, top = boxes[block, :2].min(axis=0)
+            right, bottom = boxes[block, 2:].max(axis=0)
+            if bottom <= self.MARGIN * page.size.height:
+                label = DocItemLabel.PAGE_HEADER
+            elif top >= (1 - self.MARGIN) * page.size.height:
+                label = DocItemLabel.PAGE_FOOTER
+            elif len(self._lines(boxes, block)) == 1 and (
+                np.median(heights[block]) >= self.HEADING_SCALE * line_height
+                or all(self._is_bold(cells[ix]) for ix in block)
+            ):
+                label = DocItemLabel.SECTION_HEADER
+            elif cells[block[0]].text.lstrip().startswith(self.BULLETS):
+                label = DocItemLabel.LIST_ITEM
+            else:
+                label = DocItemLabel.TEXT
+
+            clusters.append(
+                Cluster(
+                    id=len(clusters),
+                    label=label,
+                    bbox=BoundingBox(
+                        l=float(left), t=float(top), r=float(right), b=float(bottom)
+                    ),
+                    cells=[cells[ix] for ix in block],
+                )
+            )
+
+        return LayoutPrediction(clusters=clusters)
+
+    def _continues_block(
+        self, boxes: np.ndarray, block: list[int], ix: int, line_height: float
+    ) -> bool:
+        prev_l, prev_t, prev_r, prev_b = boxes[block[-1]]
+        left, top, right, bottom = boxes[ix]
+
+        # Further text on the same line
+        center = (top + bottom) / 2
+        if prev_t <= center <= prev_b and left >= prev_r - line_height:
+            return True
+
+        # The next line of the paragraph: close below, overlapping the paragraph
+        # horizontally and in the same font size
+        gap = top - prev_b
+        if not -0.25 * line_height <= gap <= self.PARAGRAPH_GAP * line_height:
+            return False
+        block_l = boxes[block, 0].min()
+        block_r = boxes[block, 2].max()
+        if right <= block_l or left >= block_r:
+            return False
+        prev_height, height = prev_b - prev_t, bottom - top
+        return abs(height - prev_height) <= 0.2 * max(height, prev_height)
+
+    @staticmethod
+    def _is_bold(cell: TextCell) -> bool:
+        # Only cells of the PDF parser carry a font name
+        return "bold" in getattr(cell, "font_name", "").lower()
+
+    @staticmethod
+    def _lines(boxes: np.ndarray, block: list[int]) -> list[int]:
+        """First cell of each line of a block."""
+        lines = [block[0]]
+        for ix in block[1:]:
+            if boxes[ix, 1] >= boxes[lines[-1], 3] - 0.25 * (
+                boxes[lines[-1], 3] - boxes[lines[-1], 1]
+            ):
+                lines.append(ix)
+        return lines
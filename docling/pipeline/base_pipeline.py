@@ -1,5 +1,7 @@
 import functools
 import logging
+import queue
+import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
@@ -7,7 +9,7 @@ from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, Callable, List, Optional
 
-from docling_core.types.doc import NodeItem
+from docling_core.types.doc import DocItem, NodeItem
 
 from docling.backend.abstract_backend import (
     AbstractDocumentBackend,
@@ -27,6 +29,7 @@ from docling.datamodel.pipeline_options import (
     PipelineOptions,
 )
 from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelled
 from docling.models.base_model import GenericEnrichmentModel
 from docling.models.document_picture_classifier import (
     DocumentPictureClassifier,
@@ -34,12 +37,20 @@ from docling.models.document_picture_classifier import (
 )
 from docling.models.factories import get_picture_description_factory
 from docling.models.picture_description_base_model import PictureDescriptionBaseModel
+from docling.utils.conversion_control import current_conversion_control
+from docling.utils.page_raster_cache import PageRasterCache
 from docling.utils.profiling import ProfilingScope, TimeRecorder
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
 
 
+def _item_page_nos(item: NodeItem) -> set[int]:
+    if not isinstance(item, DocItem):
+        return set()
+    return {prov.page_no for prov in item.prov}
+
+
 class BasePipeline(ABC):
     def __init__(self, pipeline_options: PipelineOptions):
         self.pipeline_options = pipeline_options
@@ -61,6 +72,7 @@ class BasePipeline(ABC):
 
     def execute(self, in_doc: InputDocument, raises_on_error: bool) -> ConversionResult:
         conv_res = ConversionResult(input=in_doc)
+        control = current_conversion_control()
 
         _log.info(f"Processing document {in_doc.file.name}")
         try:
@@ -70,10 +82,18 @@ class BasePipeline(ABC):
                 # These steps are building and assembling the structure of the
                 # output DoclingDocument.
                 conv_res = self._build_document(conv_res)
+                if control is not None:
+                    control.raise_if_cancelled()
                 conv_res = self._assemble_document(conv_res)
+                if control is not None:
+                    control.raise_if_cancelled()
                 # From this stage, all operations should rely only on conv_res.output
                 conv_res = self._enrich_document(conv_res)
                 conv_res.status = self._determine_status(conv_res)
+        except ConversionCancelled:
+            # Cancellation always stops the whole conversion, not only this document
+            conv_res.status = ConversionStatus.FAILURE
+            raise
         except Exception as e:
             conv_res.status = ConversionStatus.FAILURE
             if not raises_on_error:
@@ -98,29 +118,120 @@ class BasePipeline(ABC):
         return conv_res
 
     def _enrich_document(self, conv_res: ConversionResult) -> ConversionResult:
-        def _prepare_elements(
-            conv_res: ConversionResult, model: GenericEnrichmentModel[Any]
-        ) -> Iterable[NodeItem]:
-            for doc_element, _level in conv_res.document.iterate_items():
-                prepared_element = model.prepare_element(
-                    conv_res=conv_res, element=doc_element
-                )
-                if prepared_element is not None:
-                    yield prepared_element
-
-        with TimeRecorder(conv_res, "doc_enrich", scope=ProfilingScope.DOCUMENT):
-            for model in self.enrichment_pipe:
-                for element_batch in chunkify(
-                    _prepare_elements(conv_res, model),
-                    model.elements_batch_size,
-                ):
-                    for element in model(
-                        doc=conv_res.document, element_batch=element_batch
-                    ):  # Must exhaust!
-                        pass
+        # Models cropping elements render each page once, for the whole pass
+        conv_res._page_rasters = PageRasterCache(
+            max_bytes=settings.perf.page_raster_cache_mb * 1024 * 1024
+        )
+        try:
+            with TimeRecorder(conv_res, "doc_enrich", scope=ProfilingScope.DOCUMENT):
+                self._stream_enrichment(conv_res)
+        finally:
+            conv_res._page_rasters.clear()
+            conv_res._page_rasters = None
 
         return conv_res
 
+    def _stream_enrichment(self, conv_res: ConversionResult) -> None:
+        """Stream the document items through the enrichment models.
+
+        Every model with items to process runs on its own thread, in batches of its
+        `elements_batch_size`. Items move on to the next model as soon as their
+        batch is done, in document order, so the models work on different parts of
+        the document at the same time. A page is released with
+        `_release_enriched_page` once all of its items went through every model.
+        """
+        doc = conv_res.document
+        items = [item for item, _level in doc.iterate_items()]
+        stages = []
+        for model in self.enrichment_pipe:
+            processable = {
+                id(item) for item in items if model.is_processable(doc, item)
+            }
+            if processable:
+                stages.append((model, processable))
+        items = [item for item in items if any(id(item) in p for _, p in stages)]
+
+        pages = {page.page_no + 1: page for page in conv_res.pages}
+        pending = dict.fromkeys(pages, 0)
+        for item in items:
+            for page_no in _item_page_nos(item):
+                pending[page_no] = pending.get(page_no, 0) + 1
+        for page_no, page in pages.items():
+            if pending[page_no] == 0:
+                self._release_enriched_page(conv_res, page)
+
+        def item_done(item: NodeItem) -> None:
+            # Only called from the last stage
+            for page_no in _item_page_nos(item):
+                pending[page_no] -= 1
+                if pending[page_no] == 0 and page_no in pages:
+                    self._release_enriched_page(conv_res, pages[page_no])
+
+        queues: List[queue.Queue] = [queue.Queue() for _ in range(len(stages) + 1)]
+        for item in items:
+            queues[0].put(item)
+        queues[0].put(None)
+
+        errors: List[BaseException] = []
+        failed = threading.Event()
+
+        def run_stage(ix: int) -> None:
+            model, processable = stages[ix]
+            inbox, outbox = queues[ix], queues[ix + 1]
+            forward = item_done if ix == len(stages) - 1 else outbox.put
+            held: List[NodeItem] = []  # items behind the open batch, in order
+            batch: List[Any] = []
+            try:
+                while (item := inbox.get()) is not None and not failed.is_set():
+                    prepared = None
+                    if id(item) in processable:
+                        prepared = model.prepare_element(
+                            conv_res=conv_res, element=item
+                        )
+                    if prepared is not None:
+                        batch.append(prepared)
+                    if batch:
+                        held.append(item)
+                    else:
+                        forward(item)
+                    if len(batch) >= model.elements_batch_size:
+                        for _ in model(doc=doc, element_batch=batch):  # Must exhaust!
+                            pass
+                        for held_item in held:
+                            forward(held_item)
+                        held, batch = [], []
+                if batch and not failed.is_set():
+                    for _ in model(doc=doc, element_batch=batch):  # Must exhaust!
+                        pass
+                    for held_item in held:
+                        forward(held_item)
+            except BaseException as e:
+                errors.append(e)
+                failed.set()
+            finally:
+                outbox.put(None)
+
+        # The first stage runs on the calling thread
+        threads = [
+            threading.Thread(
+                target=run_stage, args=(ix,), name=f"enrich-{ix}", daemon=True
+            )
+            for ix in range(1, len(stages))
+        ]
+        for thread in threads:
+            thread.start()
+        if stages:
+            run_stage(0)
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    def _release_enriched_page(self, conv_res: ConversionResult, page: Page) -> None:
+        """Free what a page holds for the enrichment models, once they are done."""
+        if conv_res._page_rasters is not None:
+            conv_res._page_rasters.release(page.page_no)
+
     @abstractmethod
     def _determine_status(self, conv_res: ConversionResult) -> ConversionStatus:
         pass
@@ -218,12 +329,16 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
                 if (start_page - 1) <= i <= (end_page - 1):
                     conv_res.pages.append(Page(page_no=i))
 
+            control = current_conversion_control()
             try:
                 total_pages_processed = 0
+                pages_done = 0
                 # Iterate batches of pages (page_batch_size) in the doc
                 for page_batch in chunkify(
                     conv_res.pages, settings.perf.page_batch_size
                 ):
+                    if control is not None:
+                        control.raise_if_cancelled()
                     start_batch_time = time.monotonic()
 
                     # 1. Initialise the page resources
@@ -249,6 +364,12 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
                             del p.parsed_page
                             p.parsed_page = None
 
+                        if control is not None:
+                            pages_done += 1
+                            control.page_done(
+                                conv_res, p.page_no, pages_done, len(conv_res.pages)
+                            )
+
                     end_batch_time = time.monotonic()
                     total_elapsed_time += end_batch_time - start_batch_time
                     if (
@@ -1,14 +1,21 @@
 import inspect
 import json
 import logging
-from typing import Optional
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional, Union
 
 from PIL.Image import Image
 from pydantic import BaseModel
 
 from docling.backend.abstract_backend import PaginatedDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
-from docling.datamodel.base_models import ConversionStatus, ErrorItem, VlmStopReason
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    ErrorItem,
+    VlmPrediction,
+    VlmStopReason,
+)
 from docling.datamodel.document import InputDocument
 from docling.datamodel.extraction import (
     ExtractedPageData,
@@ -19,7 +26,9 @@ from docling.datamodel.pipeline_options import (
     PipelineOptions,
     VlmExtractionPipelineOptions,
 )
+from docling.datamodel.pipeline_options_vlm_model import ApiVlmOptions
 from docling.datamodel.settings import settings
+from docling.models.api_vlm_model import ApiVlmModel
 from docling.models.vlm_models_inline.nuextract_transformers_model import (
     NuExtractTransformersModel,
 )
@@ -38,12 +47,20 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
         self.pipeline_options: VlmExtractionPipelineOptions
 
         # Create VLM model instance
-        self.vlm_model = NuExtractTransformersModel(
-            enabled=True,
-            artifacts_path=self.artifacts_path,  # Will download automatically
-            accelerator_options=self.accelerator_options,
-            vlm_options=pipeline_options.vlm_options,
-        )
+        self.vlm_model: Union[NuExtractTransformersModel, ApiVlmModel]
+        if isinstance(pipeline_options.vlm_options, ApiVlmOptions):
+            self.vlm_model = ApiVlmModel(
+                enabled=True,
+                enable_remote_services=pipeline_options.enable_remote_services,
+                vlm_options=pipeline_options.vlm_options,
+            )
+        else:
+            self.vlm_model = NuExtractTransformersModel(
+                enabled=True,
+                artifacts_path=self.artifacts_path,  # Will download automatically
+                accelerator_options=self.accelerator_options,
+                vlm_options=pipeline_options.vlm_options,
+            )
 
     def _extract_data(
         self,
@@ -52,9 +69,29 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
     ) -> ExtractionResult:
         """Extract data using the VLM model."""
         try:
-            # Get images from input document using the backend
-            images = self._get_images_from_input(ext_res.input)
-            if not images:
+            # Use provided template or default prompt
+            if template is not None:
+                prompt = self._serialize_template(template)
+            else:
+                prompt = "Extract all text and structured information from this document. Return as JSON."
+
+            # Pages are rasterized as the request window frees up, not up front,
+            # and collected in page order
+            window = self._request_window()
+            page_results: list[tuple[int, Optional[VlmPrediction], Optional[str]]] = []
+            with ThreadPoolExecutor(
+                max_workers=window, thread_name_prefix="extraction"
+            ) as executor:
+                in_flight: dict[Future, int] = {}
+                for page_number, image in self._iter_page_images(ext_res.input):
+                    if len(in_flight) >= window:
+                        page_results.extend(self._collect(in_flight))
+                    future = executor.submit(self._predict_page, image, prompt)
+                    in_flight[future] = page_number
+                while in_flight:
+                    page_results.extend(self._collect(in_flight))
+
+            if not page_results:
                 ext_res.status = ConversionStatus.FAILURE
                 ext_res.errors.append(
                     ErrorItem(
@@ -65,59 +102,12 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
                 )
                 return ext_res
 
-            # Use provided template or default prompt
-            if template is not None:
-                prompt = self._serialize_template(template)
-            else:
-                prompt = "Extract all text and structured information from this document. Return as JSON."
-
-            # Process all images with VLM model
-            start_page, end_page = ext_res.input.limits.page_range
-            for i, image in enumerate(images):
-                # Calculate the actual page number based on the filtered range
-                page_number = start_page + i
-                try:
-                    predictions = list(self.vlm_model.process_images([image], prompt))
-
-                    if predictions:
-                        # Parse the extracted text as JSON if possible, otherwise use as-is
-                        extracted_text = predictions[0].text
-                        extracted_data = None
-                        vlm_stop_reason: VlmStopReason = predictions[0].stop_reason
-                        if (
-                            vlm_stop_reason == VlmStopReason.LENGTH
-                            or vlm_stop_reason == VlmStopReason.STOP_SEQUENCE
-                        ):
-                            ext_res.status = ConversionStatus.PARTIAL_SUCCESS
-
-                        try:
-                            extracted_data = json.loads(extracted_text)
-                        except (json.JSONDecodeError, ValueError):
-                            # If not valid JSON, keep extracted_data as None
-                            pass
-
-                        # Create page data with proper structure
-                        page_data = ExtractedPageData(
-                            page_no=page_number,
-                            extracted_data=extracted_data,
-                            raw_text=extracted_text,  # Always populate raw_text
-                        )
-                        ext_res.pages.append(page_data)
-                    else:
-                        # Add error page data
-                        page_data = ExtractedPageData(
-                            page_no=page_number,
-                            extracted_data=None,
-                            errors=["No extraction result from VLM model"],
-                        )
-                        ext_res.pages.append(page_data)
-
-                except Exception as e:
-                    _log.error(f"Error processing page {page_number}: {e}")
-                    page_data = ExtractedPageData(
-                        page_no=page_number, extracted_data=None, errors=[str(e)]
-                    )
-                    ext_res.pages.append(page_data)
+            for page_number, prediction, error in sorted(
+                page_results, key=lambda result: result[0]
+            ):
+                ext_res.pages.append(
+                    self._page_data(ext_res, page_number, prediction, error)
+                )
 
         except Exception as e:
             _log.error(f"Error during extraction: {e}")
@@ -131,6 +121,69 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
 
         return ext_res
 
+    def _request_window(self) -> int:
+        """Number of pages with a request in flight at once."""
+        if isinstance(self.vlm_model, ApiVlmModel):
+            return max(1, self.vlm_model.concurrency)
+        return 1
+
+    def _predict_page(self, image: Image, prompt: str) -> Optional[VlmPrediction]:
+        predictions = list(self.vlm_model.process_images([image], prompt))
+        return predictions[0] if predictions else None
+
+    @staticmethod
+    def _collect(
+        in_flight: dict[Future, int],
+    ) -> Iterator[tuple[int, Optional[VlmPrediction], Optional[str]]]:
+        """Wait for at least one request, yield the finished ones."""
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            page_number = in_flight.pop(future)
+            try:
+                yield page_number, future.result(), None
+            except Exception as e:
+                _log.error(f"Error processing page {page_number}: {e}")
+                yield page_number, None, str(e)
+
+    def _page_data(
+        self,
+        ext_res: ExtractionResult,
+        page_number: int,
+        prediction: Optional[VlmPrediction],
+        error: Optional[str],
+    ) -> ExtractedPageData:
+        if error is not None:
+            return ExtractedPageData(
+                page_no=page_number, extracted_data=None, errors=[error]
+            )
+        if prediction is None:
+            return ExtractedPageData(
+                page_no=page_number,
+                extracted_data=None,
+                errors=["No extraction result from VLM model"],
+            )
+
+        # Parse the extracted text as JSON if possible, otherwise use as-is
+        extracted_text = prediction.text
+        extracted_data = None
+        if prediction.stop_reason in (
+            VlmStopReason.LENGTH,
+            VlmStopReason.STOP_SEQUENCE,
+        ):
+            ext_res.status = ConversionStatus.PARTIAL_SUCCESS
+
+        try:
+            extracted_data = json.loads(extracted_text)
+        except (json.JSONDecodeError, ValueError):
+            # If not valid JSON, keep extracted_data as None
+            pass
+
+        return ExtractedPageData(
+            page_no=page_number,
+            extracted_data=extracted_data,
+            raw_text=extracted_text,  # Always populate raw_text
+        )
+
     def _determine_status(self, ext_res: ExtractionResult) -> ConversionStatus:
         """Determine the status based on extraction results."""
         if ext_res.pages and not any(page.errors for page in ext_res.pages):
@@ -144,8 +197,12 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
 
     def _get_images_from_input(self, input_doc: InputDocument) -> list[Image]:
         """Extract images from input document using the backend."""
-        images = []
+        return [image for _, image in self._iter_page_images(input_doc)]
 
+    def _iter_page_images(
+        self, input_doc: InputDocument
+    ) -> Iterator[tuple[int, Image]]:
+        """Render the pages in the page range one at a time, with their page number."""
         try:
             backend = input_doc._backend
 
@@ -162,24 +219,29 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
             for page_num in range(page_count):
                 # Only process pages within the specified range (0-based indexing)
                 if start_page - 1 <= page_num <= end_page - 1:
+                    page_image = None
                     try:
                         page_backend = backend.load_page(page_num)
-                        if page_backend.is_valid():
-                            # Get page image at a reasonable scale
-                            page_image = page_backend.get_page_image(
-                                scale=self.pipeline_options.vlm_options.scale
-                            )
-                            images.append(page_image)
-                        else:
-                            _log.warning(f"Page {page_num + 1} backend is not valid")
+                        try:
+                            if page_backend.is_valid():
+                                # Get page image at a reasonable scale
+                                page_image = page_backend.get_page_image(
+                                    scale=self.pipeline_options.vlm_options.scale
+                                )
+                            else:
+                                _log.warning(
+                                    f"Page {page_num + 1} backend is not valid"
+                                )
+                        finally:
+                            page_backend.unload()
                     except Exception as e:
                         _log.error(f"Error loading page {page_num + 1}: {e}")
+                    if page_image is not None:
+                        yield page_num + 1, page_image
 
         except Exception as e:
             _log.error(f"Error getting images from input document: {e}")
 
-        return images
-
     def _serialize_template(self, template: ExtractionTemplateType) -> str:
         """Serialize template to string based on its type."""
         if isinstance(template, str):
@@ -2,8 +2,12 @@
 ================================================
 A self-contained, thread-safe PDF conversion pipeline exploiting parallelism between pipeline stages and models.
 
-* **Per-run isolation** - every :py:meth:`execute` call uses its own bounded queues and worker
-  threads so that concurrent invocations never share mutable state.
+* **Persistent stage graph** - the stage threads and queues are created once per pipeline
+  instance and shared by all :py:meth:`execute` calls; pages of concurrent documents are
+  multiplexed through the graph and routed back to their document by *run-id*.
+* **Page sharding** - optionally, large documents are split into page ranges which are built
+  by worker processes with their own models and backend, then merged in page order before
+  assembly.
 * **Deterministic run identifiers** - pages are tracked with an internal *run-id* instead of
   relying on :pyfunc:`id`, which may clash after garbage collection.
 * **Explicit back-pressure & shutdown** - producers block on full queues; queue *close()*
@@ -15,18 +19,27 @@ A self-contained, thread-safe PDF conversion pipeline exploiting parallelism bet
 
 from __future__ import annotations
 
+import functools
 import itertools
 import logging
 import threading
 import time
 import warnings
+import weakref
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
-from docling_core.types.doc import DocItem, ImageRef, PictureItem, TableItem
+from docling_core.types.doc import (
+    DocItem,
+    DocItemLabel,
+    ImageRef,
+    PictureItem,
+    TableItem,
+)
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
@@ -40,6 +53,8 @@ from docling.datamodel.base_models import (
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
 from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelled
+from docling.models.base_model import BasePageModel
 from docling.models.code_formula_model import CodeFormulaModel, CodeFormulaModelOptions
 from docling.models.factories import (
     get_layout_factory,
@@ -52,8 +67,11 @@ from docling.models.page_preprocessing_model import (
     PagePreprocessingOptions,
 )
 from docling.models.readingorder_model import ReadingOrderModel, ReadingOrderOptions
+from docling.models.text_fast_path_model import TextFastPathLayoutModel
 from docling.pipeline.base_pipeline import ConvertPipeline
-from docling.utils.profiling import ProfilingScope, TimeRecorder
+from docling.utils.conversion_control import current_conversion_control
+from docling.utils.process_pool import PageShardPool
+from docling.utils.profiling import ProfilingItem, ProfilingScope, TimeRecorder
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
@@ -182,22 +200,24 @@ class ThreadedPipelineStage:
         queue_max_size: int,
         postprocess: Optional[Callable[[ThreadedItem], None]] = None,
         timed_out_run_ids: Optional[set[int]] = None,
+        daemon: bool = False,
     ) -> None:
         self.name = name
         self.model = model
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
         self.input_queue = ThreadedQueue(queue_max_size)
-        self._outputs: list[ThreadedQueue] = []
+        self._outputs: list[ThreadedQueue | RunOutputRouter] = []
         self._thread: Optional[threading.Thread] = None
         self._running = False
+        self._daemon = daemon
         self._postprocess = postprocess
         self._timed_out_run_ids = (
             timed_out_run_ids if timed_out_run_ids is not None else set()
         )
 
     # ---------------------------------------------------------------- wiring
-    def add_output_queue(self, q: ThreadedQueue) -> None:
+    def add_output_queue(self, q: ThreadedQueue | RunOutputRouter) -> None:
         self._outputs.append(q)
 
     # -------------------------------------------------------------- lifecycle
@@ -206,10 +226,14 @@ class ThreadedPipelineStage:
             return
         self._running = True
         self._thread = threading.Thread(
-            target=self._run, name=f"Stage-{self.name}", daemon=False
+            target=self._run, name=f"Stage-{self.name}", daemon=self._daemon
         )
         self._thread.start()
 
+    @property
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
     def stop(self) -> None:
         if not self._running:
             return
@@ -242,12 +266,18 @@ class ThreadedPipelineStage:
 
     # ----------------------------------------------------- _process_batch()
     def _process_batch(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
-        """Run *model* on *batch* grouped by run_id to maximise batching."""
+        """Run *model* on *batch* grouped by run_id to maximise batching.
+
+        Pages of different runs (documents) are handed to the model in a single
+        :py:meth:`BasePageModel.process_documents` call, so models which support it
+        can fill one inference batch across documents.
+        """
         groups: dict[int, list[ThreadedItem]] = defaultdict(list)
         for itm in batch:
             groups[itm.run_id].append(itm)
 
         result: list[ThreadedItem] = []
+        ready: list[tuple[int, list[ThreadedItem], list[ThreadedItem]]] = []
         for rid, items in groups.items():
             # If run_id is timed out, skip processing but pass through items as-is
             # This allows already-completed work to flow through while aborting new work
@@ -263,34 +293,40 @@ class ThreadedPipelineStage:
             if not good:
                 result.extend(items)
                 continue
+            if any(i.payload is None for i in good):
+                # Some items have None payloads, mark all as failed
+                for it in items:
+                    it.is_failed = True
+                    it.error = RuntimeError("Page payload is None")
+                result.extend(items)
+                continue
+            ready.append((rid, items, good))
+
+        if len(ready) > 1 and isinstance(self.model, BasePageModel):
             try:
-                # Filter out None payloads and ensure type safety
-                pages_with_payloads = [
-                    (i, i.payload) for i in good if i.payload is not None
-                ]
-                if len(pages_with_payloads) != len(good):
-                    # Some items have None payloads, mark all as failed
-                    for it in items:
-                        it.is_failed = True
-                        it.error = RuntimeError("Page payload is None")
-                    result.extend(items)
-                    continue
+                processed = self.model.process_documents(
+                    [
+                        (good[0].conv_res, [cast(Page, i.payload) for i in good])
+                        for _, _, good in ready
+                    ]
+                )
+                wrapped: list[ThreadedItem] = []
+                for (rid, _, good), processed_pages in zip(ready, processed):
+                    wrapped.extend(self._wrap_processed(rid, good, processed_pages))
+                return result + wrapped
+            except Exception as exc:
+                # Retry per run, so a failing document does not fail the others
+                _log.warning(
+                    "Stage %s failed on a multi-document batch, retrying per document: %s",
+                    self.name,
+                    exc,
+                )
 
-                pages: List[Page] = [payload for _, payload in pages_with_payloads]
+        for rid, items, good in ready:
+            try:
+                pages: List[Page] = [cast(Page, i.payload) for i in good]
                 processed_pages = list(self.model(good[0].conv_res, pages))  # type: ignore[arg-type]
-                if len(processed_pages) != len(pages):  # strict mismatch guard
-                    raise RuntimeError(
-                        f"Model {self.name} returned wrong number of pages"
-                    )
-                for idx, page in enumerate(processed_pages):
-                    result.append(
-                        ThreadedItem(
-                            payload=page,
-                            run_id=rid,
-                            page_no=good[idx].page_no,
-                            conv_res=good[idx].conv_res,
-                        )
-                    )
+                result.extend(self._wrap_processed(rid, good, processed_pages))
             except Exception as exc:
                 _log.error(
                     "Stage %s failed for run %d: %s", self.name, rid, exc, exc_info=True
@@ -301,6 +337,21 @@ class ThreadedPipelineStage:
                 result.extend(items)
         return result
 
+    def _wrap_processed(
+        self, rid: int, good: Sequence[ThreadedItem], processed_pages: Sequence[Page]
+    ) -> list[ThreadedItem]:
+        if len(processed_pages) != len(good):  # strict mismatch guard
+            raise RuntimeError(f"Model {self.name} returned wrong number of pages")
+        return [
+            ThreadedItem(
+                payload=page,
+                run_id=rid,
+                page_no=good[idx].page_no,
+                conv_res=good[idx].conv_res,
+            )
+            for idx, page in enumerate(processed_pages)
+        ]
+
     # -------------------------------------------------------------- _emit()
     def _emit(self, items: Iterable[ThreadedItem]) -> None:
         for item in items:
@@ -321,6 +372,7 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
         queue_max_size: int,
         model: Any,
         timed_out_run_ids: Optional[set[int]] = None,
+        daemon: bool = False,
     ) -> None:
         super().__init__(
             name="preprocess",
@@ -329,6 +381,7 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
             batch_timeout=batch_timeout,
             queue_max_size=queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=daemon,
         )
 
     def _process_batch(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
@@ -395,6 +448,49 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
         return result
 
 
+class RunOutputRouter:
+    """Terminal sink of a shared stage graph, routing items to per-run output queues."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._queues: dict[int, ThreadedQueue] = {}
+        self._closed = False
+
+    def register(self, run_id: int, max_size: int) -> ThreadedQueue:
+        q = ThreadedQueue(max_size)
+        with self._lock:
+            if self._closed:
+                q.close()
+            self._queues[run_id] = q
+        return q
+
+    def unregister(self, run_id: int) -> None:
+        with self._lock:
+            q = self._queues.pop(run_id, None)
+        if q is not None:
+            q.close()
+
+    def put(self, item: ThreadedItem, timeout: Optional[float] | None = None) -> bool:
+        with self._lock:
+            q = self._queues.get(item.run_id)
+        if q is None:
+            # The run has already finished (e.g. after a timeout): drop late items
+            _log.debug("Dropping item of finished run %d", item.run_id)
+            return True
+        return q.put(item, timeout=timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            queues = list(self._queues.values())
+        for q in queues:
+            q.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
 @dataclass
 class RunContext:
     """Wiring for a single *execute* call."""
@@ -405,6 +501,50 @@ class RunContext:
     timed_out_run_ids: set[int] = field(default_factory=set)
 
 
+@dataclass
+class StageGraph:
+    """Long-lived wiring shared by all *execute* calls of a pipeline instance."""
+
+    stages: list[ThreadedPipelineStage]
+    first_stage: ThreadedPipelineStage
+    router: RunOutputRouter
+    timed_out_run_ids: set[int] = field(default_factory=set)
+
+    @property
+    def is_alive(self) -> bool:
+        return not self.router.closed and all(st.is_alive for st in self.stages)
+
+    def stop(self) -> None:
+        for st in self.stages:
+            st.stop()
+        self.router.close()
+
+
+def _release_page_resources(
+    item: ThreadedItem,
+    *,
+    keep_images: bool,
+    keep_backend: bool,
+    keep_parsed_pages: bool,
+    backend_labels: Optional[frozenset[DocItemLabel]] = None,
+) -> None:
+    page = item.payload
+    if page is None:
+        return
+    if keep_backend and backend_labels is not None:
+        # Only pages with elements to enrich need their backend any longer
+        keep_backend = page.assembled is not None and any(
+            element.label in backend_labels for element in page.assembled.elements
+        )
+    if not keep_images:
+        page._image_cache = {}
+    if not keep_backend and page._backend is not None:
+        page._backend.unload()
+        page._backend = None
+    if not keep_parsed_pages:
+        page.parsed_page = None
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Main pipeline
 # ──────────────────────────────────────────────────────────────────────────────
@@ -413,10 +553,18 @@ class RunContext:
 class StandardPdfPipeline(ConvertPipeline):
     """High-performance PDF pipeline with multi-threaded stages."""
 
+    # Labels of the page elements needing the page backend for enrichment, pages
+    # without any release it after assembly. None keeps the backend of all pages.
+    enrichment_labels: Optional[frozenset[DocItemLabel]] = None
+
     def __init__(self, pipeline_options: ThreadedPdfPipelineOptions) -> None:
         super().__init__(pipeline_options)
         self.pipeline_options: ThreadedPdfPipelineOptions = pipeline_options
         self._run_seq = itertools.count(1)  # deterministic, monotonic run ids
+        self._stage_graph: Optional[StageGraph] = None
+        self._stage_graph_lock = threading.Lock()
+        self._shard_pool: Optional[PageShardPool] = None
+        self._shard_pool_lock = threading.Lock()
 
         # initialise heavy models once
         self._init_models()
@@ -482,6 +630,17 @@ class StandardPdfPipeline(ConvertPipeline):
                 self.pipeline_options.do_picture_description,
             )
         )
+        labels = set()
+        if self.pipeline_options.do_formula_enrichment:
+            labels.add(DocItemLabel.FORMULA)
+        if self.pipeline_options.do_code_enrichment:
+            labels.add(DocItemLabel.CODE)
+        if (
+            self.pipeline_options.do_picture_classification
+            or self.pipeline_options.do_picture_description
+        ):
+            labels.add(DocItemLabel.PICTURE)
+        self.enrichment_labels = frozenset(labels)
 
     # ---------------------------------------------------------------- helpers
     def _make_ocr_model(self, art_path: Optional[Path]) -> Any:
@@ -496,29 +655,43 @@ class StandardPdfPipeline(ConvertPipeline):
         )
 
     def _release_page_resources(self, item: ThreadedItem) -> None:
-        page = item.payload
-        if page is None:
-            return
-        if not self.keep_images:
-            page._image_cache = {}
-        if not self.keep_backend and page._backend is not None:
+        _release_page_resources(
+            item,
+            keep_images=self.keep_images,
+            keep_backend=self.keep_backend,
+            keep_parsed_pages=self.pipeline_options.generate_parsed_pages,
+            backend_labels=self.enrichment_labels,
+        )
+
+    def _release_enriched_page(self, conv_res: ConversionResult, page: Page) -> None:
+        super()._release_enriched_page(conv_res, page)
+        # The backends are only kept for the enrichment models
+        if page._backend is not None:
             page._backend.unload()
             page._backend = None
-        if not self.pipeline_options.generate_parsed_pages:
-            page.parsed_page = None
 
     # ────────────────────────────────────────────────────────────────────────
     # Build - thread pipeline
     # ────────────────────────────────────────────────────────────────────────
 
-    def _create_run_ctx(self) -> RunContext:
+    def _create_stage_graph(self) -> StageGraph:
         opts = self.pipeline_options
         timed_out_run_ids: set[int] = set()
+        # Stage threads must not keep the pipeline alive, so they only reference
+        # the models and a detached copy of the resource release policy.
+        release_page_resources = functools.partial(
+            _release_page_resources,
+            keep_images=self.keep_images,
+            keep_backend=self.keep_backend,
+            keep_parsed_pages=opts.generate_parsed_pages,
+            backend_labels=self.enrichment_labels,
+        )
         preprocess = PreprocessThreadedStage(
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             model=self.preprocessing_model,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=True,
         )
         ocr = ThreadedPipelineStage(
             name="ocr",
@@ -527,14 +700,20 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=True,
         )
         layout = ThreadedPipelineStage(
             name="layout",
-            model=self.layout_model,
+            model=(
+                TextFastPathLayoutModel(self.layout_model, opts.text_fast_path)
+                if opts.text_fast_path.enabled
+                else self.layout_model
+            ),
             batch_size=opts.layout_batch_size,
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=True,
         )
         table = ThreadedPipelineStage(
             name="table",
@@ -543,6 +722,7 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=True,
         )
         assemble = ThreadedPipelineStage(
             name="assemble",
@@ -550,35 +730,88 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_size=1,
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
-            postprocess=self._release_page_resources,
+            postprocess=release_page_resources,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=True,
         )
 
         # wire stages
-        output_q = ThreadedQueue(opts.queue_max_size)
+        router = RunOutputRouter()
         preprocess.add_output_queue(ocr.input_queue)
         ocr.add_output_queue(layout.input_queue)
         layout.add_output_queue(table.input_queue)
         table.add_output_queue(assemble.input_queue)
-        assemble.add_output_queue(output_q)
+        assemble.add_output_queue(router)
 
         stages = [preprocess, ocr, layout, table, assemble]
-        return RunContext(
+        return StageGraph(
             stages=stages,
             first_stage=preprocess,
-            output_queue=output_q,
+            router=router,
             timed_out_run_ids=timed_out_run_ids,
         )
 
+    def _ensure_stage_graph(self) -> StageGraph:
+        """Return the running stage graph, (re)starting it if needed."""
+        with self._stage_graph_lock:
+            graph = self._stage_graph
+            if graph is not None and graph.is_alive:
+                return graph
+            if graph is not None:
+                _log.warning("Pipeline stage graph terminated, restarting it.")
+                graph.stop()
+
+            graph = self._create_stage_graph()
+            for st in graph.stages:
+                st.start()
+            self._stage_graph = graph
+            # Stop the stage threads once the pipeline is garbage collected
+            weakref.finalize(self, graph.stop)
+            return graph
+
+    def _get_shard_pool(self) -> PageShardPool:
+        with self._shard_pool_lock:
+            if self._shard_pool is None:
+                self._shard_pool = PageShardPool(
+                    pipeline_cls=type(self),
+                    # Workers build their shard in-process
+                    pipeline_options=self.pipeline_options.model_copy(
+                        update={"page_shard_size": None}
+                    ),
+                    num_workers=self.pipeline_options.page_shard_workers,
+                )
+                weakref.finalize(self, self._shard_pool.terminate)
+            return self._shard_pool
+
+    def shutdown(self) -> None:
+        """Stop the stage threads and page shard workers.
+
+        They are restarted lazily on the next conversion.
+        """
+        with self._stage_graph_lock:
+            graph, self._stage_graph = self._stage_graph, None
+        if graph is not None:
+            graph.stop()
+        with self._shard_pool_lock:
+            shard_pool, self._shard_pool = self._shard_pool, None
+        if shard_pool is not None:
+            shard_pool.close()
+
     # --------------------------------------------------------------------- build
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
         """Stream-build the document while interleaving producer and consumer work.
 
-        Note: If a worker thread gets stuck in a blocking call (model inference or PDF backend
-        load_page/get_size), that thread will be abandoned after a brief wait (15s) during cleanup.
-        The thread continues running until the blocking call completes, potentially holding
-        resources (e.g., pypdfium2_lock).
+        Pages are fed into the shared stage graph tagged with a fresh *run-id* and
+        collected from a per-run output queue, so several documents can be in flight
+        at the same time.
+
+        Note: On timeout no new pages are fed, and pages still in flight are drained
+        (short-circuited by every stage) before returning, so that no stage touches
+        the document backend after it has been unloaded.
         """
+        if self._use_page_shards(conv_res):
+            return self._build_document_sharded(conv_res)
+
         run_id = next(self._run_seq)
         assert isinstance(conv_res.input._backend, PdfDocumentBackend)
 
@@ -596,18 +829,30 @@ class StandardPdfPipeline(ConvertPipeline):
             return conv_res
 
         total_pages: int = len(pages)
-        ctx: RunContext = self._create_run_ctx()
-        for st in ctx.stages:
-            st.start()
+        graph: StageGraph = self._ensure_stage_graph()
+        # Sized to hold every page of the run, so the shared graph never blocks on it
+        output_queue = graph.router.register(run_id, max_size=total_pages)
 
         proc = ProcessingResult(total_expected=total_pages)
         fed_idx: int = 0  # number of pages successfully queued
         batch_size: int = 32  # drain chunk
         start_time = time.monotonic()
         timeout_exceeded = False
-        input_queue_closed = False
+        control = current_conversion_control()
+        cancelled = False
         try:
-            while proc.success_count + proc.failure_count < total_pages:
+            # After a timeout or cancellation, only wait for the pages which were
+            # already fed
+            while proc.success_count + proc.failure_count < (
+                fed_idx if timeout_exceeded or cancelled else total_pages
+            ):
+                if control is not None and control.cancelled and not cancelled:
+                    _log.info(f"Conversion of {conv_res.input.file.name} cancelled")
+                    cancelled = True
+                    # Stages pass the in-flight pages of this run through untouched
+                    graph.timed_out_run_ids.add(run_id)
+                    continue
+
                 # Check timeout
                 if (
                     self.pipeline_options.document_timeout is not None
@@ -620,17 +865,14 @@ class StandardPdfPipeline(ConvertPipeline):
                             f"exceeded timeout of {self.pipeline_options.document_timeout:.3f}s"
                         )
                         timeout_exceeded = True
-                        ctx.timed_out_run_ids.add(run_id)
-                        if not input_queue_closed:
-                            ctx.first_stage.input_queue.close()
-                            input_queue_closed = True
-                        # Break immediately - don't wait for in-flight work
-                        break
+                        # Stages pass the in-flight pages of this run through untouched
+                        graph.timed_out_run_ids.add(run_id)
+                        continue
 
                 # 1) feed - try to enqueue until the first queue is full
-                if not input_queue_closed:
+                if not (timeout_exceeded or cancelled):
                     while fed_idx < total_pages:
-                        ok = ctx.first_stage.input_queue.put(
+                        ok = graph.first_stage.input_queue.put(
                             ThreadedItem(
                                 payload=pages[fed_idx],
                                 run_id=run_id,
@@ -641,27 +883,31 @@ class StandardPdfPipeline(ConvertPipeline):
                         )
                         if ok:
                             fed_idx += 1
-                            if fed_idx == total_pages:
-                                ctx.first_stage.input_queue.close()
-                                input_queue_closed = True
                         else:  # queue full - switch to draining
                             break
 
                 # 2) drain - pull whatever is ready from the output side
-                out_batch = ctx.output_queue.get_batch(batch_size, timeout=0.05)
+                out_batch = output_queue.get_batch(batch_size, timeout=0.05)
                 for itm in out_batch:
-                    if itm.run_id != run_id:
-                        continue
-                    if itm.is_failed or itm.error:
+                    failed = itm.is_failed or itm.error is not None
+                    if failed:
                         proc.failed_pages.append(
                             (itm.page_no, itm.error or RuntimeError("unknown error"))
                         )
                     else:
                         assert itm.payload is not None
                         proc.pages.append(itm.payload)
+                    if control is not None and not cancelled:
+                        control.page_done(
+                            conv_res,
+                            itm.page_no,
+                            proc.success_count + proc.failure_count,
+                            total_pages,
+                            failed=failed,
+                        )
 
                 # 3) failure safety - downstream closed early
-                if not out_batch and ctx.output_queue.closed:
+                if not out_batch and output_queue.closed:
                     missing = total_pages - (proc.success_count + proc.failure_count)
                     if missing > 0:
                         proc.failed_pages.extend(
@@ -680,13 +926,122 @@ class StandardPdfPipeline(ConvertPipeline):
                             (page.page_no, RuntimeError("document timeout exceeded"))
                         )
         finally:
-            for st in ctx.stages:
-                st.stop()
-            ctx.output_queue.close()
+            graph.router.unregister(run_id)
+            graph.timed_out_run_ids.discard(run_id)
 
+        if cancelled:
+            raise ConversionCancelled(
+                f"Conversion of {conv_res.input.file.name} was cancelled"
+            )
         self._integrate_results(conv_res, proc, timeout_exceeded=timeout_exceeded)
         return conv_res
 
+    # ------------------------------------------------------------ page shards
+    def _use_page_shards(self, conv_res: ConversionResult) -> bool:
+        shard_size = self.pipeline_options.page_shard_size
+        if shard_size is None:
+            return False
+        start_page, end_page = conv_res.input.limits.page_range
+        num_pages = min(end_page, conv_res.input.page_count) - start_page + 1
+        return num_pages > shard_size
+
+    def _build_document_sharded(self, conv_res: ConversionResult) -> ConversionResult:
+        """Build the pages in shards of ``page_shard_size`` pages on worker processes.
+
+        The shards are merged back in page order. Assembly, reading order and
+        enrichment then run on the merged result in this process.
+        """
+        in_doc = conv_res.input
+        backend = in_doc._backend
+        assert isinstance(backend, PdfDocumentBackend)
+        shard_size = cast(int, self.pipeline_options.page_shard_size)
+        start_page, end_page = in_doc.limits.page_range
+        end_page = min(end_page, in_doc.page_count)
+
+        source = backend.path_or_stream
+        if isinstance(source, BytesIO):
+            source = source.getvalue()
+        shard_pool = self._get_shard_pool()
+        shards = []
+        for first in range(start_page, end_page + 1, shard_size):
+            last = min(first + shard_size - 1, end_page)
+            shard_limits = in_doc.limits.model_copy(
+                update={"page_range": (first, last)}
+            )
+            shards.append(
+                (
+                    (first, last),
+                    shard_pool.submit(
+                        source,
+                        filename=in_doc.file.name,
+                        backend=type(backend),
+                        backend_options=in_doc.backend_options,
+                        limits=shard_limits,
+                    ),
+                )
+            )
+
+        pages: list[Page] = []
+        statuses: list[ConversionStatus] = []
+        control = current_conversion_control()
+        for (first, last), shard in shards:
+            if control is not None and control.cancelled:
+                # Shards already running in the workers finish and are dropped
+                raise ConversionCancelled(
+                    f"Conversion of {in_doc.file.name} was cancelled"
+                )
+            try:
+                assets = shard_pool.load(shard.get())
+            except Exception as exc:
+                _log.error(
+                    f"Page shard {first}-{last} of {in_doc.file.name} failed: {exc}"
+                )
+                conv_res.errors.append(
+                    ErrorItem(
+                        component_type=DoclingComponentType.PIPELINE,
+                        module_name=self.__class__.__name__,
+                        error_message=f"Pages {first}-{last}: {exc}",
+                    )
+                )
+                statuses.append(ConversionStatus.FAILURE)
+                continue
+            if control is not None:
+                for page in assets.pages:
+                    control.page_done(
+                        conv_res,
+                        page.page_no,
+                        len(pages) + 1,
+                        end_page - start_page + 1,
+                    )
+                    pages.append(page)
+            else:
+                pages.extend(assets.pages)
+            statuses.append(assets.status)
+            conv_res.errors.extend(assets.errors)
+            conv_res.confidence.pages.update(assets.confidence.pages)
+            for key, item in assets.timings.items():
+                merged = conv_res.timings.setdefault(
+                    key, ProfilingItem(scope=item.scope)
+                )
+                merged.count += item.count
+                merged.times.extend(item.times)
+                merged.start_timestamps.extend(item.start_timestamps)
+
+        conv_res.pages = sorted(pages, key=lambda p: p.page_no)
+        if not conv_res.pages:
+            conv_res.status = ConversionStatus.FAILURE
+        elif all(st == ConversionStatus.SUCCESS for st in statuses):
+            conv_res.status = ConversionStatus.SUCCESS
+        else:
+            conv_res.status = ConversionStatus.PARTIAL_SUCCESS
+
+        # Page images and enrichment crops are rendered from this process' backend
+        if self.keep_images or self.keep_backend:
+            for page in conv_res.pages:
+                page._backend = backend.load_page(page.page_no)
+                page._default_image_scale = self.pipeline_options.images_scale
+        return conv_res
+
     # ---------------------------------------------------- integrate_results()
     def _integrate_results(
         self,
@@ -1,52 +1,338 @@
 import base64
+import dataclasses
+import hashlib
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
 
 import requests
 from PIL import Image
 from pydantic import AnyUrl
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from docling.datamodel.base_models import OpenAiApiResponse, VlmStopReason
+from docling.datamodel.pipeline_options_vlm_model import (
+    ApiImageEncodingOptions,
+    ApiImageFormat,
+)
+from docling.datamodel.settings import settings
 from docling.models.utils.generation_utils import GenerationStopper
 
 _log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass
+class EndpointStats:
+    """Requests sent to one endpoint by an :py:class:`ApiClient`."""
+
+    requests: int = 0
+    errors: int = 0  # connection errors and responses which are not ok
+    retries: int = 0
+    bytes_sent: int = 0  # request bodies
+    total_seconds: float = 0.0  # until the response headers, retries included
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.requests if self.requests > 0 else 0.0
+
+
+class ApiClient:
+    """HTTP client shared by the API models.
+
+    Connections are kept alive in a pool holding at most `max_connections_per_host`
+    connections to each server. Requests which fail to connect or are answered with
+    429 or 5xx are retried with exponential backoff, respecting `Retry-After`.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 32,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+    ):
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,  # the server may have started generating
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=None,  # POST too, the requests have no side effects
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=max_connections_per_host,
+            pool_block=True,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self._stats: Dict[str, EndpointStats] = {}
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            # Serialized here to know the size of the request
+            kwargs["data"] = json.dumps(payload).encode("utf-8")
+            kwargs["headers"] = {
+                "Content-Type": "application/json",
+                **(kwargs.get("headers") or {}),
+            }
+        data = kwargs.get("data")
+        size = len(data) if isinstance(data, (bytes, str)) else 0
+
+        start = time.monotonic()
+        try:
+            response = self.session.post(url, **kwargs)
+        except Exception:
+            self._record(url, time.monotonic() - start, ok=False, retries=0, size=size)
+            raise
+        retries = response.raw.retries if response.raw is not None else None
+        self._record(
+            url,
+            time.monotonic() - start,
+            ok=response.ok,
+            retries=len(retries.history) if retries is not None else 0,
+            size=size,
+        )
+        return response
+
+    def _record(
+        self, url: str, seconds: float, ok: bool, retries: int, size: int
+    ) -> None:
+        endpoint = urlsplit(url)._replace(query="", fragment="").geturl()
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.errors += 0 if ok else 1
+            stats.retries += retries
+            stats.bytes_sent += size * (1 + retries)
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+
+    def metrics(self) -> Dict[str, EndpointStats]:
+        """Latency and error counts per endpoint, without the query string."""
+        with self._lock:
+            return {
+                endpoint: dataclasses.replace(stats)
+                for endpoint, stats in self._stats.items()
+            }
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_api_client: Optional[ApiClient] = None
+_api_client_lock = threading.Lock()
+
+
+def get_api_client() -> ApiClient:
+    """The client shared by all API requests, configured from `settings.perf`."""
+    global _api_client
+    with _api_client_lock:
+        if _api_client is None:
+            _api_client = ApiClient(
+                max_connections_per_host=settings.perf.api_max_connections_per_host,
+                max_retries=settings.perf.api_max_retries,
+                backoff_factor=settings.perf.api_retry_backoff,
+            )
+        return _api_client
+
+
+_api_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_api_executor() -> ThreadPoolExecutor:
+    """The threads running the requests of all API models, see `map_requests`."""
+    global _api_executor
+    with _api_client_lock:
+        if _api_executor is None:
+            _api_executor = ThreadPoolExecutor(
+                max_workers=settings.perf.api_max_connections_per_host,
+                thread_name_prefix="api-request",
+            )
+        return _api_executor
+
+
+def map_requests(
+    fn: Callable[[_T], _R], items: Iterable[_T], concurrency: int
+) -> Iterator[_R]:
+    """Apply `fn` to `items` on the shared API executor, yielding results in order.
+
+    At most `concurrency` calls run at once. Items are taken from `items` as calls
+    finish, and calls not started yet are cancelled when the iterator is closed.
+    """
+    executor = get_api_executor()
+    pending: deque[Future[_R]] = deque()
+    try:
+        for item in items:
+            if len(pending) >= max(1, concurrency):
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+@dataclass
+class EncodedImage:
+    """An image encoded for the request of an API model."""
+
+    data: bytes
+    mime_type: str
+    encode_time: float  # seconds, 0 when taken from the cache
+    cached: bool = False
+
+    def data_url(self) -> str:
+        return f"data:{self.mime_type};base64,{base64.b64encode(self.data).decode()}"
+
+
+class _EncodedImageCache:
+    """LRU of encoded images, bounded by their total size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._images: OrderedDict[str, EncodedImage] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Optional[EncodedImage]:
+        with self._lock:
+            encoded = self._images.get(key)
+            if encoded is not None:
+                self._images.move_to_end(key)
+            return encoded
+
+    def put(self, key: str, encoded: EncodedImage) -> None:
+        if len(encoded.data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._images:
+                return
+            self._images[key] = encoded
+            self._bytes += len(encoded.data)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= len(evicted.data)
+
+
+_encoded_images: Optional[_EncodedImageCache] = None
+
+
+def _get_encoded_images() -> Optional[_EncodedImageCache]:
+    """The cache of encoded images, or None when `api_image_cache_mb` is 0."""
+    global _encoded_images
+    max_bytes = settings.perf.api_image_cache_mb * 1024 * 1024
+    if max_bytes <= 0:
+        return None
+    with _api_client_lock:
+        if _encoded_images is None or _encoded_images.max_bytes != max_bytes:
+            _encoded_images = _EncodedImageCache(max_bytes=max_bytes)
+        return _encoded_images
+
+
+def encode_image(
+    image: Image.Image, options: Optional[ApiImageEncodingOptions] = None
+) -> EncodedImage:
+    """Encode an image for an API request, reusing earlier encodings if cached."""
+    options = options or ApiImageEncodingOptions()
+    cache = _get_encoded_images()
+    key = ""
+    if cache is not None:
+        digest = hashlib.sha256(options.model_dump_json().encode())
+        digest.update(f"{image.mode}:{image.width}x{image.height}".encode())
+        digest.update(image.tobytes())
+        key = digest.hexdigest()
+        cached = cache.get(key)
+        if cached is not None:
+            return dataclasses.replace(cached, encode_time=0.0, cached=True)
+
+    start = time.perf_counter()
+    image = image.copy()  # Fix for inconsistent PIL image width/height to byte data
+    if options.grayscale:
+        image = image.convert("L")
+    elif options.format == ApiImageFormat.PNG and (
+        image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    ):
+        image = image.convert("RGBA")
+    else:
+        image = image.convert("RGB")
+    if options.max_side is not None and max(image.size) > options.max_side:
+        factor = options.max_side / max(image.size)
+        image = image.resize(
+            (
+                max(1, round(image.width * factor)),
+                max(1, round(image.height * factor)),
+            ),
+            Image.Resampling.LANCZOS,
+        )
+
+    img_io = BytesIO()
+    if options.format == ApiImageFormat.PNG:
+        image.save(img_io, "PNG")
+    elif options.format == ApiImageFormat.JPEG:
+        image.save(img_io, "JPEG", quality=options.quality)
+    else:
+        image.save(img_io, "WEBP", quality=options.quality)
+
+    encoded = EncodedImage(
+        data=img_io.getvalue(),
+        mime_type=f"image/{options.format.value}",
+        encode_time=time.perf_counter() - start,
+    )
+    if cache is not None:
+        cache.put(key, encoded)
+    return encoded
+
 
 def api_image_request(
-    image: Image.Image,
+    image: Union[Image.Image, EncodedImage],
     prompt: str,
     url: AnyUrl,
     timeout: float = 20,
     headers: Optional[dict[str, str]] = None,
+    client: Optional[ApiClient] = None,
+    encoding: Optional[ApiImageEncodingOptions] = None,
     **params,
 ) -> Tuple[str, Optional[int], VlmStopReason]:
-    img_io = BytesIO()
-    image = (
-        image.copy()
-    )  # Fix for inconsistent PIL image width/height to actual byte data
-    image = image.convert("RGBA")
     good_image = True
-    try:
-        image.save(img_io, "PNG")
-    except Exception as e:
-        good_image = False
-        _log.error(f"Error, corrupter PNG of size: {image.size}: {e}")
+    if isinstance(image, Image.Image):
+        try:
+            image = encode_image(image, encoding)
+        except Exception as e:
+            good_image = False
+            _log.error(f"Error, could not encode image of size: {image.size}: {e}")
 
     if good_image:
+        assert isinstance(image, EncodedImage)
         try:
-            image_base64 = base64.b64encode(img_io.getvalue()).decode("utf-8")
-
             messages = [
                 {
                     "role": "user",
                     "content": [
                         {
                             "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{image_base64}"
-                            },
+                            "image_url": {"url": image.data_url()},
                         },
                         {
                             "type": "text",
@@ -63,7 +349,7 @@ def api_image_request(
 
             headers = headers or {}
 
-            r = requests.post(
+            r = (client or get_api_client()).post(
                 str(url),
                 headers=headers,
                 json=payload,
@@ -92,13 +378,15 @@ def api_image_request(
 
 
 def api_image_request_streaming(
-    image: Image.Image,
+    image: Union[Image.Image, EncodedImage],
     prompt: str,
     url: AnyUrl,
     *,
     timeout: float = 20,
     headers: Optional[dict[str, str]] = None,
     generation_stoppers: list[GenerationStopper] = [],
+    client: Optional[ApiClient] = None,
+    encoding: Optional[ApiImageEncodingOptions] = None,
     **params,
 ) -> Tuple[str, Optional[int]]:
     """
@@ -107,9 +395,8 @@ def api_image_request_streaming(
     Accumulates text and calls stopper.should_stop(window) as chunks arrive.
     If stopper triggers, the HTTP connection is closed to abort server-side generation.
     """
-    img_io = BytesIO()
-    image.save(img_io, "PNG")
-    image_b64 = base64.b64encode(img_io.getvalue()).decode("utf-8")
+    if isinstance(image, Image.Image):
+        image = encode_image(image, encoding)
 
     messages = [
         {
@@ -117,7 +404,7 @@ def api_image_request_streaming(
             "content": [
                 {
                     "type": "image_url",
-                    "image_url": {"url": f"data:image/png;base64,{image_b64}"},
+                    "image_url": {"url": image.data_url()},
                 },
                 {"type": "text", "text": prompt},
             ],
@@ -142,7 +429,7 @@ def api_image_request_streaming(
         hdrs["X-Temperature"] = str(params["temperature"])
 
     # Stream the HTTP response
-    with requests.post(
+    with (client or get_api_client()).post(
         str(url), headers=hdrs, json=payload, timeout=timeout, stream=True
     ) as r:
         if not r.ok:
@@ -0,0 +1,70 @@
+from collections.abc import Sequence
+
+import numpy as np
+from docling_core.types.doc import BoundingBox, CoordOrigin
+from docling_core.types.doc.page import TextCell
+
+
+class TextCellIndex:
+    """Bounding boxes of the text cells of a page as NumPy arrays.
+
+    The boxes are converted to top-left origin once, when the index is built, and
+    region lookups are vectorized over all cells. Lookups return cell indices in
+    the order of `cells`, so results match a linear scan over the cells.
+    """
+
+    def __init__(self, cells: Sequence[TextCell], page_height: float):
+        self.source = cells  # the sequence the index was built from
+        self.cells = list(cells)
+        self.page_height = page_height
+
+        rects = np.array(
+            [
+                (
+                    c.rect.r_x0,
+                    c.rect.r_x1,
+                    c.rect.r_x2,
+                    c.rect.r_x3,
+                    c.rect.r_y0,
+                    c.rect.r_y1,
+                    c.rect.r_y2,
+                    c.rect.r_y3,
+                )
+                for c in self.cells
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 8)
+        bottom_left = np.array(
+            [c.rect.coord_origin == CoordOrigin.BOTTOMLEFT for c in self.cells],
+            dtype=bool,
+        )
+        xs, ys = rects[:, :4], rects[:, 4:]
+        ys_min, ys_max = ys.min(axis=1), ys.max(axis=1)
+
+        # Same arithmetic as BoundingRectangle.to_bounding_box() followed by
+        # BoundingBox.to_top_left_origin()
+        self.boxes = np.empty((len(self.cells), 4), dtype=np.float64)  # l, t, r, b
+        self.boxes[:, 0] = xs.min(axis=1)
+        self.boxes[:, 2] = xs.max(axis=1)
+        self.boxes[:, 1] = np.where(bottom_left, page_height - ys_max, ys_min)
+        self.boxes[:, 3] = np.where(bottom_left, page_height - ys_min, ys_max)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def overlap_over_cells(self, bbox: BoundingBox) -> np.ndarray:
+        """Intersection area with `bbox` divided by the area of each cell."""
+        if bbox.coord_origin != CoordOrigin.TOPLEFT:
+            bbox = bbox.to_top_left_origin(page_height=self.page_height)
+        boxes = self.boxes
+        width = np.minimum(boxes[:, 2], bbox.r) - np.maximum(boxes[:, 0], bbox.l)
+        height = np.minimum(boxes[:, 3], bbox.b) - np.maximum(boxes[:, 1], bbox.t)
+        intersection = np.where((width > 0) & (height > 0), width * height, 0.0)
+        area = np.abs(boxes[:, 2] - boxes[:, 0]) * np.abs(boxes[:, 3] - boxes[:, 1])
+        return np.divide(
+            intersection, area, out=np.zeros_like(intersection), where=area > 0
+        )
+
+    def cells_in_bbox(self, bbox: BoundingBox, ios: float) -> np.ndarray:
+        """Indices of the cells whose intersection over self with `bbox` is above `ios`."""
+        return np.flatnonzero(self.overlap_over_cells(bbox) > ios)
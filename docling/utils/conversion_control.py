@@ -0,0 +1,87 @@
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Optional
+
+from pydantic import BaseModel
+
+from docling.exceptions import ConversionCancelled
+
+if TYPE_CHECKING:
+    from docling.datamodel.document import ConversionResult
+
+
+class PageProgressEvent(BaseModel):
+    """Emitted by the PDF pipeline each time a page of a document leaves the last stage."""
+
+    file_name: str
+    document_hash: str
+    page_no: int  # 1-based, as in DoclingDocument.pages
+    pages_done: int
+    pages_total: int
+    failed: bool = False
+
+
+@dataclass
+class ConversionControl:
+    """Progress reporting and cancellation of the conversions run in one context.
+
+    Pipelines pick it up with :py:func:`current_conversion_control`. The
+    StandardPdfPipeline reports every page and, when cancelled, stops feeding pages
+    to its stages and aborts the document once the pages in flight are drained.
+    Other pipelines check for cancellation between their build, assemble and
+    enrich steps.
+    """
+
+    on_page: Optional[Callable[[PageProgressEvent], None]] = None
+    _cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise ConversionCancelled("Conversion was cancelled")
+
+    def page_done(
+        self,
+        conv_res: "ConversionResult",
+        page_no: int,
+        pages_done: int,
+        pages_total: int,
+        failed: bool = False,
+    ) -> None:
+        """Report that the page with 0-based `page_no` went through the pipeline."""
+        if self.on_page is not None:
+            self.on_page(
+                PageProgressEvent(
+                    file_name=conv_res.input.file.name,
+                    document_hash=conv_res.input.document_hash,
+                    page_no=page_no + 1,
+                    pages_done=pages_done,
+                    pages_total=pages_total,
+                    failed=failed,
+                )
+            )
+
+
+_current_control: ContextVar[Optional[ConversionControl]] = ContextVar(
+    "docling_conversion_control", default=None
+)
+
+
+def current_conversion_control() -> Optional[ConversionControl]:
+    return _current_control.get()
+
+
+def set_conversion_control(control: Optional[ConversionControl]):
+    """Set the control of the current context. Returns a token for `reset`."""
+    return _current_control.set(control)
+
+
+def reset_conversion_control(token) -> None:
+    _current_control.reset(token)
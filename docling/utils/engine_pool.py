@@ -0,0 +1,66 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Callable, Generic, List, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+
+class EnginePool(Generic[_T]):
+    """Engine instances checked out by one thread at a time.
+
+    Instances are created when all existing ones are busy, up to `max_size`.
+    Further checkouts wait for an instance to be returned. `close` is called on
+    every instance when the pool is closed.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], _T],
+        max_size: int,
+        close: Optional[Callable[[_T], None]] = None,
+    ):
+        self._factory = factory
+        self._close = close
+        self.max_size = max(1, max_size)
+        self._size = 0  # created or being created
+        self._idle: List[_T] = []
+        self._all: List[_T] = []
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def checkout(self) -> Iterator[_T]:
+        with self._cond:
+            while not self._idle and self._size >= self.max_size:
+                self._cond.wait()
+            if self._idle:
+                engine: Optional[_T] = self._idle.pop()
+            else:
+                self._size += 1
+                engine = None
+
+        if engine is None:
+            try:
+                engine = self._factory()
+            except BaseException:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._all.append(engine)
+
+        try:
+            yield engine
+        finally:
+            with self._cond:
+                self._idle.append(engine)
+                self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._close is not None:
+                for engine in self._all:
+                    self._close(engine)
+            self._all.clear()
+            self._idle.clear()
@@ -1,11 +1,12 @@
-import bisect
 import logging
 import sys
 from collections import defaultdict
+from collections.abc import Sequence
+from typing import Optional
 
+import numpy as np
 from docling_core.types.doc import DocItemLabel, Size
 from docling_core.types.doc.page import TextCell
-from rtree import index
 
 from docling.datamodel.base_models import BoundingBox, Cluster, Page
 from docling.datamodel.pipeline_options import LayoutOptions
@@ -46,41 +47,135 @@ class UnionFind:
         return groups
 
 
+def _box_array(bboxes: Sequence[BoundingBox]) -> np.ndarray:
+    """Boxes as an (n, 4) array of `BoundingBox.as_tuple()` rows.
+
+    The rows are (l, low, r, high) along the y axis of their coordinate origin,
+    which lets the overlap helpers below use the same arithmetic as the
+    `BoundingBox` methods for both origins.
+    """
+    return np.array([bbox.as_tuple() for bbox in bboxes], dtype=np.float64).reshape(
+        -1, 4
+    )
+
+
+def _box_areas(boxes: np.ndarray) -> np.ndarray:
+    """Same as `BoundingBox.area()` for each row."""
+    return np.abs(boxes[:, 2] - boxes[:, 0]) * np.abs(boxes[:, 3] - boxes[:, 1])
+
+
+def _intersection_areas(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """Same as `BoundingBox.intersection_area_with()` for all pairs of rows."""
+    width = np.minimum(boxes1[:, None, 2], boxes2[None, :, 2]) - np.maximum(
+        boxes1[:, None, 0], boxes2[None, :, 0]
+    )
+    height = np.minimum(boxes1[:, None, 3], boxes2[None, :, 3]) - np.maximum(
+        boxes1[:, None, 1], boxes2[None, :, 1]
+    )
+    return np.where((width > 0) & (height > 0), width * height, 0.0)
+
+
+def _intersection_over_self(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """Same as `BoundingBox.intersection_over_self()` of each row of boxes1 with
+    each row of boxes2."""
+    intersection = _intersection_areas(boxes1, boxes2)
+    areas = np.broadcast_to(_box_areas(boxes1)[:, None], intersection.shape)
+    return np.divide(
+        intersection, areas, out=np.zeros_like(intersection), where=areas > 0
+    )
+
+
+def _overlap_matrix(
+    boxes: np.ndarray, overlap_threshold: float, containment_threshold: float
+) -> np.ndarray:
+    """Same as `SpatialClusterIndex.check_overlap()` for all pairs of rows."""
+    areas = _box_areas(boxes)
+    intersection = _intersection_areas(boxes, boxes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iou = intersection / (areas[:, None] + areas[None, :] - intersection + 1.0e-6)
+        containment1 = intersection / areas[:, None]
+        containment2 = intersection / areas[None, :]
+    positive = areas > 0
+    return (
+        positive[:, None]
+        & positive[None, :]
+        & (
+            (iou > overlap_threshold)
+            | (containment1 > containment_threshold)
+            | (containment2 > containment_threshold)
+        )
+    )
+
+
 class SpatialClusterIndex:
-    """Efficient spatial indexing for clusters using R-tree and interval trees."""
+    """Snapshot of cluster bounding boxes for overlap candidate search.
+
+    Candidates are looked up with the bounding boxes the clusters had when they
+    were added, through an R-tree style box intersection and interval trees on
+    both axes. `find_candidates_matrix` runs the lookup for many boxes at once.
+    """
 
     def __init__(self, clusters: list[Cluster]):
-        p = index.Property()
-        p.dimension = 2
-        self.spatial_index = index.Index(properties=p)
         self.x_intervals = IntervalTree()
         self.y_intervals = IntervalTree()
         self.clusters_by_id: dict[int, Cluster] = {}
+        self._ids: list[int] = []
+        self._boxes: list[tuple[float, float, float, float]] = []
+        self._arrays: Optional[tuple[np.ndarray, np.ndarray]] = None
 
         for cluster in clusters:
             self.add_cluster(cluster)
 
     def add_cluster(self, cluster: Cluster):
         bbox = cluster.bbox
-        self.spatial_index.insert(cluster.id, bbox.as_tuple())
+        self._ids.append(cluster.id)
+        self._boxes.append(bbox.as_tuple())
         self.x_intervals.insert(bbox.l, bbox.r, cluster.id)
         self.y_intervals.insert(bbox.t, bbox.b, cluster.id)
         self.clusters_by_id[cluster.id] = cluster
+        self._arrays = None
 
     def remove_cluster(self, cluster: Cluster):
-        self.spatial_index.delete(cluster.id, cluster.bbox.as_tuple())
+        idx = self._ids.index(cluster.id)
+        del self._ids[idx]
+        del self._boxes[idx]
         del self.clusters_by_id[cluster.id]
+        self._arrays = None
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._get_arrays()[0]
+
+    def _get_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (
+                np.array(self._ids, dtype=np.int64),
+                np.array(self._boxes, dtype=np.float64).reshape(-1, 4),
+            )
+        return self._arrays
+
+    def find_candidates_matrix(self, bboxes: Sequence[BoundingBox]) -> np.ndarray:
+        """Boolean (len(bboxes), len(ids)) matrix of potential overlaps with `ids`."""
+        ids, boxes = self._get_arrays()
+        queries = _box_array(bboxes)
+        # Box intersection, boundaries included
+        spatial = (
+            (boxes[None, :, 0] <= queries[:, None, 2])
+            & (boxes[None, :, 2] >= queries[:, None, 0])
+            & (boxes[None, :, 1] <= queries[:, None, 3])
+            & (boxes[None, :, 3] >= queries[:, None, 1])
+        )
+        x = np.array([(b.l, b.r) for b in bboxes], dtype=np.float64).reshape(-1, 2)
+        y = np.array([(b.t, b.b) for b in bboxes], dtype=np.float64).reshape(-1, 2)
+        candidates = spatial
+        for tree, points in ((self.x_intervals, x), (self.y_intervals, y)):
+            for column in range(2):
+                candidates |= tree.find_containing_matrix(points[:, column], ids)
+        return candidates
 
     def find_candidates(self, bbox: BoundingBox) -> set[int]:
         """Find potential overlapping cluster IDs using all indexes."""
-        spatial = set(self.spatial_index.intersection(bbox.as_tuple()))
-        x_candidates = self.x_intervals.find_containing(
-            bbox.l
-        ) | self.x_intervals.find_containing(bbox.r)
-        y_candidates = self.y_intervals.find_containing(
-            bbox.t
-        ) | self.y_intervals.find_containing(bbox.b)
-        return spatial.union(x_candidates).union(y_candidates)
+        return set(self.ids[self.find_candidates_matrix([bbox])[0]].tolist())
 
     def check_overlap(
         self,
@@ -104,51 +199,64 @@ class SpatialClusterIndex:
         )
 
 
-class Interval:
-    """Helper class for sortable intervals."""
-
-    def __init__(self, min_val: float, max_val: float, id: int):
-        self.min_val = min_val
-        self.max_val = max_val
-        self.id = id
-
-    def __lt__(self, other):
-        if isinstance(other, Interval):
-            return self.min_val < other.min_val
-        return self.min_val < other
-
-
 class IntervalTree:
-    """Memory-efficient interval tree for 1D overlap queries."""
+    """Sorted 1D intervals for containment queries.
+
+    A query scans outwards from the first interval starting at or after the point
+    and stops at the first interval on each side which ends before the point.
+    """
 
     def __init__(self):
-        self.intervals: list[Interval] = []  # Sorted by min_val
+        self._intervals: list[tuple[float, float, int]] = []
+        self._arrays: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
 
     def insert(self, min_val: float, max_val: float, id: int):
-        interval = Interval(min_val, max_val, id)
-        bisect.insort(self.intervals, interval)
+        self._intervals.append((min_val, max_val, id))
+        self._arrays = None
+
+    def _get_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            # Stable sort by start, like insertion with bisect.insort
+            intervals = sorted(self._intervals, key=lambda iv: iv[0])
+            self._arrays = (
+                np.array([iv[0] for iv in intervals], dtype=np.float64),
+                np.array([iv[1] for iv in intervals], dtype=np.float64),
+                np.array([iv[2] for iv in intervals], dtype=np.int64),
+            )
+        return self._arrays
+
+    def find_containing_matrix(self, points: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """Boolean (len(points), len(ids)) matrix of the intervals found per point."""
+        mins, maxs, interval_ids = self._get_arrays()
+        n = len(mins)
+        found = np.zeros((len(points), n), dtype=bool)
+        if n > 0 and len(points) > 0:
+            pos = np.searchsorted(mins, points, side="left")
+            positions = np.arange(n)
+            ends_before = maxs[None, :] < points[:, None]
+            before_pos = positions[None, :] < pos[:, None]
+            # The scans stop at the last (backwards) and first (forwards) interval
+            # around pos which ends before the point
+            stop_back = np.where(ends_before & before_pos, positions, -1).max(axis=1)
+            stop_fwd = np.where(ends_before & ~before_pos, positions, n).min(axis=1)
+            found = (
+                (positions[None, :] > stop_back[:, None])
+                & (positions[None, :] < stop_fwd[:, None])
+                & (mins[None, :] <= points[:, None])
+            )
+        # Map the sorted intervals to the columns of `ids`
+        column = {cid: j for j, cid in enumerate(ids.tolist())}
+        result = np.zeros((len(points), len(ids)), dtype=bool)
+        for k, cid in enumerate(interval_ids.tolist()):
+            if cid in column:
+                result[:, column[cid]] |= found[:, k]
+        return result
 
     def find_containing(self, point: float) -> set[int]:
         """Find all intervals containing the point."""
-        pos = bisect.bisect_left(self.intervals, point)
-        result = set()
-
-        # Check intervals starting before point
-        for interval in reversed(self.intervals[:pos]):
-            if interval.min_val <= point <= interval.max_val:
-                result.add(interval.id)
-            else:
-                break
-
-        # Check intervals starting at/after point
-        for interval in self.intervals[pos:]:
-            if point <= interval.max_val:
-                if interval.min_val <= point:
-                    result.add(interval.id)
-            else:
-                break
-
-        return result
+        _, _, interval_ids = self._get_arrays()
+        found = self.find_containing_matrix(np.array([point]), interval_ids)[0]
+        return set(interval_ids[found].tolist())
 
 
 class LayoutPostprocessor:
@@ -169,6 +277,9 @@ class LayoutPostprocessor:
     }
     SPECIAL_TYPES = WRAPPER_TYPES.union({DocItemLabel.PICTURE})
 
+    # Number of cells per overlap matrix in the cell assignment
+    _CELL_CHUNK_SIZE = 2048
+
     CONFIDENCE_THRESHOLDS = {
         DocItemLabel.CAPTION: 0.5,
         DocItemLabel.FOOTNOTE: 0.5,
@@ -218,6 +329,14 @@ class LayoutPostprocessor:
             [c for c in self.special_clusters if c.label in self.WRAPPER_TYPES]
         )
 
+        # Cell geometry, converted from the cells once
+        cell_bboxes = [cell.rect.to_bounding_box() for cell in self.cells]
+        self._cell_boxes = _box_array(cell_bboxes)
+        self._cell_ltrb = np.array(
+            [(b.l, b.t, b.r, b.b) for b in cell_bboxes], dtype=np.float64
+        ).reshape(-1, 4)
+        self._cell_rows = {id(cell): i for i, cell in enumerate(self.cells)}
+
     def postprocess(self) -> tuple[list[Cluster], list[TextCell]]:
         """Main processing pipeline."""
         self.regular_clusters = self._process_regular_clusters()
@@ -333,12 +452,15 @@ class LayoutPostprocessor:
                 )
             ]
 
-        for special in special_clusters:
-            contained = []
-            for cluster in self.regular_clusters:
-                containment = cluster.bbox.intersection_over_self(special.bbox)
-                if containment > 0.8:
-                    contained.append(cluster)
+        containment = _intersection_over_self(
+            _box_array([c.bbox for c in self.regular_clusters]),
+            _box_array([c.bbox for c in special_clusters]),
+        )
+        for j, special in enumerate(special_clusters):
+            contained = [
+                self.regular_clusters[i]
+                for i in np.flatnonzero(containment[:, j] > 0.8)
+            ]
 
             if contained:
                 # Sort contained clusters by minimum cell ID:
@@ -388,23 +510,23 @@ class LayoutPostprocessor:
         """
         wrappers_to_remove = set()
 
-        for wrapper in special_clusters:
-            if wrapper.label not in self.WRAPPER_TYPES:
-                continue  # only treat KEY_VALUE_REGION for now.
-
-            for regular in self.regular_clusters:
-                if regular.label == DocItemLabel.TABLE:
-                    # Calculate overlap
-                    overlap_ratio = wrapper.bbox.intersection_over_self(regular.bbox)
-
-                    conf_diff = wrapper.confidence - regular.confidence
-
-                    # If wrapper is mostly overlapping with a TABLE, remove the wrapper
-                    if (
-                        overlap_ratio > 0.9 and conf_diff < 0.1
-                    ):  # self.OVERLAP_PARAMS["wrapper"]["conf_threshold"]):  # 80% overlap threshold
-                        wrappers_to_remove.add(wrapper.id)
-                        break
+        # only treat KEY_VALUE_REGION for now.
+        wrappers = [c for c in special_clusters if c.label in self.WRAPPER_TYPES]
+        tables = [c for c in self.regular_clusters if c.label == DocItemLabel.TABLE]
+        if wrappers and tables:
+            overlap_ratio = _intersection_over_self(
+                _box_array([c.bbox for c in wrappers]),
+                _box_array([c.bbox for c in tables]),
+            )
+            conf_diff = np.array([[w.confidence] for w in wrappers]) - np.array(
+                [t.confidence for t in tables]
+            )
+            # If wrapper is mostly overlapping with a TABLE, remove the wrapper
+            # (80% overlap threshold, self.OVERLAP_PARAMS["wrapper"]["conf_threshold"])
+            overlapping = ((overlap_ratio > 0.9) & (conf_diff < 0.1)).any(axis=1)
+            wrappers_to_remove = {
+                wrapper.id for wrapper, o in zip(wrappers, overlapping) if o
+            }
 
         # Filter out the identified wrappers
         special_clusters = [
@@ -415,41 +537,36 @@ class LayoutPostprocessor:
 
         return special_clusters
 
-    def _should_prefer_cluster(
-        self, candidate: Cluster, other: Cluster, params: dict
-    ) -> bool:
-        """Determine if candidate cluster should be preferred over other cluster based on rules.
-        Returns True if candidate should be preferred, False if not."""
+    def _preference_matrix(self, clusters: list[Cluster], params: dict) -> np.ndarray:
+        """Whether cluster i should be preferred over cluster j, for all pairs.
 
-        # Rule 1: LIST_ITEM vs TEXT
-        if (
-            candidate.label == DocItemLabel.LIST_ITEM
-            and other.label == DocItemLabel.TEXT
-        ):
-            # Check if areas are similar (within 20% of each other)
-            area_ratio = candidate.bbox.area() / other.bbox.area()
-            area_similarity = abs(1 - area_ratio) < 0.2
-            if area_similarity:
-                return True
-
-        # Rule 2: CODE vs others
-        if candidate.label == DocItemLabel.CODE:
-            # Calculate how much of the other cluster is contained within the CODE cluster
-            containment = other.bbox.intersection_over_self(candidate.bbox)
-            if containment > 0.8:  # other is 80% contained within CODE
-                return True
+        LIST_ITEM is preferred over TEXT of similar area (within 20%), CODE over
+        clusters 80% contained in it. Otherwise a cluster is rejected if it is not
+        much larger than the other and has a clearly lower confidence.
+        """
+        boxes = _box_array([c.bbox for c in clusters])
+        areas = _box_areas(boxes)
+        confidences = np.array([c.confidence for c in clusters])
+        labels = np.array([c.label for c in clusters], dtype=object)
 
-        # If no label-based rules matched, fall back to area/confidence thresholds
-        area_ratio = candidate.bbox.area() / other.bbox.area()
-        conf_diff = other.confidence - candidate.confidence
+        area_ratio = areas[:, None] / areas[None, :]
+        conf_diff = confidences[None, :] - confidences[:, None]
 
-        if (
-            area_ratio <= params["area_threshold"]
-            and conf_diff > params["conf_threshold"]
-        ):
-            return False
-
-        return True  # Default to keeping candidate if no rules triggered rejection
+        # Rule 1: LIST_ITEM vs TEXT
+        list_item_rule = (
+            (labels == DocItemLabel.LIST_ITEM)[:, None]
+            & (labels == DocItemLabel.TEXT)[None, :]
+            & (np.abs(1 - area_ratio) < 0.2)
+        )
+        # Rule 2: CODE vs others, the other is 80% contained within CODE
+        code_rule = (labels == DocItemLabel.CODE)[:, None] & (
+            _intersection_over_self(boxes, boxes).T > 0.8
+        )
+        # If no label-based rules matched, fall back to area/confidence thresholds
+        rejected = (area_ratio <= params["area_threshold"]) & (
+            conf_diff > params["conf_threshold"]
+        )
+        return list_item_rule | code_rule | ~rejected
 
     def _select_best_cluster_from_group(
         self,
@@ -457,32 +574,24 @@ class LayoutPostprocessor:
         params: dict,
     ) -> Cluster:
         """Select best cluster from a group of overlapping clusters based on all rules."""
-        current_best = None
-
-        for candidate in group_clusters:
-            should_select = True
-
-            for other in group_clusters:
-                if other == candidate:
-                    continue
-
-                if not self._should_prefer_cluster(candidate, other, params):
-                    should_select = False
-                    break
-
-            if should_select:
-                if current_best is None:
-                    current_best = candidate
-                else:
-                    # If both clusters pass rules, prefer the larger one unless confidence differs significantly
-                    if (
-                        candidate.bbox.area() > current_best.bbox.area()
-                        and current_best.confidence - candidate.confidence
-                        <= params["conf_threshold"]
-                    ):
-                        current_best = candidate
+        preferred = self._preference_matrix(group_clusters, params)
+        np.fill_diagonal(preferred, True)
+        areas = _box_areas(_box_array([c.bbox for c in group_clusters]))
 
-        return current_best if current_best else group_clusters[0]
+        current_best = None
+        for i in np.flatnonzero(preferred.all(axis=1)):
+            candidate = group_clusters[i]
+            if current_best is None:
+                current_best = i
+            # If both clusters pass rules, prefer the larger one unless confidence differs significantly
+            elif (
+                areas[i] > areas[current_best]
+                and group_clusters[current_best].confidence - candidate.confidence
+                <= params["conf_threshold"]
+            ):
+                current_best = i
+
+        return group_clusters[current_best if current_best is not None else 0]
 
     def _remove_overlapping_clusters(
         self,
@@ -507,19 +616,22 @@ class LayoutPostprocessor:
         uf = UnionFind(valid_clusters.keys())
         params = self.OVERLAP_PARAMS[cluster_type]
 
-        for cluster in clusters:
-            candidates = spatial_index.find_candidates(cluster.bbox)
-            candidates &= valid_clusters.keys()  # Only keep existing candidates
-            candidates.discard(cluster.id)
-
-            for other_id in candidates:
-                if spatial_index.check_overlap(
-                    cluster.bbox,
-                    valid_clusters[other_id].bbox,
-                    overlap_threshold,
-                    containment_threshold,
-                ):
-                    uf.union(cluster.id, other_id)
+        # Candidates come from the index, which holds the boxes the clusters had
+        # when it was built. Only keep existing candidates.
+        bboxes = [c.bbox for c in clusters]
+        position = {c.id: i for i, c in enumerate(clusters)}
+        index_candidates = spatial_index.find_candidates_matrix(bboxes)
+        candidates = np.zeros((len(clusters), len(clusters)), dtype=bool)
+        for k, other_id in enumerate(spatial_index.ids.tolist()):
+            if other_id in position:
+                candidates[:, position[other_id]] |= index_candidates[:, k]
+        np.fill_diagonal(candidates, False)
+
+        overlapping = candidates & _overlap_matrix(
+            _box_array(bboxes), overlap_threshold, containment_threshold
+        )
+        for i, j in zip(*np.nonzero(overlapping)):
+            uf.union(clusters[i].id, clusters[j].id)
 
         result = []
         for group in uf.get_groups().values():
@@ -532,7 +644,7 @@ class LayoutPostprocessor:
 
             # Simple cell merging - no special cases
             for cluster in group_clusters:
-                if cluster != best:
+                if cluster is not best:
                     best.cells.extend(cluster.cells)
 
             best.cells = self._deduplicate_cells(best.cells)
@@ -588,26 +700,25 @@ class LayoutPostprocessor:
         for cluster in clusters:
             cluster.cells = []
 
-        for cell in self.cells:
-            if not cell.text.strip():
-                continue
-
-            best_overlap = min_overlap
-            best_cluster = None
-
-            for cluster in clusters:
-                if cell.rect.to_bounding_box().area() <= 0:
-                    continue
-
-                overlap_ratio = cell.rect.to_bounding_box().intersection_over_self(
-                    cluster.bbox
+        rows = np.array(
+            [i for i, cell in enumerate(self.cells) if cell.text.strip()],
+            dtype=np.int64,
+        )
+        if clusters and len(rows) > 0:
+            cluster_boxes = _box_array([c.bbox for c in clusters])
+            cell_areas = _box_areas(self._cell_boxes)
+            # In chunks of cells, to bound the size of the overlap matrices
+            for start in range(0, len(rows), self._CELL_CHUNK_SIZE):
+                chunk = rows[start : start + self._CELL_CHUNK_SIZE]
+                chunk = chunk[cell_areas[chunk] > 0]
+                overlap = _intersection_over_self(
+                    self._cell_boxes[chunk], cluster_boxes
                 )
-                if overlap_ratio > best_overlap:
-                    best_overlap = overlap_ratio
-                    best_cluster = cluster
-
-            if best_cluster is not None:
-                best_cluster.cells.append(cell)
+                # The first cluster with the largest overlap wins
+                best = overlap.argmax(axis=1)
+                assigned = overlap[np.arange(len(chunk)), best] > min_overlap
+                for row, cluster_idx in zip(chunk[assigned], best[assigned]):
+                    clusters[cluster_idx].cells.append(self.cells[row])
 
         # Deduplicate cells in each cluster after assignment
         for cluster in clusters:
@@ -630,11 +741,12 @@ class LayoutPostprocessor:
             if not cluster.cells:
                 continue
 
+            ltrb = self._cells_ltrb(cluster.cells)
             cells_bbox = BoundingBox(
-                l=min(cell.rect.to_bounding_box().l for cell in cluster.cells),
-                t=min(cell.rect.to_bounding_box().t for cell in cluster.cells),
-                r=max(cell.rect.to_bounding_box().r for cell in cluster.cells),
-                b=max(cell.rect.to_bounding_box().b for cell in cluster.cells),
+                l=float(ltrb[:, 0].min()),
+                t=float(ltrb[:, 1].min()),
+                r=float(ltrb[:, 2].max()),
+                b=float(ltrb[:, 3].max()),
             )
 
             if cluster.label == DocItemLabel.TABLE:
@@ -650,6 +762,14 @@ class LayoutPostprocessor:
 
         return clusters
 
+    def _cells_ltrb(self, cells: list[TextCell]) -> np.ndarray:
+        """(l, t, r, b) of the bounding boxes of the cells."""
+        rows = [self._cell_rows.get(id(cell)) for cell in cells]
+        if all(row is not None for row in rows):
+            return self._cell_ltrb[rows]
+        bboxes = [cell.rect.to_bounding_box() for cell in cells]
+        return np.array([(b.l, b.t, b.r, b.b) for b in bboxes], dtype=np.float64)
+
     def _sort_cells(self, cells: list[TextCell]) -> list[TextCell]:
         """Sort cells in native reading order."""
         return sorted(cells, key=lambda c: (c.index))
@@ -1,3 +1,73 @@
 import threading
+import time
 
-pypdfium2_lock = threading.Lock()
+from pydantic import BaseModel
+
+
+class LockStats(BaseModel):
+    acquisitions: int = 0
+    contended: int = 0  # acquisitions which had to wait for another thread
+    wait_seconds: float = 0.0
+    hold_seconds: float = 0.0
+
+    @property
+    def contention_rate(self) -> float:
+        return self.contended / self.acquisitions if self.acquisitions > 0 else 0.0
+
+
+class InstrumentedLock:
+    """A non-reentrant lock which measures how often and how long it is contended.
+
+    The counters are only updated by the thread holding the lock, so they need no
+    extra synchronization. Use :py:meth:`stats` to read a snapshot.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._stats = LockStats()
+        self._acquired_at = 0.0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        wait = 0.0
+        if not self._lock.acquire(blocking=False):
+            if not blocking:
+                return False
+            start = time.perf_counter()
+            if not self._lock.acquire(timeout=timeout):
+                return False
+            wait = time.perf_counter() - start
+            self._stats.contended += 1
+        self._stats.acquisitions += 1
+        self._stats.wait_seconds += wait
+        self._acquired_at = time.perf_counter()
+        return True
+
+    def release(self) -> None:
+        self._stats.hold_seconds += time.perf_counter() - self._acquired_at
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    def stats(self) -> LockStats:
+        # Taken on the raw lock, so reading the stats does not count as a use
+        with self._lock:
+            return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = LockStats()
+
+
+# pdfium is not thread-safe, not even across different documents, so every call
+# into pypdfium2 in this process goes through this lock. Keep the locked sections
+# to the pdfium calls themselves; to scale beyond one lock, convert in several
+# processes (see `settings.perf.doc_process_workers` and `page_shard_size`).
+pypdfium2_lock = InstrumentedLock("pypdfium2")
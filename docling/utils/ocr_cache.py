@@ -0,0 +1,154 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from docling_core.types.doc import CoordOrigin
+from docling_core.types.doc.page import TextCell
+from PIL import Image
+
+from docling.datamodel.pipeline_options import OcrCacheOptions
+
+_log = logging.getLogger(__name__)
+
+
+def shift_cells(cells: list[TextCell], dx: float, dy: float) -> list[TextCell]:
+    """Copies of top-left origin cells, moved by (dx, dy)."""
+    shifted = []
+    for cell in cells:
+        assert cell.rect.coord_origin == CoordOrigin.TOPLEFT
+        rect = cell.rect.model_copy(
+            update={
+                **{f"r_x{i}": getattr(cell.rect, f"r_x{i}") + dx for i in range(4)},
+                **{f"r_y{i}": getattr(cell.rect, f"r_y{i}") + dy for i in range(4)},
+            }
+        )
+        shifted.append(cell.model_copy(update={"rect": rect}))
+    return shifted
+
+
+class OcrCache:
+    """LRU cache of OCR results, in memory and optionally in a SQLite file.
+
+    The values are the cells recognized in a region, in region-relative page
+    coordinates. Both the memory and the file keep at most `max_entries` results and
+    drop the least recently used ones first.
+    """
+
+    # Evict from the file every so many insertions, not on each one
+    _EVICT_EVERY = 100
+
+    def __init__(self, max_entries: int, path: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, str] = OrderedDict()  # key -> cells JSON
+        self._db: Optional[sqlite3.Connection] = None
+        self._puts = 0
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_cells ("
+                "key TEXT PRIMARY KEY, cells TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS ocr_cells_last_used "
+                "ON ocr_cells (last_used)"
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_options(cls, options: OcrCacheOptions) -> Optional["OcrCache"]:
+        if not options.enabled:
+            return None
+        return cls(max_entries=options.max_entries, path=options.path)
+
+    @staticmethod
+    def make_key(image: Image.Image, engine: str) -> str:
+        """Hash of the exact image pixels and the engine description."""
+        digest = hashlib.sha256()
+        digest.update(engine.encode("utf-8"))
+        digest.update(f"{image.mode}:{image.width}x{image.height}".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[list[TextCell]]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT cells FROM ocr_cells WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    data = row[0]
+                    self._db.execute(
+                        "UPDATE ocr_cells SET last_used = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                    self._db.commit()
+                    self._remember(key, data)
+
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return [TextCell.model_validate(cell) for cell in json.loads(data)]
+
+    def put(self, key: str, cells: list[TextCell]) -> None:
+        data = json.dumps([cell.model_dump(mode="json") for cell in cells])
+        with self._lock:
+            self._remember(key, data)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO ocr_cells (key, cells, last_used) "
+                    "VALUES (?, ?, ?)",
+                    (key, data, time.time()),
+                )
+                self._puts += 1
+                if self._puts % self._EVICT_EVERY == 0:
+                    self._db.execute(
+                        "DELETE FROM ocr_cells WHERE key IN (SELECT key FROM "
+                        "ocr_cells ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,),
+                    )
+                self._db.commit()
+
+    def _remember(self, key: str, data: str) -> None:
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "path": str(self.path) if self.path is not None else None,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,115 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from docling_core.types.doc import BoundingBox
+from PIL.Image import Image
+
+from docling.datamodel.base_models import Page
+
+_log = logging.getLogger(__name__)
+
+
+class PageRasterCache:
+    """Full page renderings shared by the element crops of a document.
+
+    Each (page, scale) is rendered once and the crops are cut from it, instead of
+    rendering every crop through the backend. Renderings are kept in LRU order
+    within `max_bytes`. Pages which alone exceed the budget are not cached and their
+    crops are rendered directly.
+
+    Pages are rendered outside the lock, so a miss does not hold up the hits of
+    other threads. Threads missing the same page wait for the one rendering it.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._images: OrderedDict[tuple[int, float], Image] = OrderedDict()
+        self._bytes = 0
+        self._rendering: dict[tuple[int, float], threading.Event] = {}
+
+    def get_image(
+        self, page: Page, scale: float, cropbox: Optional[BoundingBox] = None
+    ) -> Optional[Image]:
+        """Like `Page.get_image`, with the page rendering served from the cache."""
+        if page._backend is None or scale in page._image_cache:
+            return page.get_image(scale=scale, cropbox=cropbox)
+        assert page.size is not None
+
+        key = (page.page_no, scale)
+        rendering: Optional[threading.Event] = None
+        while True:
+            with self._lock:
+                page_im = self._images.get(key)
+                if page_im is not None:
+                    self._images.move_to_end(key)
+                    self.hits += 1
+                    break
+                in_flight = self._rendering.get(key)
+                if in_flight is None:
+                    self.misses += 1
+                    if self._page_bytes(page, scale) <= self.max_bytes:
+                        rendering = self._rendering[key] = threading.Event()
+                    break
+            # Another thread is rendering the page, look it up again once it is done
+            in_flight.wait()
+
+        if rendering is not None:
+            try:
+                page_im = page._backend.get_page_image(scale=scale)
+                with self._lock:
+                    self._put(key, page_im)
+            finally:
+                with self._lock:
+                    del self._rendering[key]
+                rendering.set()
+
+        if page_im is None:
+            return page._backend.get_page_image(scale=scale, cropbox=cropbox)
+        if cropbox is None:
+            return page_im
+        return page_im.crop(
+            cropbox.to_top_left_origin(page_height=page.size.height)
+            .scaled(scale=scale)
+            .as_tuple()
+        )
+
+    @staticmethod
+    def _page_bytes(page: Page, scale: float) -> int:
+        assert page.size is not None
+        # Backends render RGB
+        return round(page.size.width * scale) * round(page.size.height * scale) * 3
+
+    def _put(self, key: tuple[int, float], image: Image) -> None:
+        if key in self._images:
+            return
+        self._images[key] = image
+        self._bytes += self._image_bytes(image)
+        while self._bytes > self.max_bytes and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self._bytes -= self._image_bytes(evicted)
+
+    @staticmethod
+    def _image_bytes(image: Image) -> int:
+        return image.width * image.height * len(image.getbands())
+
+    def release(self, page_no: int) -> None:
+        """Drop the renderings of a page."""
+        with self._lock:
+            for key in [key for key in self._images if key[0] == page_no]:
+                self._bytes -= self._image_bytes(self._images.pop(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            if self.hits + self.misses > 0:
+                _log.debug(
+                    f"Page raster cache: {self.hits} hits, {self.misses} misses, "
+                    f"{len(self._images)} pages held"
+                )
+            self._images.clear()
+            self._bytes = 0
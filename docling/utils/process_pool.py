@@ -0,0 +1,292 @@
+import logging
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from io import BytesIO
+from multiprocessing.pool import AsyncResult
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Type, Union
+
+from docling.backend.abstract_backend import AbstractDocumentBackend
+from docling.datamodel.backend_options import BackendOptions
+from docling.datamodel.base_models import DocumentStream, InputFormat
+from docling.datamodel.document import (
+    ConversionAssets,
+    ConversionResult,
+    InputDocument,
+    _DocumentConversionInput,
+)
+from docling.datamodel.settings import AppSettings, DocumentLimits, settings
+from docling.utils.result_cache import ConversionResultCache
+
+if TYPE_CHECKING:
+    from docling.datamodel.pipeline_options import PipelineOptions
+    from docling.document_converter import DocumentConverter, FormatOption
+    from docling.pipeline.base_pipeline import BasePipeline
+
+_log = logging.getLogger(__name__)
+
+# Converter owned by the current worker process, created once by _init_worker
+_worker_converter: Optional["DocumentConverter"] = None
+# Pipeline owned by the current page shard worker, created once by _init_shard_worker
+_worker_pipeline: Optional["BasePipeline"] = None
+
+
+# Settings and limits are sent to the workers as plain dicts, so they unpickle even
+# when the settings module was reloaded in the parent process.
+def _apply_settings(app_settings: dict[str, Any]) -> None:
+    parent_settings = AppSettings(**app_settings)
+    for name in AppSettings.model_fields:
+        setattr(settings, name, getattr(parent_settings, name))
+    # Workers convert their documents in-process
+    settings.perf.doc_process_workers = 0
+
+
+def _init_worker(
+    allowed_formats: list[InputFormat],
+    format_options: dict[InputFormat, "FormatOption"],
+    app_settings: dict[str, Any],
+    cache_config: Optional[tuple[Path, int]],
+) -> None:
+    from docling.document_converter import DocumentConverter
+
+    global _worker_converter
+
+    _apply_settings(app_settings)
+
+    result_cache = (
+        ConversionResultCache(cache_dir=cache_config[0], max_size_bytes=cache_config[1])
+        if cache_config is not None
+        else None
+    )
+    _worker_converter = DocumentConverter(
+        allowed_formats=allowed_formats,
+        format_options=format_options,
+        result_cache=result_cache,
+    )
+
+
+def _convert_in_worker(
+    source: Union[Path, str, DocumentStream],
+    headers: Optional[dict[str, str]],
+    limits: Optional[dict[str, Any]],
+    raises_on_error: bool,
+) -> Optional[tuple[InputDocument, bytes]]:
+    assert _worker_converter is not None, "Worker process was not initialized"
+    conv_input = _DocumentConversionInput(
+        path_or_stream_iterator=[source],
+        limits=DocumentLimits.model_validate(limits) if limits is not None else None,
+        headers=headers,
+    )
+    for conv_res in _worker_converter._convert(
+        conv_input, raises_on_error=raises_on_error
+    ):
+        return _dump_result(conv_res)
+    return None
+
+
+def _init_shard_worker(
+    pipeline_cls: Type["BasePipeline"],
+    pipeline_options: "PipelineOptions",
+    app_settings: dict[str, Any],
+) -> None:
+    global _worker_pipeline
+
+    _apply_settings(app_settings)
+    _worker_pipeline = pipeline_cls(pipeline_options)
+
+
+def _build_shard_in_worker(
+    source: Union[Path, bytes],
+    filename: str,
+    backend: Type[AbstractDocumentBackend],
+    backend_options: Optional[BackendOptions],
+    limits: dict[str, Any],
+) -> bytes:
+    assert _worker_pipeline is not None, "Worker process was not initialized"
+    in_doc = InputDocument(
+        path_or_stream=BytesIO(source) if isinstance(source, bytes) else source,
+        format=InputFormat.PDF,
+        backend=backend,
+        backend_options=backend_options,
+        filename=filename,
+        limits=DocumentLimits.model_validate(limits),
+    )
+    if not in_doc.valid:
+        raise RuntimeError(f"Could not open {filename} in the page shard worker")
+    conv_res = ConversionResult(input=in_doc)
+    try:
+        conv_res = _worker_pipeline._build_document(conv_res)
+    finally:
+        _worker_pipeline._unload(conv_res)
+    buf = BytesIO()
+    conv_res.save(filename=buf, indent=None)
+    return buf.getvalue()
+
+
+def _dump_result(conv_res: ConversionResult) -> tuple[InputDocument, bytes]:
+    # The input document is sent without its backend, which only lives in the
+    # worker process and is unloaded once the conversion is done.
+    in_doc = InputDocument.model_construct(
+        **{name: getattr(conv_res.input, name) for name in InputDocument.model_fields}
+    )
+    buf = BytesIO()
+    conv_res.save(filename=buf, indent=None)
+    return in_doc, buf.getvalue()
+
+
+def _load_result(payload: tuple[InputDocument, bytes]) -> ConversionResult:
+    in_doc, data = payload
+    assets = ConversionAssets.load(filename=BytesIO(data))
+    return ConversionResult(
+        input=in_doc,
+        version=assets.version,
+        timestamp=assets.timestamp,
+        status=assets.status,
+        errors=assets.errors,
+        pages=assets.pages,
+        timings=assets.timings,
+        confidence=assets.confidence,
+        document=assets.document,
+    )
+
+
+class ConversionProcessPool:
+    """Pool of worker processes, each holding its own initialized pipelines.
+
+    Sources are handed to the workers as paths, URLs or streams and the results
+    come back in the `ConversionAssets` ZIP format, which is much smaller than
+    pickled pydantic objects. Results are yielded in input order. Workers are
+    started with the "spawn" method and are replaced after `max_tasks_per_worker`
+    documents, if set, to release the memory they accumulated.
+    """
+
+    def __init__(
+        self,
+        allowed_formats: list[InputFormat],
+        format_options: dict[InputFormat, "FormatOption"],
+        num_workers: int,
+        max_tasks_per_worker: Optional[int] = None,
+        result_cache: Optional[ConversionResultCache] = None,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be >= 1")
+        self.num_workers = num_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+
+        cache_config = (
+            (result_cache.cache_dir, result_cache.max_size_bytes)
+            if result_cache is not None
+            else None
+        )
+        ctx = multiprocessing.get_context("spawn")
+        self._pool = ctx.Pool(
+            processes=num_workers,
+            initializer=_init_worker,
+            initargs=(
+                allowed_formats,
+                format_options,
+                settings.model_dump(),
+                cache_config,
+            ),
+            maxtasksperchild=max_tasks_per_worker,
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def convert(
+        self,
+        sources: Iterable[Union[Path, str, DocumentStream]],
+        headers: Optional[dict[str, str]],
+        limits: Optional[DocumentLimits],
+        raises_on_error: bool,
+    ) -> Iterator[ConversionResult]:
+        # Keep every worker busy with one queued document, without reading the
+        # whole source iterator up front.
+        max_in_flight = 2 * self.num_workers
+        limits_dict = limits.model_dump() if limits is not None else None
+        in_flight: deque[AsyncResult] = deque()
+        try:
+            for source in sources:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("ConversionProcessPool is closed")
+                    in_flight.append(
+                        self._pool.apply_async(
+                            _convert_in_worker,
+                            (source, headers, limits_dict, raises_on_error),
+                        )
+                    )
+                if len(in_flight) >= max_in_flight:
+                    if (payload := in_flight.popleft().get()) is not None:
+                        yield _load_result(payload)
+            while in_flight:
+                if (payload := in_flight.popleft().get()) is not None:
+                    yield _load_result(payload)
+        finally:
+            # Results of abandoned documents are simply dropped
+            in_flight.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._pool.terminate()
+
+
+class PageShardPool:
+    """Pool of worker processes building page ranges (shards) of one document.
+
+    Every worker opens its own backend on the document and runs the page-level
+    stages of its own `pipeline_cls` instance on the shards it receives. The built
+    pages come back in the `ConversionAssets` ZIP format, to be merged and
+    assembled by the calling pipeline.
+    """
+
+    def __init__(
+        self,
+        pipeline_cls: Type["BasePipeline"],
+        pipeline_options: "PipelineOptions",
+        num_workers: int,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be >= 1")
+        self.num_workers = num_workers
+        ctx = multiprocessing.get_context("spawn")
+        self._pool = ctx.Pool(
+            processes=num_workers,
+            initializer=_init_shard_worker,
+            initargs=(pipeline_cls, pipeline_options, settings.model_dump()),
+        )
+
+    def submit(
+        self,
+        source: Union[Path, bytes],
+        filename: str,
+        backend: Type[AbstractDocumentBackend],
+        backend_options: Optional[BackendOptions],
+        limits: DocumentLimits,
+    ) -> AsyncResult:
+        return self._pool.apply_async(
+            _build_shard_in_worker,
+            (source, filename, backend, backend_options, limits.model_dump()),
+        )
+
+    @staticmethod
+    def load(data: bytes) -> ConversionAssets:
+        return ConversionAssets.load(filename=BytesIO(data))
+
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self) -> None:
+        self._pool.terminate()
@@ -0,0 +1,188 @@
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Type
+
+from pydantic import BaseModel
+
+from docling.datamodel.base_models import ConversionStatus
+from docling.datamodel.document import ConversionAssets, ConversionResult, InputDocument
+from docling.datamodel.settings import settings
+
+_log = logging.getLogger(__name__)
+
+_CACHE_SUFFIX = ".zip"
+
+
+class ResultCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    size_bytes: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+class ConversionResultCache:
+    """Content-addressed on-disk cache of conversion results.
+
+    Entries are keyed on the input document hash, the pipeline class, the pipeline
+    options hash, the backend class, the document limits and the docling version.
+    They are stored in the `ConversionAssets` zip format and evicted in
+    least-recently-used order once the total size exceeds `max_size_bytes`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_bytes: int = 2 * 1024**3,
+    ):
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir is not None
+            else settings.cache_dir / "conversion_results"
+        )
+        self.max_size_bytes = max_size_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._stats = ResultCacheStats()
+        self._docling_version = importlib.metadata.version("docling")
+
+        # key -> file size, ordered from least to most recently used
+        self._index: OrderedDict[str, int] = OrderedDict()
+        entries = sorted(
+            self.cache_dir.glob(f"*{_CACHE_SUFFIX}"), key=lambda p: p.stat().st_mtime
+        )
+        for path in entries:
+            self._index[path.stem] = path.stat().st_size
+        self._stats.size_bytes = sum(self._index.values())
+        self._stats.entries = len(self._index)
+
+    @property
+    def stats(self) -> ResultCacheStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+    def make_key(
+        self,
+        in_doc: InputDocument,
+        pipeline_cls: Type,
+        options_hash: str,
+    ) -> str:
+        limits = in_doc.limits
+        key_parts = [
+            in_doc.document_hash,
+            in_doc.format.value,
+            f"{pipeline_cls.__module__}.{pipeline_cls.__qualname__}",
+            options_hash,
+            type(in_doc._backend).__qualname__,
+            # page_range may hold a list, which model_dump_json warns about
+            json.dumps(
+                [limits.max_num_pages, limits.max_file_size, list(limits.page_range)]
+            ),
+            self._docling_version,
+        ]
+        return hashlib.sha256(
+            "|".join(key_parts).encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_CACHE_SUFFIX}"
+
+    def get(self, key: str, in_doc: InputDocument) -> Optional[ConversionResult]:
+        """Return the cached result for `key`, attached to `in_doc`, or None."""
+        path = self._path(key)
+        with self._lock:
+            known = key in self._index
+        if not known or not path.exists():
+            with self._lock:
+                self._stats.misses += 1
+                if known:
+                    self._forget(key)
+            return None
+
+        try:
+            assets = ConversionAssets.load(filename=path)
+        except Exception as exc:
+            _log.warning(f"Dropping unreadable conversion cache entry {path}: {exc}")
+            with self._lock:
+                self._stats.misses += 1
+                self._forget(key)
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._stats.hits += 1
+            if key in self._index:
+                self._index.move_to_end(key)
+
+        return ConversionResult(
+            input=in_doc,
+            version=assets.version,
+            timestamp=assets.timestamp,
+            status=assets.status,
+            errors=assets.errors,
+            pages=assets.pages,
+            timings=assets.timings,
+            confidence=assets.confidence,
+            document=assets.document,
+        )
+
+    def put(self, key: str, conv_res: ConversionResult) -> None:
+        """Store a successful result. Other statuses are never cached."""
+        if conv_res.status != ConversionStatus.SUCCESS:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            conv_res.save(filename=tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            _log.warning(f"Could not store conversion result in cache: {exc}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        size = path.stat().st_size
+        with self._lock:
+            self._forget(key)
+            self._index[key] = size
+            self._stats.size_bytes += size
+            self._stats.entries += 1
+            self._stats.stores += 1
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._index.keys()):
+                self._path(key).unlink(missing_ok=True)
+                self._forget(key)
+
+    def _forget(self, key: str) -> None:
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._stats.size_bytes -= size
+            self._stats.entries -= 1
+
+    def _evict(self) -> None:
+        # Keep at least the most recent entry, even if it alone exceeds the budget
+        while self._stats.size_bytes > self.max_size_bytes and len(self._index) > 1:
+            key = next(iter(self._index))
+            self._path(key).unlink(missing_ok=True)
+            self._forget(key)
+            self._stats.evictions += 1
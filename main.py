@@ -1,13 +1,31 @@
 import uvicorn
 import os
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from dotenv import load_dotenv
 
+from converter_pool import ConverterPool
+
 # โหลด .env
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # สร้าง DocumentConverter pool ครั้งเดียวตอน startup และโหลดโมเดลไว้ก่อน
+    # (ตั้งค่าได้ผ่าน CONVERTER_POOL_SIZE / CONVERTER_POOL_MAX_WAITING / CONVERTER_POOL_TIMEOUT)
+    pool = ConverterPool.from_env()
+    await asyncio.to_thread(pool.preload)
+    app.state.converter_pool = pool
+    try:
+        yield
+    finally:
+        pool.close()
+
+
 # สร้าง App หลักเพียงตัวเดียว
-app = FastAPI(title="Unified Document Processing API")
+app = FastAPI(title="Unified Document Processing API", lifespan=lifespan)
 
 # Import Router จากไฟล์ลูก
 # (ข้อควรระวัง: ไฟล์ test_ocr.py และ test_pdf.py ต้องวางอยู่ข้างๆ ไฟล์ main.py)
@@ -25,7 +43,8 @@ def home():
         "endpoints": [
             "/process-org-chart (from test_ocr.py)",
             "/process-document (from test_pdf.py)"
-        ]
+        ],
+        "converter_pool": app.state.converter_pool.stats(),
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+
+class PageRasterizer:
+    """
+    บริการ render หน้า PDF เป็น PIL Image ที่ใช้ร่วมกันระหว่าง Gemini Vision fallback (test_pdf)
+    และ endpoint OCR (test_ocr)
+
+    - render แบบ lazy ทีละหน้า ตาม DPI ที่ขอ
+    - cache ตาม (document_hash, page, dpi) แบบ LRU จำกัดขนาดรวมเป็น byte
+    - สร้าง PIL Image จาก pixmap โดยตรง ไม่ต้อง encode/decode PNG
+    - max_pages: จำนวนหน้าสูงสุดที่ render ต่อเอกสาร (None = ทุกหน้า)
+    """
+
+    def __init__(self, max_cache_bytes=256 * 1024 * 1024, max_pages=None):
+        self.max_cache_bytes = max_cache_bytes
+        self.max_pages = max_pages
+
+        # PyMuPDF ไม่ thread-safe -> render ทีละหน้า
+        self._render_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._cache = OrderedDict()  # (document_hash, page, dpi) -> Image
+        self._cache_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_env(cls):
+        """สร้างจาก Environment Variable (ตั้งค่าใน .env ได้)"""
+        max_pages = os.getenv("RASTER_MAX_PAGES")
+        return cls(
+            max_cache_bytes=int(os.getenv("RASTER_CACHE_MB", "256")) * 1024 * 1024,
+            max_pages=int(max_pages) if max_pages else None,
+        )
+
+    @staticmethod
+    def document_hash(file_bytes):
+        return hashlib.sha256(file_bytes).hexdigest()
+
+    # --------------------------------------------------
+    # Rendering
+    # --------------------------------------------------
+    def _render(self, doc, page_index, dpi):
+        zoom = dpi / 72
+        pix = doc[page_index].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        # pixmap แบบไม่มี alpha เป็น RGB อยู่แล้ว -> สร้าง Image จาก samples ได้เลย
+        return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+    def _get_cached(self, key):
+        with self._cache_lock:
+            img = self._cache.get(key)
+            if img is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return img
+
+    def _put_cached(self, key, img):
+        size = len(img.getbands()) * img.width * img.height
+        with self._cache_lock:
+            if key in self._cache or size > self.max_cache_bytes:
+                return
+            self._cache[key] = img
+            self._cache_bytes += size
+            while self._cache_bytes > self.max_cache_bytes:
+                _, old = self._cache.popitem(last=False)
+                self._cache_bytes -= len(old.getbands()) * old.width * old.height
+
+    def page_count(self, file_bytes):
+        with self._render_lock:
+            with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+                return doc.page_count
+
+    def iter_pages(self, file_bytes, dpi=300, document_hash=None, max_pages=None):
+        """
+        Generator คืน (page_index, Image) ทีละหน้า (render เมื่อถูกขอเท่านั้น)
+        ทั้งเอกสารจึงไม่ถูก render เข้าหน่วยความจำพร้อมกัน
+        """
+        document_hash = document_hash or self.document_hash(file_bytes)
+        max_pages = max_pages if max_pages is not None else self.max_pages
+
+        with self._render_lock:
+            doc = fitz.open(stream=file_bytes, filetype="pdf")
+        try:
+            num_pages = doc.page_count
+            if max_pages is not None:
+                num_pages = min(num_pages, max_pages)
+            for page_index in range(num_pages):
+                key = (document_hash, page_index, dpi)
+                img = self._get_cached(key)
+                if img is None:
+                    with self._render_lock:
+                        img = self._render(doc, page_index, dpi)
+                    self._put_cached(key, img)
+                yield page_index, img
+        finally:
+            with self._render_lock:
+                doc.close()
+
+    def render_pages(self, file_bytes, dpi=300, document_hash=None, max_pages=None):
+        """Render หลายหน้าเป็น list (ใช้กับ fallback ที่ต้องส่งทุกหน้าไปพร้อมกัน)"""
+        return [
+            img
+            for _, img in self.iter_pages(
+                file_bytes, dpi=dpi, document_hash=document_hash, max_pages=max_pages
+            )
+        ]
+
+    def stats(self):
+        with self._cache_lock:
+            return {
+                "entries": len(self._cache),
+                "cache_bytes": self._cache_bytes,
+                "max_cache_bytes": self.max_cache_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "max_pages": self.max_pages,
+            }
+
+
+# instance เดียวใช้ร่วมกันทุก endpoint
+page_rasterizer = PageRasterizer.from_env()
@@ -7,8 +7,8 @@ from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from fastapi.responses import JSONResponse
 from PIL import Image
-import fitz  # PyMuPDF
 import google.generativeai as genai
+from page_raster import page_rasterizer
 
 # ใช้ python-dotenv เพื่อโหลดค่าจากไฟล์ .env (ถ้ามี)
 try:
@@ -41,42 +41,43 @@ else:
 MODEL_NAME = 'gemini-2.5-flash-preview-09-2025'
 model = genai.GenerativeModel(MODEL_NAME)
 
+# จำนวนหน้าที่ render + ส่ง OCR พร้อมกัน (หน้าที่เหลือจะถูก render เมื่อมีหน้าเสร็จ)
+OCR_DPI = 300
+OCR_PAGE_CONCURRENCY = int(os.getenv("OCR_PAGE_CONCURRENCY", "4"))
+
 # ----------------------------
-# PDF / Image → List of PIL Images
+# PDF / Image → PIL Images (ทีละหน้า)
 # ----------------------------
-def pdf_or_image_to_images(file_bytes: bytes, filename):
-    """แปลงไฟล์ PDF หรือรูปภาพให้เป็น list ของ PIL Image"""
-    images = []
+def iter_page_images(file_bytes: bytes, filename):
+    """
+    คืน iterator ของ (page_index, PIL Image) จากไฟล์ PDF หรือรูปภาพ
+    PDF จะถูก render ผ่าน page_rasterizer ทีละหน้าเมื่อถูกขอ (ไม่ render ทั้งไฟล์เข้าหน่วยความจำ)
+    """
     filename_str = filename.decode() if isinstance(filename, bytes) else str(filename)
 
     # PDF Processing
     if filename_str.lower().endswith(".pdf"):
         try:
-            doc = fitz.open("pdf", file_bytes)
+            # เปิดไฟล์ก่อนเพื่อตรวจว่าเป็น PDF ที่ถูกต้อง
+            page_rasterizer.page_count(file_bytes)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Invalid PDF file: {e}")
+        # Render ที่ 300 DPI เพื่อความคมชัดสำหรับการทำ OCR
+        return page_rasterizer.iter_pages(
+            file_bytes, dpi=OCR_DPI, document_hash=page_rasterizer.document_hash(file_bytes)
+        )
 
-        for page in doc:
-            # Render ที่ 300 DPI เพื่อความคมชัดสำหรับการทำ OCR
-            pix = page.get_pixmap(matrix=fitz.Matrix(300/72, 300/72))
-            img = Image.open(io.BytesIO(pix.tobytes("png")))
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-            images.append(img)
-        doc.close()
-    
     # Image Processing
     elif filename_str.lower().endswith((".png", ".jpg", ".jpeg")):
         try:
             img = Image.open(io.BytesIO(file_bytes))
             if img.mode != "RGB":
                 img = img.convert("RGB")
-            images.append(img)
+            return iter([(0, img)])
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Invalid image file: {e}")
     else:
         raise HTTPException(status_code=400, detail="File must be PDF, PNG, or JPG")
-    return images
 
 # ----------------------------
 # Extract JSON from OCR Text
@@ -210,11 +211,36 @@ async def process_page(img: Image.Image, page_number: int):
 # Main async processing logic
 # ----------------------------
 async def process_file_async(file_bytes: bytes, filename):
-    images = pdf_or_image_to_images(file_bytes, filename)
+    page_iter = iter_page_images(file_bytes, filename)
 
-    # สร้าง Task เพื่อรัน OCR ทุกหน้าพร้อมกัน (Parallel Execution)
-    tasks = [process_page(image, idx + 1) for idx, image in enumerate(images)]
-    pages = await asyncio.gather(*tasks)
+    # รัน OCR หลายหน้าพร้อมกัน แต่ render หน้าถัดไปเมื่อมีช่องว่างเท่านั้น
+    # (ไฟล์ scan หลายร้อยหน้าจะไม่ถูก render ค้างไว้ในหน่วยความจำพร้อมกันทั้งหมด)
+    slots = asyncio.Semaphore(OCR_PAGE_CONCURRENCY)
+
+    async def run_page(img, page_number):
+        try:
+            return await process_page(img, page_number)
+        finally:
+            slots.release()
+
+    tasks = []
+    try:
+        while True:
+            await slots.acquire()
+            if any(t.done() and not t.cancelled() and t.exception() for t in tasks):
+                slots.release()
+                break
+            item = await asyncio.to_thread(next, page_iter, None)
+            if item is None:
+                slots.release()
+                break
+            idx, image = item
+            tasks.append(asyncio.create_task(run_page(image, idx + 1)))
+        pages = await asyncio.gather(*tasks)
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        raise
 
     # รวมผลลัพธ์
     all_pairs = []
@@ -226,7 +252,7 @@ async def process_file_async(file_bytes: bytes, filename):
         all_hierarchy.update(p["hierarchy"])
 
     return {
-        "total_pages": len(images),
+        "total_pages": len(pages),
         "combined_pairs": all_pairs,
         "combined_blocks": all_blocks,
         "combined_hierarchy": all_hierarchy,
@@ -3,15 +3,16 @@ import re
 import uuid
 import json
 import asyncio
+import hashlib
 from datetime import datetime
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request
 from fastapi.responses import JSONResponse
-import fitz  # PyMuPDF (ใช้สำหรับ Fallback กรณี Docling พลาด - เฉพาะ PDF)
-from PIL import Image
 import io
 import google.generativeai as genai
-from docling.document_converter import DocumentConverter # นำ Docling กลับมา
+from converter_pool import ConverterPoolBusy
+from page_raster import page_rasterizer  # render PDF เป็นรูปภาพสำหรับ Fallback กรณี Docling พลาด - เฉพาะ PDF
+from docling.datamodel.base_models import DocumentStream
 
 # ใช้ python-dotenv เพื่อโหลดค่าจากไฟล์ .env (ถ้ามี)
 try:
@@ -47,6 +48,23 @@ model = genai.GenerativeModel(MODEL_NAME)
 
 MEILI_URL = "http://10.1.0.150:7700/indexes/documents/documents"
 
+# ขนาดไฟล์อัปโหลดสูงสุด (ไฟล์ถูกอ่านเข้าหน่วยความจำทั้งหมด ไม่เขียนลงดิสก์)
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "100")) * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Magic bytes ของแต่ละนามสกุล (.docx / .xlsx เป็นไฟล์ zip)
+FILE_SIGNATURES = {
+    ".pdf": b"%PDF",
+    ".docx": b"PK\x03\x04",
+    ".xlsx": b"PK\x03\x04",
+}
+
+# Gemini Vision Fallback: ส่งทุกหน้าใน request เดียว
+# VISION_MAX_PAGES: จำกัดจำนวนหน้าที่ render (ไม่ตั้ง = ทุกหน้า), ถ้าถูกตัดจะแจ้งใน response
+VISION_DPI = 300
+_vision_max_pages = os.getenv("VISION_MAX_PAGES")
+VISION_MAX_PAGES = int(_vision_max_pages) if _vision_max_pages else None
+
 # --------------------------------------------------
 # Utilities
 # --------------------------------------------------
@@ -64,22 +82,25 @@ def check_filename_keywords(text, filename):
             return "เนื้อหาสอดคล้อง"
     return "เนื้อหาไม่สอดคล้อง"
 
-def pdf_to_images(file_path):
-    """Fallback: แปลง PDF เป็นรูปภาพกรณี Docling อ่านไม่ออก"""
+def pdf_to_images(file_bytes, file_hash=None):
+    """
+    Fallback: แปลง PDF เป็นรูปภาพกรณี Docling อ่านไม่ออก (render ผ่าน page_rasterizer ที่ใช้ร่วมกับ OCR)
+    คืน (images, จำนวนหน้าทั้งหมดของเอกสาร) เพื่อให้รู้ว่าหน้าถูกตัดด้วย VISION_MAX_PAGES หรือไม่
+    """
     try:
-        doc = fitz.open(file_path)
-        images = []
-        for page in doc:
-            pix = page.get_pixmap(matrix=fitz.Matrix(300/72, 300/72))
-            img = Image.open(io.BytesIO(pix.tobytes("png")))
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-            images.append(img)
-        doc.close()
-        return images
+        images = page_rasterizer.render_pages(
+            file_bytes, dpi=VISION_DPI, document_hash=file_hash, max_pages=VISION_MAX_PAGES
+        )
+        total_pages = page_rasterizer.page_count(file_bytes)
+        if len(images) < total_pages:
+            print(
+                f"Warning: Vision fallback ส่งแค่ {len(images)} จาก {total_pages} หน้า "
+                f"(VISION_MAX_PAGES={VISION_MAX_PAGES})"
+            )
+        return images, total_pages
     except Exception as e:
         print(f"Error converting PDF: {e}")
-        return []
+        return [], 0
 
 # --------------------------------------------------
 # Gemini Logic
@@ -157,7 +178,7 @@ async def analyze_with_gemini(content, is_image=False):
 # --------------------------------------------------
 # MAIN PROCESS FUNCTION
 # --------------------------------------------------
-async def process_document_logic(file_path: str, filename: str):
+async def process_document_logic(file_bytes: bytes, filename: str, converter_pool, file_hash: str):
     
     # 0. Check Key First
     if not GEMINI_API_KEY:
@@ -173,6 +194,7 @@ async def process_document_logic(file_path: str, filename: str):
     full_text = ""
     ai_result = {}
     extraction_method = "Unknown"
+    warning = None  # เช่น Vision fallback ส่งไม่ครบทุกหน้า
     
     # ตรวจสอบนามสกุลไฟล์
     file_ext = os.path.splitext(filename)[1].lower()
@@ -180,10 +202,11 @@ async def process_document_logic(file_path: str, filename: str):
     # 1. พยายามใช้ Docling ก่อน (Docling รองรับ PDF, DOCX, XLSX, HTML, ฯลฯ)
     try:
         print(f"Processing with Docling: {filename}")
-        converter = DocumentConverter()
-        # Docling convert เป็น blocking operation อาจจะช้าถ้าไฟล์ใหญ่
-        # รันใน thread เพื่อไม่ให้ block FastAPI
-        result = await asyncio.to_thread(converter.convert, file_path)
+        # ใช้ converter จาก pool (โหลดโมเดลไว้แล้วตอน startup)
+        # แปลงผ่าน async API ของ Docling -> ไม่ block FastAPI และไม่ยึด thread pool กลาง
+        # ถ้า client ตัดการเชื่อมต่อระหว่างแปลง pipeline จะถูกยกเลิกด้วย
+        source = DocumentStream(name=filename, stream=io.BytesIO(file_bytes))
+        result = await converter_pool.aconvert(source)
         full_text = result.document.export_to_markdown()
         
         if not full_text.strip():
@@ -192,7 +215,11 @@ async def process_document_logic(file_path: str, filename: str):
         # ถ้า Docling สำเร็จ -> ส่ง Text ให้ Gemini วิเคราะห์
         ai_result = await analyze_with_gemini(full_text, is_image=False)
         extraction_method = "Docling"
-        
+
+    except ConverterPoolBusy as e:
+        # Server ยุ่งอยู่ (converter ไม่ว่างและคิวรอเต็ม) -> ให้ client ลองใหม่
+        raise HTTPException(status_code=503, detail=f"Server busy: {e}")
+
     except Exception as e:
         print(f"Docling failed ({e})")
         
@@ -200,11 +227,18 @@ async def process_document_logic(file_path: str, filename: str):
         # ถ้าเป็น PDF: ลองใช้ Gemini Vision (แปลงเป็นรูปภาพ)
         if file_ext == '.pdf':
             print("Switching to Gemini Vision Fallback (PDF only)...")
-            images = pdf_to_images(file_path)
+            images, total_pages = await asyncio.to_thread(
+                pdf_to_images, file_bytes, file_hash
+            )
             if images:
                 ai_result = await analyze_with_gemini(images, is_image=True)
                 full_text = "(Transcribed by Gemini Vision)"
                 extraction_method = "Gemini Vision"
+                if len(images) < total_pages:
+                    warning = (
+                        f"Only the first {len(images)} of {total_pages} pages were "
+                        f"analyzed (VISION_MAX_PAGES={VISION_MAX_PAGES})"
+                    )
             else:
                 ai_result = {"doc_type": "Error", "extracted_info": "Failed both Docling and Vision"}
                 extraction_method = "Failed"
@@ -230,13 +264,15 @@ async def process_document_logic(file_path: str, filename: str):
     data = {
         "id": doc_id,
         "filename_only": filename,
-        "file_path": file_path,
-        "folder_path": os.path.dirname(file_path),
+        "file_path": filename,
+        "folder_path": os.path.dirname(filename),
+        "file_hash": file_hash,
         "date": now_str,
         "filename_check": filename_check,
         "doc_type": doc_type,
         "extracted_info": extracted_info,
-        "extraction_method": extraction_method
+        "extraction_method": extraction_method,
+        "warning": warning,
     }
     return data
 
@@ -244,9 +280,43 @@ async def process_document_logic(file_path: str, filename: str):
 # FastAPI Endpoints
 # --------------------------------------------------
 
+async def read_upload(file: UploadFile, file_ext: str):
+    """
+    อ่านไฟล์อัปโหลดเข้าหน่วยความจำในรอบเดียว (ไม่มี temp file)
+    - จำกัดขนาดไม่เกิน MAX_UPLOAD_BYTES (เกิน -> 413)
+    - คำนวณ sha256 ไปพร้อมกัน
+    - ตรวจ magic bytes ว่าตรงกับนามสกุลไฟล์ (ไม่ตรง -> 400)
+    """
+    hasher = hashlib.sha256()
+    chunks = []
+    size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Max size: {MAX_UPLOAD_BYTES // (1024 * 1024)} MB",
+            )
+        hasher.update(chunk)
+        chunks.append(chunk)
+    file_bytes = b"".join(chunks)
+
+    # PDF อาจมีข้อมูลนำหน้า %PDF ได้เล็กน้อย จึงดูจาก 1024 bytes แรก
+    if FILE_SIGNATURES[file_ext] not in file_bytes[:1024]:
+        raise HTTPException(status_code=400, detail=f"File content is not a valid {file_ext} file")
+
+    return file_bytes, hasher.hexdigest()
+
+
+def get_converter_pool(request: Request):
+    pool = getattr(request.app.state, "converter_pool", None)
+    if pool is None:
+        raise HTTPException(status_code=503, detail="Converter pool is not ready")
+    return pool
+
 # Endpoint ใหม่ รองรับทุกไฟล์
 @router.post("/process-document")
-async def process_document(file: UploadFile = File(...)):
+async def process_document(request: Request, file: UploadFile = File(...)):
     
     # ตรวจสอบนามสกุลไฟล์เบื้องต้น
     allowed_extensions = ['.pdf', '.docx', '.xlsx']
@@ -255,22 +325,16 @@ async def process_document(file: UploadFile = File(...)):
     if file_ext not in allowed_extensions:
          raise HTTPException(status_code=400, detail=f"Unsupported file type. Allowed: {allowed_extensions}")
 
-    safe_filename = f"temp_{uuid.uuid4()}{file_ext}"
-    with open(safe_filename, "wb") as f:
-        f.write(await file.read())
-
-    try:
-        result = await process_document_logic(safe_filename, file.filename)
-    finally:
-        if os.path.exists(safe_filename):
-            os.remove(safe_filename)
+    converter_pool = get_converter_pool(request)
 
-    return result
+    # ส่งไฟล์ให้ Docling เป็น DocumentStream ในหน่วยความจำ (ไม่ต้องเขียน/ลบ temp file)
+    file_bytes, file_hash = await read_upload(file, file_ext)
+    return await process_document_logic(file_bytes, file.filename, converter_pool, file_hash)
 
 # Endpoint เก่า (เก็บไว้เพื่อ Backward Compatibility)
 @router.post("/process-pdf")
-async def process_pdf(file: UploadFile = File(...)):
-    return await process_document(file)
+async def process_pdf(request: Request, file: UploadFile = File(...)):
+    return await process_document(request, file)
 
 
 @router.get("/")
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Type
+
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.backend.pdf_backend import PdfDocumentBackend
+from docling.datamodel.base_models import InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.models.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+
+
+def load_pages(
+    path: Path,
+    page_nos: list[int],
+    backend: Type[PdfDocumentBackend] = DoclingParseV4DocumentBackend,
+) -> tuple[ConversionResult, list[Page]]:
+    """Pages of a PDF with their backend loaded and their size set."""
+    in_doc = InputDocument(path_or_stream=path, format=InputFormat.PDF, backend=backend)
+    conv_res = ConversionResult(input=in_doc)
+    pages = []
+    for page_no in page_nos:
+        page = Page(page_no=page_no)
+        page._backend = in_doc._backend.load_page(page_no)
+        page.size = page._backend.get_size()
+        pages.append(page)
+    return conv_res, pages
+
+
+def preprocessed_pages(
+    path: Path, page_nos: list[int]
+) -> tuple[ConversionResult, list[Page]]:
+    """Pages as they leave the preprocessing stage of the PDF pipeline."""
+    conv_res, pages = load_pages(path, page_nos)
+    preprocessing = PagePreprocessingModel(PagePreprocessingOptions(images_scale=1.0))
+    return conv_res, list(preprocessing(conv_res, pages))
+
+
+def unload_pages(conv_res: ConversionResult, pages: list[Page]) -> None:
+    for page in pages:
+        if page._backend is not None:
+            page._backend.unload()
+    conv_res.input._backend.unload()
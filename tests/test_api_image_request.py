@@ -0,0 +1,268 @@
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from docling.datamodel.accelerator_options import AcceleratorOptions
+from docling.datamodel.base_models import VlmStopReason
+from docling.datamodel.pipeline_options import PictureDescriptionApiOptions
+from docling.datamodel.pipeline_options_vlm_model import (
+    ApiImageEncodingOptions,
+    ApiImageFormat,
+    ApiVlmOptions,
+    ResponseFormat,
+)
+from docling.datamodel.settings import settings
+from docling.models.api_vlm_model import ApiVlmModel
+from docling.models.picture_description_api_model import PictureDescriptionApiModel
+from docling.utils.api_image_request import (
+    ApiClient,
+    api_image_request,
+    encode_image,
+    get_api_executor,
+    map_requests,
+)
+
+
+class _ChatCompletionsHandler(BaseHTTPRequestHandler):
+    """Stand-in OpenAI-compatible chat completions endpoint."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        payload = json.loads(body)
+        with server.lock:  # type: ignore[attr-defined]
+            server.bodies.append(body)  # type: ignore[attr-defined]
+            server.connections.add(self.client_address)  # type: ignore[attr-defined]
+            server.requests += 1  # type: ignore[attr-defined]
+            fail = server.failures > 0  # type: ignore[attr-defined]
+            if fail:
+                server.failures -= 1  # type: ignore[attr-defined]
+
+        if fail:
+            body = b"busy"
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+        else:
+            prompt = payload["messages"][0]["content"][1]["text"]
+            body = json.dumps(
+                {
+                    "id": "chatcmpl-1",
+                    "created": 0,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": prompt},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": 1,
+                        "completion_tokens": 1,
+                        "total_tokens": 2,
+                    },
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionsHandler)
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    server.connections = set()  # type: ignore[attr-defined]
+    server.requests = 0  # type: ignore[attr-defined]
+    server.failures = 0  # type: ignore[attr-defined]
+    server.bodies = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+
+
+def test_requests_reuse_one_connection(server):
+    client = ApiClient(backoff_factor=0)
+    image = Image.new("RGB", (8, 8), "white")
+
+    for ix in range(5):
+        text, num_tokens, stop_reason = api_image_request(
+            image=image, prompt=f"prompt {ix}", url=_url(server), client=client
+        )
+        assert text == f"prompt {ix}"
+        assert num_tokens == 2
+        assert stop_reason == VlmStopReason.END_OF_SEQUENCE
+
+    assert server.requests == 5
+    assert len(server.connections) == 1
+    stats = client.metrics()[_url(server)]
+    assert (stats.requests, stats.errors, stats.retries) == (5, 0, 0)
+    assert stats.bytes_sent == sum(len(body) for body in server.bodies)
+    assert 0 < stats.max_seconds <= stats.total_seconds
+    client.close()
+
+
+def test_busy_responses_are_retried(server):
+    client = ApiClient(max_retries=2, backoff_factor=0)
+    image = Image.new("RGB", (8, 8), "white")
+
+    server.failures = 2
+    text, _, _ = api_image_request(
+        image=image, prompt="hello", url=_url(server), client=client
+    )
+    assert text == "hello"
+    assert server.requests == 3
+
+    # Out of retries: the error response is returned
+    server.failures = 3
+    text, _, stop_reason = api_image_request(
+        image=image, prompt="hello", url=_url(server), client=client
+    )
+    assert text == ""
+    assert stop_reason == VlmStopReason.UNSPECIFIED
+
+    stats = client.metrics()[_url(server)]
+    assert (stats.requests, stats.errors, stats.retries) == (2, 1, 4)
+    client.close()
+
+
+def test_picture_description_shares_the_api_executor(server):
+    model = PictureDescriptionApiModel(
+        enabled=True,
+        enable_remote_services=True,
+        artifacts_path=None,
+        options=PictureDescriptionApiOptions(
+            url=_url(server), prompt="describe", concurrency=2
+        ),
+        accelerator_options=AcceleratorOptions(),
+    )
+    executor = get_api_executor()
+    images = [Image.new("RGB", (8, 8), "white") for _ in range(3)]
+
+    for _ in range(2):
+        assert list(model._annotate_images(images)) == ["describe"] * 3
+    assert get_api_executor() is executor
+    assert server.requests == 6
+    assert len(server.connections) <= 2
+
+
+def test_map_requests_bounds_the_calls_in_flight():
+    lock = threading.Lock()
+    active = max_active = 0
+    release = threading.Event()
+
+    def _call(item: int) -> int:
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        release.wait(5)
+        with lock:
+            active -= 1
+        return item * 2
+
+    taken: list[int] = []
+
+    def _items():
+        for item in range(6):
+            taken.append(item)
+            yield item
+
+    results = map_requests(_call, _items(), concurrency=2)
+    release.set()
+    assert list(results) == [0, 2, 4, 6, 8, 10]
+    assert max_active <= 2
+
+    # Items are only taken as the calls finish, and closing cancels the rest
+    release.clear()
+    taken.clear()
+    results = map_requests(_call, _items(), concurrency=2)
+    threading.Timer(0.1, release.set).start()
+    assert next(results) == 0
+    assert taken == [0, 1, 2]
+    results.close()
+    assert taken == [0, 1, 2]
+
+
+def _scan(width: int = 400, height: int = 300) -> Image.Image:
+    rng = np.random.default_rng(0)
+    pixels = rng.normal(230, 20, (height, width, 3)).clip(0, 255).astype(np.uint8)
+    pixels[100:110, 50:350] = 20  # a line of "text"
+    return Image.fromarray(pixels)
+
+
+def _decode(data_url: str) -> Image.Image:
+    return Image.open(BytesIO(base64.b64decode(data_url.split(",", 1)[1])))
+
+
+def test_image_encoding_options(monkeypatch):
+    monkeypatch.setattr(settings.perf, "api_image_cache_mb", 64)
+    scan = _scan()
+    png = encode_image(scan)
+    assert png.mime_type == "image/png"
+    assert np.array_equal(np.asarray(_decode(png.data_url())), np.asarray(scan))
+
+    jpeg = encode_image(
+        scan,
+        ApiImageEncodingOptions(format=ApiImageFormat.JPEG, quality=70, max_side=200),
+    )
+    assert jpeg.data_url().startswith("data:image/jpeg;base64,")
+    assert len(jpeg.data) < len(png.data) / 4
+    assert _decode(jpeg.data_url()).size == (200, 150)
+
+    webp = encode_image(
+        scan, ApiImageEncodingOptions(format=ApiImageFormat.WEBP, grayscale=True)
+    )
+    assert webp.mime_type == "image/webp"
+    # WebP decodes to RGB, with the channels equal
+    pixels = np.asarray(_decode(webp.data_url()).convert("RGB")).astype(int)
+    assert np.abs(pixels[..., 0] - pixels[..., 1]).max() <= 2
+
+    # The same pixels with the same options are encoded once
+    again = encode_image(scan.copy())
+    assert again.cached and again.encode_time == 0
+    assert again.data == png.data
+    assert not encode_image(scan, ApiImageEncodingOptions(quality=50)).cached
+
+    # Nothing is cached when the cache is off
+    monkeypatch.setattr(settings.perf, "api_image_cache_mb", 0)
+    assert not encode_image(scan).cached
+
+
+def test_vlm_predictions_report_the_encoded_size(server):
+    model = ApiVlmModel(
+        enabled=True,
+        enable_remote_services=True,
+        vlm_options=ApiVlmOptions(
+            url=_url(server),
+            prompt="convert",
+            response_format=ResponseFormat.MARKDOWN,
+            image_encoding=ApiImageEncodingOptions(format=ApiImageFormat.JPEG),
+        ),
+    )
+    predictions = list(model.process_images([_scan(), _scan(200, 100)], "convert"))
+
+    assert [p.text for p in predictions] == ["convert", "convert"]
+    for prediction, body in zip(predictions, server.bodies):
+        data_url = json.loads(body)["messages"][0]["content"][0]["image_url"]["url"]
+        assert data_url.startswith("data:image/jpeg;base64,")
+        assert prediction.input_image_bytes == len(base64.b64decode(data_url[23:]))
+        assert prediction.input_image_encode_time >= 0
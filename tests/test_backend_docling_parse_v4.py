@@ -70,6 +70,37 @@ def test_get_text_from_rect(test_doc_path):
     doc_backend.unload()
 
 
+def test_get_text_in_rect_follows_replaced_cells():
+    doc_backend = _get_backend(Path("./tests/data/pdf/redp5110_sampled.pdf"))
+    page_backend: DoclingParseV4PageBackend = doc_backend.load_page(0)
+    size = page_backend.get_size()
+    cells = list(page_backend.get_text_cells())
+
+    def reference(bbox):
+        return " ".join(
+            cell.text
+            for cell in page_backend.get_text_cells()
+            if cell.rect.to_bounding_box().intersection_over_self(bbox) > 0.5
+        )
+
+    rects = [
+        BoundingBox(l=0, t=0, r=size.width, b=size.height),
+        BoundingBox(l=0, t=0, r=size.width / 2, b=size.height / 3),
+        BoundingBox(l=size.width / 4, t=size.height / 2, r=size.width, b=size.height),
+    ]
+    for bbox in rects:
+        assert page_backend.get_text_in_rect(bbox) == reference(bbox)
+    assert page_backend.get_text_in_rect(rects[0]) != ""
+
+    # OCR and layout postprocessing replace the textline cells of the page
+    page_backend.get_segmented_page().textline_cells = cells[: len(cells) // 2]
+    for bbox in rects:
+        assert page_backend.get_text_in_rect(bbox) == reference(bbox)
+
+    page_backend.unload()
+    doc_backend.unload()
+
+
 def test_crop_page_image(test_doc_path):
     doc_backend = _get_backend(test_doc_path)
     page_backend: DoclingParseV4PageBackend = doc_backend.load_page(0)
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+
+import pytest
+
+from converter_pool import ConverterPool, ConverterPoolBusy
+
+
+class _FakeConverter:
+    def initialize_pipeline(self, fmt):
+        pass
+
+    async def convert_async(self, source, **kwargs):
+        yield source
+
+
+def _pool(factory=_FakeConverter, **kwargs) -> ConverterPool:
+    return ConverterPool(preload_formats=(), converter_factory=factory, **kwargs)
+
+
+def test_cancelled_aconvert_leaves_the_converter_in_the_pool():
+    pool = _pool(size=1)
+    pool.preload()
+
+    async def cancel_while_waiting():
+        converter = pool.acquire()
+        task = asyncio.create_task(pool.aconvert("doc"))
+        await asyncio.sleep(0.05)
+        assert pool.stats()["waiting"] == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        pool.release(converter)
+
+        # The converter is handed to the next request, not to the cancelled one
+        assert pool.stats()["idle"] == 1
+        assert await pool.aconvert("doc") is None
+
+    asyncio.run(cancel_while_waiting())
+    assert pool.stats()["idle"] == 1
+    assert pool.stats()["waiting"] == 0
+
+
+def test_converter_created_for_a_cancelled_aconvert_returns_to_the_pool():
+    loading = threading.Event()
+    loaded = threading.Event()
+
+    def slow_factory():
+        loading.set()
+        loaded.wait(5)
+        return _FakeConverter()
+
+    pool = _pool(slow_factory, size=1)
+
+    async def cancel_while_loading():
+        task = asyncio.create_task(pool.aconvert("doc"))
+        await asyncio.to_thread(loading.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        loaded.set()
+        # A second request gets the converter once it is loaded
+        assert await asyncio.wait_for(pool.aconvert("doc"), 5) is None
+
+    asyncio.run(cancel_while_loading())
+    assert pool.stats() == {
+        "size": 1,
+        "created": 1,
+        "idle": 1,
+        "waiting": 0,
+        "max_waiting": 8,
+    }
+
+
+def test_aconvert_waits_on_the_event_loop_up_to_the_timeout():
+    pool = _pool(size=1, max_waiting=1, acquire_timeout=0.2)
+    pool.preload()
+    converter = pool.acquire()
+
+    async def wait_for_busy_pool():
+        first = asyncio.create_task(pool.aconvert("doc"))
+        await asyncio.sleep(0.05)
+        # Only one request may wait
+        with pytest.raises(ConverterPoolBusy):
+            await pool.aconvert("doc")
+        with pytest.raises(ConverterPoolBusy):
+            await first
+
+    threads_before = threading.active_count()
+    asyncio.run(wait_for_busy_pool())
+    assert threading.active_count() == threads_before
+    pool.release(converter)
+    assert pool.stats()["idle"] == 1
+    assert pool.stats()["waiting"] == 0
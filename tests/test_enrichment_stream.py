@@ -0,0 +1,172 @@
+import threading
+from pathlib import Path
+
+import pytest
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    NodeItem,
+    ProvenanceItem,
+    TextItem,
+)
+
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cluster,
+    ConversionStatus,
+    FigureElement,
+    InputFormat,
+    Page,
+    TextElement,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import PipelineOptions
+from docling.models.base_model import BaseEnrichmentModel
+from docling.pipeline.base_pipeline import BasePipeline
+from docling.pipeline.standard_pdf_pipeline import ThreadedItem, _release_page_resources
+
+from .page_utils import load_pages, unload_pages
+
+
+class _RecordingModel(BaseEnrichmentModel):
+    def __init__(self, name: str, label: DocItemLabel, batch_size: int, events):
+        self.name = name
+        self.label = label
+        self.elements_batch_size = batch_size
+        self.events = events
+        self.batches: list[list[str]] = []
+        self.threads: set[str] = set()
+        self.fail = False
+
+    def is_processable(self, doc: DoclingDocument, element: NodeItem) -> bool:
+        return isinstance(element, TextItem) and element.label == self.label
+
+    def __call__(self, doc, element_batch):
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        self.threads.add(threading.current_thread().name)
+        self.batches.append([element.text for element in element_batch])
+        for element in element_batch:
+            self.events.append((self.name, element.text))
+            yield element
+
+
+class _RecordingPipeline(BasePipeline):
+    def __init__(self, models, events):
+        super().__init__(PipelineOptions())
+        self.enrichment_pipe = models
+        self.events = events
+
+    def _build_document(self, conv_res):
+        return conv_res
+
+    def _release_enriched_page(self, conv_res, page):
+        super()._release_enriched_page(conv_res, page)
+        self.events.append(("release", page.page_no))
+
+    def _determine_status(self, conv_res):
+        return ConversionStatus.SUCCESS
+
+    @classmethod
+    def get_default_options(cls):
+        return PipelineOptions()
+
+    @classmethod
+    def is_backend_supported(cls, backend):
+        return True
+
+
+def _conversion_result(layout: list[list[DocItemLabel]]) -> ConversionResult:
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/pdf/multi_page.pdf"),
+        format=InputFormat.PDF,
+        backend=DoclingParseV4DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    doc = DoclingDocument(name="stream")
+    for page_ix, labels in enumerate(layout):
+        conv_res.pages.append(Page(page_no=page_ix))
+        for item_ix, label in enumerate(labels):
+            doc.add_text(
+                label=label,
+                text=f"{page_ix}.{item_ix}",
+                prov=ProvenanceItem(
+                    page_no=page_ix + 1,
+                    bbox=BoundingBox(l=0, t=10, r=10, b=0),
+                    charspan=(0, 3),
+                ),
+            )
+    conv_res.document = doc
+    return conv_res
+
+
+def test_items_stream_through_the_models_in_order():
+    F, C, T = DocItemLabel.FORMULA, DocItemLabel.CODE, DocItemLabel.TEXT
+    conv_res = _conversion_result([[F, C, F], [T, T], [C, F, F, C], [F]])
+    events: list = []
+    formula = _RecordingModel("formula", F, batch_size=2, events=events)
+    code = _RecordingModel("code", C, batch_size=3, events=events)
+    pipeline = _RecordingPipeline([formula, code], events)
+
+    pipeline._enrich_document(conv_res)
+    conv_res.input._backend.unload()
+
+    # Each model gets its own items in document order, in its own batch size
+    assert formula.batches == [["0.0", "0.2"], ["2.1", "2.2"], ["3.0"]]
+    assert code.batches == [["0.1", "2.0", "2.3"]]
+    assert formula.threads != code.threads
+
+    # The page without items is released first, the others once their items are
+    # enriched
+    assert events[0] == ("release", 1)
+    for page_no in (0, 2, 3):
+        released = events.index(("release", page_no))
+        assert all(
+            ix < released
+            for ix, (_, text) in enumerate(events)
+            if isinstance(text, str) and text.startswith(f"{page_no}.")
+        )
+    assert sorted(e[1] for e in events if e[0] == "release") == [0, 1, 2, 3]
+    assert conv_res._page_rasters is None
+
+
+def test_stage_errors_are_raised():
+    F, C = DocItemLabel.FORMULA, DocItemLabel.CODE
+    conv_res = _conversion_result([[F, C], [C, F]])
+    events: list = []
+    formula = _RecordingModel("formula", F, batch_size=1, events=events)
+    code = _RecordingModel("code", C, batch_size=1, events=events)
+    code.fail = True
+    pipeline = _RecordingPipeline([formula, code], events)
+
+    with pytest.raises(RuntimeError, match="code failed"):
+        pipeline._enrich_document(conv_res)
+    conv_res.input._backend.unload()
+
+
+def test_build_keeps_only_the_backends_of_pages_to_enrich():
+    conv_res, pages = load_pages(Path("./tests/data/pdf/multi_page.pdf"), [0, 1])
+    for page, (element_type, label) in zip(
+        pages,
+        [(TextElement, DocItemLabel.TEXT), (FigureElement, DocItemLabel.PICTURE)],
+    ):
+        cluster = Cluster(id=0, label=label, bbox=BoundingBox(l=0, t=0, r=1, b=1))
+        element = element_type(
+            label=label, id=0, page_no=page.page_no, cluster=cluster, text=""
+        )
+        page.assembled = AssembledUnit(elements=[element])
+        _release_page_resources(
+            ThreadedItem(
+                payload=page, run_id=1, page_no=page.page_no, conv_res=conv_res
+            ),
+            keep_images=False,
+            keep_backend=True,
+            keep_parsed_pages=False,
+            backend_labels=frozenset({DocItemLabel.PICTURE}),
+        )
+
+    assert pages[0]._backend is None
+    assert pages[1]._backend is not None
+    unload_pages(conv_res, pages)
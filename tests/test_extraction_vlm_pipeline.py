@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.document import InputDocument
+from docling.datamodel.pipeline_options import VlmExtractionPipelineOptions
+from docling.datamodel.pipeline_options_vlm_model import (
+    ApiVlmOptions,
+    ResponseFormat,
+)
+from docling.pipeline.extraction_vlm_pipeline import ExtractionVlmPipeline
+
+DELAY = 0.3
+
+
+class _SlowExtractionHandler(BaseHTTPRequestHandler):
+    """Chat completions endpoint answering each request after a delay."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with server.lock:  # type: ignore[attr-defined]
+            server.requests += 1  # type: ignore[attr-defined]
+            request_no = server.requests  # type: ignore[attr-defined]
+            server.active += 1  # type: ignore[attr-defined]
+            server.max_active = max(server.max_active, server.active)  # type: ignore[attr-defined]
+
+        # Earlier requests take longer, so the answers come back out of order
+        time.sleep(DELAY * (2 if request_no == 1 else 1))
+        with server.lock:  # type: ignore[attr-defined]
+            server.active -= 1  # type: ignore[attr-defined]
+            server.answered += 1  # type: ignore[attr-defined]
+
+        content = json.dumps({"request": request_no})
+        body = json.dumps(
+            {
+                "id": "chatcmpl-1",
+                "created": 0,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 1,
+                    "completion_tokens": 1,
+                    "total_tokens": 2,
+                },
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowExtractionHandler)
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    server.requests = 0  # type: ignore[attr-defined]
+    server.active = 0  # type: ignore[attr-defined]
+    server.max_active = 0  # type: ignore[attr-defined]
+    server.answered = 0  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pages_are_requested_concurrently_in_a_bounded_window(server):
+    pipeline = ExtractionVlmPipeline(
+        VlmExtractionPipelineOptions(
+            enable_remote_services=True,
+            vlm_options=ApiVlmOptions(
+                url=f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions",
+                prompt="",
+                scale=0.5,
+                response_format=ResponseFormat.MARKDOWN,
+                concurrency=2,
+            ),
+        )
+    )
+    rendered: list[int] = []
+    iter_page_images = pipeline._iter_page_images
+
+    def _iter_recorded(input_doc):
+        for page_no, image in iter_page_images(input_doc):
+            # Pages are rendered as the window frees up: at most one page waits
+            # for a slot while two are in flight
+            with server.lock:
+                assert server.answered >= page_no - 3
+            rendered.append(page_no)
+            yield page_no, image
+
+    pipeline._iter_page_images = _iter_recorded  # type: ignore[method-assign]
+
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/pdf/multi_page.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    start = time.monotonic()
+    ext_res = pipeline.execute(in_doc, raises_on_error=True, template="{}")
+    elapsed = time.monotonic() - start
+    in_doc._backend.unload()
+
+    assert rendered == [1, 2, 3, 4, 5]
+    assert server.max_active == 2
+    # 6 delays of work over 2 connections
+    assert elapsed < 5 * DELAY
+
+    # Collected in page order, whatever order the answers came back in
+    assert [page.page_no for page in ext_res.pages] == [1, 2, 3, 4, 5]
+    answers = [page.extracted_data["request"] for page in ext_res.pages]
+    assert sorted(answers) == [1, 2, 3, 4, 5]
+    assert ext_res.status == ConversionStatus.SUCCESS
@@ -0,0 +1,158 @@
+import bisect
+import random
+
+import numpy as np
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, Size
+from docling_core.types.doc.page import (
+    BoundingRectangle,
+    PdfPageGeometry,
+    SegmentedPdfPage,
+    TextCell,
+)
+
+from docling.datamodel.base_models import Cluster, Page
+from docling.datamodel.pipeline_options import LayoutOptions
+from docling.utils.layout_postprocessor import (
+    IntervalTree,
+    LayoutPostprocessor,
+    SpatialClusterIndex,
+    _box_array,
+    _intersection_over_self,
+    _overlap_matrix,
+)
+
+
+def _random_boxes(rng: random.Random, n: int, origin: CoordOrigin):
+    boxes = []
+    for _ in range(n):
+        left, lo = rng.uniform(0, 100), rng.uniform(0, 100)
+        right, hi = left + rng.choice([0, rng.uniform(0, 50)]), lo + rng.uniform(0, 50)
+        if origin == CoordOrigin.TOPLEFT:
+            boxes.append(BoundingBox(l=left, t=lo, r=right, b=hi, coord_origin=origin))
+        else:
+            boxes.append(BoundingBox(l=left, t=hi, r=right, b=lo, coord_origin=origin))
+    return boxes
+
+
+def test_overlap_matrices_match_bounding_box_methods():
+    rng = random.Random(42)
+    for origin in (CoordOrigin.TOPLEFT, CoordOrigin.BOTTOMLEFT):
+        boxes = _random_boxes(rng, 40, origin)
+        array = _box_array(boxes)
+
+        ios = _intersection_over_self(array, array)
+        overlap = _overlap_matrix(array, 0.8, 0.8)
+        index = SpatialClusterIndex([])
+        for i, a in enumerate(boxes):
+            for j, b in enumerate(boxes):
+                assert ios[i, j] == a.intersection_over_self(b)
+                assert overlap[i, j] == index.check_overlap(a, b, 0.8, 0.8)
+
+
+def _scan_containing(intervals, point):
+    # Reference: the bisect-based scan the interval tree has always done
+    intervals = sorted(intervals, key=lambda iv: iv[0])
+    pos = bisect.bisect_left([iv[0] for iv in intervals], point)
+    result = set()
+    for min_val, max_val, id in reversed(intervals[:pos]):
+        if min_val <= point <= max_val:
+            result.add(id)
+        else:
+            break
+    for min_val, max_val, id in intervals[pos:]:
+        if point <= max_val:
+            if min_val <= point:
+                result.add(id)
+        else:
+            break
+    return result
+
+
+def test_interval_tree_matches_scan():
+    rng = random.Random(7)
+    intervals = []
+    tree = IntervalTree()
+    for id in range(60):
+        min_val = float(rng.randint(0, 50))
+        max_val = min_val + rng.choice([0, rng.randint(0, 30)])
+        intervals.append((min_val, max_val, id))
+        tree.insert(min_val, max_val, id)
+
+    for point in np.linspace(-5, 85, 181):
+        assert tree.find_containing(float(point)) == _scan_containing(
+            intervals, float(point)
+        )
+
+
+def _make_page(cells: list[TextCell]) -> Page:
+    page_bbox = BoundingBox(l=0, t=0, r=600, b=800)
+    page = Page(page_no=0, size=Size(width=600, height=800))
+    page.parsed_page = SegmentedPdfPage(
+        dimension=PdfPageGeometry(
+            angle=0,
+            rect=BoundingRectangle.from_bounding_box(page_bbox),
+            boundary_type="crop_box",
+            art_bbox=page_bbox,
+            bleed_bbox=page_bbox,
+            crop_bbox=page_bbox,
+            media_bbox=page_bbox,
+            trim_bbox=page_bbox,
+        ),
+        textline_cells=cells,
+        char_cells=[],
+        word_cells=[],
+        has_lines=True,
+    )
+    return page
+
+
+def test_postprocess_assigns_cells_and_merges_overlaps():
+    cells = [
+        TextCell(
+            index=i,
+            text=f"line {i}",
+            orig=f"line {i}",
+            from_ocr=False,
+            rect=BoundingRectangle.from_bounding_box(
+                BoundingBox(l=50, t=100 + 20 * i, r=300, b=112 + 20 * i)
+            ),
+        )
+        for i in range(6)
+    ]
+    page = _make_page(cells)
+    clusters = [
+        # Two near-identical proposals for the first paragraph
+        Cluster(
+            id=0,
+            label=DocItemLabel.TEXT,
+            confidence=0.9,
+            bbox=BoundingBox(l=45, t=95, r=305, b=155),
+        ),
+        Cluster(
+            id=1,
+            label=DocItemLabel.TEXT,
+            confidence=0.6,
+            bbox=BoundingBox(l=46, t=96, r=304, b=154),
+        ),
+        Cluster(
+            id=2,
+            label=DocItemLabel.SECTION_HEADER,
+            confidence=0.8,
+            bbox=BoundingBox(l=45, t=155, r=305, b=175),
+        ),
+    ]
+
+    final_clusters, final_cells = LayoutPostprocessor(
+        page, clusters, LayoutOptions()
+    ).postprocess()
+
+    assert [c.id for c in final_clusters] == [0, 2, 3, 4]
+    assert [[cell.index for cell in c.cells] for c in final_clusters] == [
+        [0, 1, 2],
+        [3],
+        [4],
+        [5],
+    ]
+    # Cluster boxes are shrunk to their cells
+    assert final_clusters[0].bbox == BoundingBox(l=50, t=100, r=300, b=152)
+    assert final_cells == cells
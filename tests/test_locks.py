@@ -0,0 +1,52 @@
+import threading
+import time
+from pathlib import Path
+
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
+from docling.utils.locks import InstrumentedLock, pypdfium2_lock
+
+
+def test_instrumented_lock_counts_contention():
+    lock = InstrumentedLock("test")
+    holding = threading.Event()
+
+    def hold():
+        with lock:
+            holding.set()
+            time.sleep(0.1)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    holding.wait()
+    with lock:
+        pass
+    thread.join()
+
+    stats = lock.stats()
+    assert stats.acquisitions == 2
+    assert stats.contended == 1
+    assert stats.contention_rate == 0.5
+    assert stats.wait_seconds > 0
+    assert stats.hold_seconds >= 0.1
+
+    lock.reset_stats()
+    assert lock.stats().acquisitions == 0
+
+
+def test_pdf_rendering_is_measured():
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/pdf/redp5110_sampled.pdf"),
+        format=InputFormat.PDF,
+        backend=DoclingParseV4DocumentBackend,
+    )
+    before = pypdfium2_lock.stats()
+    page = in_doc._backend.load_page(0)
+    size = page.get_size()
+    image = page.get_page_image(scale=2.0)
+    page.unload()
+    in_doc._backend.unload()
+
+    assert image.size == (round(size.width * 2.0), round(size.height * 2.0))
+    assert pypdfium2_lock.stats().acquisitions > before.acquisitions
@@ -0,0 +1,324 @@
+import random
+import threading
+from pathlib import Path
+from typing import Type
+
+import numpy as np
+import pytest
+from docling_core.types.doc import BoundingBox, CoordOrigin, Size
+from docling_core.types.doc.page import BoundingRectangle, TextCell
+from PIL import Image, ImageDraw
+from scipy.ndimage import binary_dilation, find_objects, label
+
+from docling.datamodel.accelerator_options import AcceleratorOptions
+from docling.datamodel.pipeline_options import (
+    OcrCacheOptions,
+    OcrOptions,
+    TesseractCliOcrOptions,
+)
+from docling.models.base_ocr_model import BaseOcrModel, OcrRegion
+from docling.utils.engine_pool import EnginePool
+
+from .page_utils import preprocessed_pages, unload_pages
+
+
+class _RecordingOcrModel(BaseOcrModel):
+    """Stands in for an OCR engine: one cell spanning each region."""
+
+    def __init__(self, options: OcrOptions):
+        super().__init__(
+            enabled=True,
+            artifacts_path=None,
+            options=options,
+            accelerator_options=AcceleratorOptions(),
+        )
+        self.calls: list[list[OcrRegion]] = []
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _ocr_regions(self, regions):
+        with self._lock:
+            self.calls.append(list(regions))
+            self.threads.add(threading.current_thread().name)
+        for region in regions:
+            width, height = region.image.size
+            assert round(region.rect.width * self.scale) == width
+            assert round(region.rect.height * self.scale) == height
+            text = f"page {region.page.page_no} region {region.index}"
+            region.cells = [
+                TextCell(
+                    index=0,
+                    text=text,
+                    orig=text,
+                    from_ocr=True,
+                    rect=BoundingRectangle.from_bounding_box(region.rect),
+                )
+            ]
+
+    @classmethod
+    def get_options_type(cls) -> Type[OcrOptions]:
+        return TesseractCliOcrOptions
+
+
+def _unload(batches):
+    for conv_res, pages in batches:
+        unload_pages(conv_res, pages)
+
+
+def test_regions_of_all_documents_are_recognized_together():
+    batches = [
+        preprocessed_pages(Path("./tests/data/pdf/redp5110_sampled.pdf"), [0, 1]),
+        preprocessed_pages(Path("./tests/data/pdf/picture_classification.pdf"), [0]),
+    ]
+    model = _RecordingOcrModel(TesseractCliOcrOptions())
+    model.regions_per_call = None
+    expected_rects = {
+        id(page): model.get_ocr_rects(page) for _, pages in batches for page in pages
+    }
+
+    results = model.process_documents(batches)
+
+    # One engine call for all regions, the largest first
+    assert len(model.calls) == 1
+    areas = [region.rect.area() for region in model.calls[0]]
+    assert len({id(region.page) for region in model.calls[0]}) == 2
+    assert areas == sorted(areas, reverse=True)
+    assert all(region.image is None for region in model.calls[0])
+
+    for (_, pages), result in zip(batches, results):
+        assert result == pages
+        for page in pages:
+            regions = sorted(
+                (r for r in model.calls[0] if r.page is page), key=lambda r: r.index
+            )
+            rects = [r for r in expected_rects[id(page)] if r.area() > 0]
+            assert [region.rect for region in regions] == rects
+    _unload(batches)
+
+
+def test_region_batches_run_on_several_workers():
+    batches = [
+        preprocessed_pages(Path("./tests/data/pdf/redp5110_sampled.pdf"), [0, 3]),
+    ]
+    model = _RecordingOcrModel(TesseractCliOcrOptions(force_full_page_ocr=True))
+    model.num_workers = 2
+
+    model.process_documents(batches)
+
+    assert [len(regions) for regions in model.calls] == [1, 1]
+    assert all(name.startswith("ocr") for name in model.threads)
+    for page in batches[0][1]:
+        assert [cell.text for cell in page.cells] == [f"page {page.page_no} region 0"]
+    _unload(batches)
+
+
+def test_ocr_models_must_implement_recognition():
+    class _NoOcrModel(BaseOcrModel):
+        @classmethod
+        def get_options_type(cls) -> Type[OcrOptions]:
+            return TesseractCliOcrOptions
+
+    class _OwnCallOcrModel(_NoOcrModel):
+        def __call__(self, conv_res, page_batch):
+            yield from page_batch
+
+    kwargs = dict(
+        enabled=True,
+        artifacts_path=None,
+        options=TesseractCliOcrOptions(),
+        accelerator_options=AcceleratorOptions(),
+    )
+    with pytest.raises(TypeError, match="_NoOcrModel"):
+        _NoOcrModel(**kwargs)
+
+    # Plugin models with their own page loop keep working
+    batches = [preprocessed_pages(Path("./tests/data/pdf/multi_page.pdf"), [0])]
+    assert _OwnCallOcrModel(**kwargs).process_documents(batches) == [batches[0][1]]
+    _unload(batches)
+
+
+def test_cached_regions_skip_the_engine(tmp_path):
+    options = TesseractCliOcrOptions(
+        cache=OcrCacheOptions(enabled=True, path=tmp_path / "ocr.sqlite")
+    )
+
+    def run():
+        batches = [
+            preprocessed_pages(Path("./tests/data/pdf/redp5110_sampled.pdf"), [0, 1]),
+            preprocessed_pages(
+                Path("./tests/data/pdf/picture_classification.pdf"), [0]
+            ),
+        ]
+        model = _RecordingOcrModel(options)
+        model.process_documents(batches)
+        cells = [
+            [cell.model_dump() for cell in page.cells]
+            for _, pages in batches
+            for page in pages
+        ]
+        _unload(batches)
+        return model, cells
+
+    first, first_cells = run()
+    num_regions = sum(len(regions) for regions in first.calls)
+    assert num_regions > 0
+    assert first._cache is not None
+    assert first._cache.stats()["misses"] == num_regions
+    first._cache.close()
+
+    # A new model finds the results in the cache file, at the same page positions
+    second, second_cells = run()
+    assert second.calls == []
+    assert second._cache is not None
+    assert second._cache.hits == num_regions
+    assert second._cache.hit_rate == 1.0
+    assert second_cells == first_cells
+    second._cache.close()
+
+
+def test_failed_regions_are_not_cached(tmp_path):
+    class _FailingOcrModel(_RecordingOcrModel):
+        def _ocr_regions(self, regions):
+            super()._ocr_regions(regions)
+            for region in regions:
+                region.cells = []
+                region.failed = True
+
+    options = TesseractCliOcrOptions(
+        force_full_page_ocr=True,
+        cache=OcrCacheOptions(enabled=True, path=tmp_path / "ocr.sqlite"),
+    )
+    for model in (_FailingOcrModel(options), _RecordingOcrModel(options)):
+        batches = [
+            preprocessed_pages(Path("./tests/data/pdf/redp5110_sampled.pdf"), [0])
+        ]
+        model.process_documents(batches)
+        _unload(batches)
+        # The engine is asked again after a failure
+        assert len(model.calls) == 1
+        assert model._cache is not None
+        assert model._cache.hits == 0
+        model._cache.close()
+
+
+def test_cache_key_ignores_the_number_of_workers():
+    def engine_key(**kwargs):
+        return _RecordingOcrModel(TesseractCliOcrOptions(**kwargs))._cache_engine_key()
+
+    assert engine_key(num_processes=1) == engine_key(num_processes=4)
+    assert engine_key(psm=6) != engine_key()
+    assert engine_key(cache=OcrCacheOptions(max_entries=10)) == engine_key()
+
+
+def _raster_ocr_rects(size: Size, bitmap_rects: list[BoundingBox]):
+    # Reference: the dilation of a page raster find_ocr_rects used to do
+    image = Image.new("1", (round(size.width), round(size.height)))
+    draw = ImageDraw.Draw(image)
+    for rect in bitmap_rects:
+        x0, y0, x1, y1 = (round(v) for v in rect.as_tuple())
+        draw.rectangle([(x0, y0), (x1, y1)], fill=1)
+    np_image = binary_dilation(np.array(image) > 0, structure=np.ones((20, 20)))
+    labeled_image, _ = label(np_image > 0)
+    boxes = [
+        BoundingBox(
+            l=slc[1].start,
+            t=slc[0].start,
+            r=slc[1].stop - 1,
+            b=slc[0].stop - 1,
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+        for slc in find_objects(labeled_image)
+    ]
+    return np.sum(np_image > 0) / (size.width * size.height), boxes
+
+
+def test_ocr_rects_match_raster_dilation():
+    rng = random.Random(3)
+    for _ in range(300):
+        size = Size(width=rng.uniform(50, 300), height=rng.uniform(50, 300))
+        rects = []
+        for _ in range(rng.choice([0, 1, 2, 5, 20])):
+            x = rng.uniform(-40, size.width + 10)
+            y = rng.uniform(-40, size.height + 10)
+            w = rng.choice([0, rng.uniform(0, 30), rng.uniform(0, size.width)])
+            h = rng.choice([0, rng.uniform(0, 30), rng.uniform(0, size.height)])
+            rects.append(BoundingBox(l=x, t=y, r=x + w, b=y + h))
+        if rng.random() < 0.1:
+            rects.append(BoundingBox(l=0, t=0, r=size.width, b=size.height))
+
+        assert BaseOcrModel.find_ocr_rects(size, rects) == _raster_ocr_rects(
+            size, rects
+        )
+
+    # Many tiny bitmaps, e.g. one per glyph
+    size = Size(width=612, height=792)
+    rects = []
+    for _ in range(400):
+        x, y = rng.uniform(0, 590), rng.uniform(0, 770)
+        rects.append(BoundingBox(l=x, t=y, r=x + rng.uniform(0, 4), b=y + 6))
+    assert BaseOcrModel.find_ocr_rects(size, rects) == _raster_ocr_rects(size, rects)
+
+    for path in (
+        "./tests/data/pdf/redp5110_sampled.pdf",
+        "./tests/data/pdf/picture_classification.pdf",
+    ):
+        conv_res, pages = preprocessed_pages(Path(path), [0, 1])
+        for page in pages:
+            rects = list(page._backend.get_bitmap_rects())
+            assert BaseOcrModel.find_ocr_rects(page.size, rects) == _raster_ocr_rects(
+                page.size, rects
+            )
+        _unload([(conv_res, pages)])
+
+
+class _FakeReaders:
+    ended = 0
+
+    def end(self):
+        _FakeReaders.ended += 1
+
+
+def test_engine_pool_is_lazy_and_bounded():
+    created = []
+
+    def factory():
+        created.append(_FakeReaders())
+        return created[-1]
+
+    pool = EnginePool(factory, max_size=2, close=_FakeReaders.end)
+    assert created == []
+
+    # Sequential checkouts share one reader set
+    for _ in range(3):
+        with pool.checkout() as readers:
+            assert readers is created[0]
+    assert len(created) == 1
+
+    # Concurrent checkouts never exceed the pool size
+    in_use = []
+    peak = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(4)
+
+    def work():
+        barrier.wait()
+        with pool.checkout() as readers:
+            with lock:
+                assert readers not in in_use
+                in_use.append(readers)
+                peak.append(len(in_use))
+            threading.Event().wait(0.1)
+            with lock:
+                in_use.remove(readers)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 2
+    assert max(peak) == 2
+
+    pool.close()
+    assert _FakeReaders.ended == 2
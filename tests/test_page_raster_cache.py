@@ -0,0 +1,123 @@
+import threading
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox, CoordOrigin
+
+from docling.utils.page_raster_cache import PageRasterCache
+
+from .page_utils import load_pages, unload_pages
+
+
+def _pages(page_nos: list[int]):
+    conv_res, pages = load_pages(
+        Path("./tests/data/pdf/redp5110_sampled.pdf"), page_nos
+    )
+    renders = []
+    for page in pages:
+
+        def get_page_image(*args, _render=page._backend.get_page_image, **kwargs):
+            renders.append(kwargs.get("cropbox"))
+            return _render(*args, **kwargs)
+
+        page._backend.get_page_image = get_page_image  # type: ignore[method-assign]
+    return conv_res, pages, renders
+
+
+def _crops():
+    return [
+        BoundingBox(l=50, t=700, r=300, b=500, coord_origin=CoordOrigin.BOTTOMLEFT),
+        BoundingBox(l=100, t=100, r=400, b=250, coord_origin=CoordOrigin.TOPLEFT),
+        BoundingBox(l=10, t=750, r=500, b=600, coord_origin=CoordOrigin.BOTTOMLEFT),
+    ]
+
+
+def test_crops_share_one_rendering_per_page_and_scale():
+    conv_res, pages, renders = _pages([0, 1])
+    cache = PageRasterCache(max_bytes=64 * 1024 * 1024)
+
+    for page in pages:
+        for cropbox in _crops():
+            for scale in (1.0, 2.0):
+                image = cache.get_image(page, scale=scale, cropbox=cropbox)
+                assert image is not None
+                expected = cropbox.to_top_left_origin(page.size.height)
+                assert image.size == (
+                    round(expected.width * scale),
+                    round(expected.height * scale),
+                )
+
+    # Full pages only, once per page and scale
+    assert renders == [None] * 4
+    assert (cache.hits, cache.misses) == (8, 4)
+
+    cache.clear()
+    cache.get_image(pages[0], scale=1.0, cropbox=_crops()[0])
+    assert len(renders) == 5
+
+    unload_pages(conv_res, pages)
+
+
+def test_memory_budget_bounds_the_cached_pages():
+    conv_res, pages, renders = _pages([0, 1])
+    page_bytes = PageRasterCache._page_bytes(pages[0], 1.0)
+
+    # Room for one page: the least recently used one is evicted
+    cache = PageRasterCache(max_bytes=page_bytes + page_bytes // 2)
+    for page in (pages[0], pages[1], pages[0]):
+        cache.get_image(page, scale=1.0, cropbox=_crops()[0])
+    assert renders == [None] * 3
+    assert cache._bytes <= cache.max_bytes
+
+    # Pages above the budget are never held, the crops are rendered directly
+    renders.clear()
+    cache = PageRasterCache(max_bytes=page_bytes // 2)
+    for cropbox in _crops():
+        cache.get_image(pages[0], scale=1.0, cropbox=cropbox)
+    assert renders == _crops()
+    assert cache._bytes == 0
+
+    unload_pages(conv_res, pages)
+
+
+def test_pages_are_rendered_outside_the_lock():
+    conv_res, pages, renders = _pages([0, 1])
+    cache = PageRasterCache(max_bytes=64 * 1024 * 1024)
+    cache.get_image(pages[0], scale=1.0)
+
+    rendering = threading.Event()
+    proceed = threading.Event()
+    render_page = pages[1]._backend.get_page_image
+
+    def slow_get_page_image(*args, **kwargs):
+        rendering.set()
+        proceed.wait(5)
+        return render_page(*args, **kwargs)
+
+    pages[1]._backend.get_page_image = slow_get_page_image  # type: ignore[method-assign]
+    images = []
+    missing = [
+        threading.Thread(
+            target=lambda: images.append(cache.get_image(pages[1], scale=1.0))
+        )
+        for _ in range(3)
+    ]
+    for thread in missing:
+        thread.start()
+    assert rendering.wait(5)
+
+    # A hit on another page is served while the miss is being rendered
+    hit = threading.Thread(target=cache.get_image, args=(pages[0], 1.0))
+    hit.start()
+    hit.join(5)
+    assert not hit.is_alive()
+
+    proceed.set()
+    for thread in missing:
+        thread.join(5)
+    # The threads missing the same page share one rendering
+    assert renders == [None, None]
+    assert len(images) == 3
+    assert images[0] is images[1] is images[2]
+    assert (cache.hits, cache.misses) == (3, 2)
+
+    unload_pages(conv_res, pages)
@@ -0,0 +1,49 @@
+from io import BytesIO
+from pathlib import Path
+
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter
+
+MD_FILES = [
+    Path("./tests/data/md/wiki.md"),
+    Path("./tests/data/md/mixed.md"),
+    Path("./tests/data/md/nested.md"),
+    Path("./tests/data/md/ending_with_table.md"),
+]
+
+
+def test_process_pool_matches_in_process_conversion(monkeypatch):
+    sources = [
+        *MD_FILES,
+        DocumentStream(name="stream.md", stream=BytesIO(MD_FILES[0].read_bytes())),
+    ]
+    expected = [
+        res.document.export_to_markdown()
+        for res in DocumentConverter(allowed_formats=[InputFormat.MD]).convert_all(
+            sources
+        )
+    ]
+    sources[-1].stream.seek(0)
+
+    monkeypatch.setattr(settings.perf, "doc_process_workers", 2)
+    monkeypatch.setattr(settings.perf, "doc_process_max_tasks", 2)
+    converter = DocumentConverter(allowed_formats=[InputFormat.MD])
+    try:
+        results = list(converter.convert_all(sources))
+    finally:
+        converter.shutdown()
+
+    assert [res.input.file.name for res in results] == [
+        "wiki.md",
+        "mixed.md",
+        "nested.md",
+        "ending_with_table.md",
+        "stream.md",
+    ]
+    for res, md in zip(results, expected):
+        assert res.status == ConversionStatus.SUCCESS
+        assert res.input.format == InputFormat.MD
+        assert res.document.export_to_markdown() == md
+    # Pipelines live in the workers only
+    assert converter.initialized_pipelines == {}
@@ -0,0 +1,67 @@
+import warnings
+from pathlib import Path
+
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.document_converter import DocumentConverter
+from docling.utils.result_cache import ConversionResultCache
+
+MD_FILES = [
+    Path("./tests/data/md/wiki.md"),
+    Path("./tests/data/md/mixed.md"),
+    Path("./tests/data/md/nested.md"),
+]
+
+
+def test_result_cache_hit_returns_same_document(tmp_path: Path):
+    cache = ConversionResultCache(cache_dir=tmp_path)
+    converter = DocumentConverter(allowed_formats=[InputFormat.MD], result_cache=cache)
+
+    cold = converter.convert(MD_FILES[0])
+    assert cache.stats.misses == 1
+    assert cache.stats.stores == 1
+
+    warm = converter.convert(MD_FILES[0])
+    assert cache.stats.hits == 1
+    assert warm.status == ConversionStatus.SUCCESS
+    assert warm.input.file == MD_FILES[0]
+    assert warm.document.export_to_markdown() == cold.document.export_to_markdown()
+
+
+def test_result_cache_is_shared_across_converters(tmp_path: Path):
+    DocumentConverter(
+        allowed_formats=[InputFormat.MD],
+        result_cache=ConversionResultCache(cache_dir=tmp_path),
+    ).convert(MD_FILES[0])
+
+    cache = ConversionResultCache(cache_dir=tmp_path)
+    assert cache.stats.entries == 1
+    converter = DocumentConverter(allowed_formats=[InputFormat.MD], result_cache=cache)
+    converter.convert(MD_FILES[0])
+    assert cache.stats.hits == 1
+    assert converter.initialized_pipelines == {}
+
+
+def test_result_cache_lru_eviction(tmp_path: Path):
+    cache = ConversionResultCache(cache_dir=tmp_path)
+    converter = DocumentConverter(allowed_formats=[InputFormat.MD], result_cache=cache)
+    for res in converter.convert_all(MD_FILES[:2]):
+        assert res.status == ConversionStatus.SUCCESS
+    # Touch the first entry so the second one becomes least recently used
+    converter.convert(MD_FILES[0])
+    assert cache.stats.hits == 1
+
+    cache.max_size_bytes = cache.stats.size_bytes
+    converter.convert(MD_FILES[2])
+
+    assert cache.stats.evictions >= 1
+    converter.convert(MD_FILES[1])
+    assert cache.stats.hits == 1
+
+
+def test_result_cache_key_does_not_warn(tmp_path: Path):
+    cache = ConversionResultCache(cache_dir=tmp_path)
+    converter = DocumentConverter(allowed_formats=[InputFormat.MD], result_cache=cache)
+    with warnings.catch_warnings():
+        warnings.filterwarnings("error", message="Pydantic serializer warnings")
+        converter.convert(MD_FILES[0])
+    assert cache.stats.misses == 1
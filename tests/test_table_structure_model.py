@@ -0,0 +1,141 @@
+import copy
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox, DocItemLabel
+from docling_core.types.doc.page import BoundingRectangle, TextCellUnit
+
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.datamodel.accelerator_options import AcceleratorOptions
+from docling.datamodel.base_models import (
+    Cluster,
+    InputFormat,
+    LayoutPrediction,
+    Page,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import TableStructureOptions
+from docling.models.table_structure_model import TableStructureModel
+from docling.utils.cell_index import TextCellIndex
+
+
+class _RecordingPredictor:
+    """Stands in for the TableFormer predictor, which needs model weights."""
+
+    def __init__(self):
+        self.calls: list[tuple[list[dict], list[list[float]]]] = []
+
+    def multi_table_predict(self, page_input, table_bboxes, do_matching=True):
+        tokens = page_input["tokens"]
+        self.calls.append((tokens, table_bboxes))
+        return [
+            {
+                "tf_responses": [],
+                "predict_details": {"num_rows": 1, "num_cols": len(tokens)},
+            }
+            for _ in table_bboxes
+        ]
+
+
+def test_tables_with_the_same_tokens_share_one_call():
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/pdf/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=DoclingParseV4DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    page = Page(page_no=0)
+    page._backend = in_doc._backend.load_page(0)
+    page.size = page._backend.get_size()
+
+    width, height = page.size.width, page.size.height
+    top = BoundingBox(l=0, t=0, r=width, b=height / 2)
+    bottom = BoundingBox(l=0, t=height / 2, r=width, b=height)
+    page.predictions.layout = LayoutPrediction(
+        clusters=[
+            Cluster(id=1, label=DocItemLabel.TABLE, bbox=top),
+            Cluster(id=2, label=DocItemLabel.TEXT, bbox=bottom),
+            Cluster(id=3, label=DocItemLabel.TABLE, bbox=bottom),
+            Cluster(id=4, label=DocItemLabel.TABLE, bbox=top),
+        ]
+    )
+
+    model = TableStructureModel(
+        enabled=False,
+        artifacts_path=None,
+        options=TableStructureOptions(),
+        accelerator_options=AcceleratorOptions(),
+    )
+    model.scale = 2.0
+    model.tf_predictor = _RecordingPredictor()
+
+    predictions = model.predict_tables(conv_res, [page])
+    page._backend.unload()
+    in_doc._backend.unload()
+
+    calls = model.tf_predictor.calls
+    assert [len(bboxes) for _, bboxes in calls] == [2, 1]
+    assert all(len(tokens) > 0 for tokens, _ in calls)
+    assert calls[0][0] != calls[1][0]
+
+    table_map = predictions[0].table_map
+    assert list(table_map) == [1, 3, 4]
+    assert table_map[1].num_cols == table_map[4].num_cols == len(calls[0][0])
+    assert table_map[3].num_cols == len(calls[1][0])
+
+
+def _reference_tokens(sp, bbox, scale):
+    # Token extraction as done before the word-cell index
+    tokens = []
+    for c in sp.get_cells_in_bbox(cell_unit=TextCellUnit.WORD, bbox=bbox):
+        if len(c.text.strip()) > 0:
+            new_cell = copy.deepcopy(c)
+            new_cell.rect = BoundingRectangle.from_bounding_box(
+                new_cell.rect.to_bounding_box().scaled(scale=scale)
+            )
+            tokens.append(
+                {
+                    "id": new_cell.index,
+                    "text": new_cell.text,
+                    "bbox": new_cell.rect.to_bounding_box().model_dump(),
+                }
+            )
+    return tokens
+
+
+def test_word_cell_index_matches_segmented_page_lookup():
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/pdf/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=DoclingParseV4DocumentBackend,
+    )
+    page_backend = in_doc._backend.load_page(0)
+    sp = page_backend.get_segmented_page()
+    size = page_backend.get_size()
+
+    model = TableStructureModel(
+        enabled=False,
+        artifacts_path=None,
+        options=TableStructureOptions(),
+        accelerator_options=AcceleratorOptions(),
+    )
+    model.scale = 2.0
+    word_index = TextCellIndex(sp.word_cells, page_height=sp.dimension.height)
+
+    for left, top, right, bottom in [
+        (0, 0, 1, 1),
+        (0, 0, 0.5, 0.3),
+        (0.1, 0.4, 0.9, 0.7),
+    ]:
+        bbox = BoundingBox(
+            l=left * size.width,
+            t=top * size.height,
+            r=right * size.width,
+            b=bottom * size.height,
+        )
+        cluster = Cluster(id=0, label=DocItemLabel.TABLE, bbox=bbox)
+        expected = _reference_tokens(sp, bbox, model.scale)
+        assert len(expected) > 0
+        assert model._get_table_tokens(cluster, word_index) == expected
+
+    page_backend.unload()
+    in_doc._backend.unload()
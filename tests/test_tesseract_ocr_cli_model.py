@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+
+from docling.datamodel.accelerator_options import AcceleratorOptions
+from docling.datamodel.pipeline_options import TesseractCliOcrOptions
+from docling.models.tesseract_ocr_cli_model import (
+    TesseractOcrCliModel,
+    _parse_osd,
+    _parse_tsv,
+)
+
+_TSV = (
+    "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\t"
+    "left\ttop\twidth\theight\tconf\ttext\n"
+    "1\t1\t0\t0\t0\t0\t0\t0\t300\t100\t-1\t\n"
+    "5\t1\t1\t1\t1\t1\t10\t20\t30\t40\t96.5\tnan\n"
+    '5\t1\t1\t1\t1\t2\t50\t20\t30\t40\t91\t"1.50"\n'
+    "1\t2\t0\t0\t0\t0\t0\t0\t300\t100\t-1\t\n"
+    "1\t3\t0\t0\t0\t0\t0\t0\t300\t100\t-1\t\n"
+    "5\t3\t1\t1\t1\t1\t1\t2\t3\t4\t50\tword\n"
+)
+
+_OSD = (
+    "Page number: 0\n"
+    "Orientation in degrees: 0\n"
+    "Rotate: 0\n"
+    "Orientation confidence: 15.41\n"
+    "Script: Latin\n"
+    "Script confidence: 3.33\n"
+    "Page number: 1\n"
+    "Orientation in degrees: 270\n"
+    "Rotate: 90\n"
+    "Orientation confidence: 4.20\n"
+    "Script: Cyrillic\n"
+    "Script confidence: 1.00\n"
+)
+
+
+def test_parse_tsv_keeps_words_verbatim():
+    pages = _parse_tsv(_TSV)
+    assert sorted(pages) == [0, 1, 2]
+    assert [row["text"] for row in pages[0]] == ["nan", '"1.50"']
+    assert pages[1] == []
+    assert pages[2][0]["conf"] == "50"
+
+
+def test_parse_osd():
+    pages = _parse_osd(_OSD)
+    assert pages[0]["Script"] == "Latin"
+    assert pages[1]["Orientation in degrees"] == "270"
+
+
+# Behaves like tesseract on an image list: prints the result of each image and
+# stops with an error at the first image whose name contains "fail"
+_FAKE_TESSERACT = """
+import sys
+with open(sys.argv[-2]) as f:
+    images = [line.strip() for line in f if line.strip()]
+for ix, image in enumerate(images):
+    if "fail" in image:
+        sys.exit(1)
+    print(f"Page number: {ix}")
+    print(f"Script: {image}")
+"""
+
+
+def test_image_list_continues_after_failed_images(tmp_path: Path):
+    script = tmp_path / "fake_tesseract.py"
+    script.write_text(_FAKE_TESSERACT)
+    model = TesseractOcrCliModel(
+        enabled=False,
+        artifacts_path=None,
+        options=TesseractCliOcrOptions(),
+        accelerator_options=AcceleratorOptions(),
+    )
+
+    images = [str(tmp_path / name) for name in ["a", "fail1", "b", "fail2", "c"]]
+    results = model._run_image_list(
+        lambda list_file: [sys.executable, str(script), list_file, "stdout"],
+        images,
+        _parse_osd,
+    )
+
+    assert [r["Script"] if r is not None else None for r in results] == [
+        images[0],
+        None,
+        images[2],
+        None,
+        images[4],
+    ]
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+from docling_core.types.doc import DocItemLabel
+
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import (
+    InputFormat,
+    LayoutPath,
+    LayoutPrediction,
+    Page,
+)
+from docling.datamodel.document import InputDocument
+from docling.datamodel.pipeline_options import TextFastPathOptions
+from docling.models.base_model import BasePageModel
+from docling.models.text_fast_path_model import TextFastPathLayoutModel
+
+from .page_utils import preprocessed_pages, unload_pages
+
+
+class _RecordingLayoutModel(BasePageModel):
+    """Stands in for the layout model, which needs model weights."""
+
+    def __init__(self):
+        self.pages: list[Page] = []
+
+    def __call__(self, conv_res, page_batch):
+        for page in page_batch:
+            self.pages.append(page)
+            page.predictions.layout = LayoutPrediction()
+            yield page
+
+
+def test_text_pages_skip_the_layout_model():
+    text_res, text_pages = preprocessed_pages(
+        Path("./tests/data/pdf/multi_page.pdf"), [0, 1]
+    )
+    table_res, table_pages = preprocessed_pages(
+        Path("./tests/data/pdf/2305.03393v1-pg9.pdf"), [0]
+    )
+
+    layout_model = _RecordingLayoutModel()
+    model = TextFastPathLayoutModel(layout_model, TextFastPathOptions(enabled=True))
+    model.process_documents([(text_res, text_pages), (table_res, table_pages)])
+
+    # The page with a ruled table goes to the layout model
+    assert layout_model.pages == table_pages
+    assert table_pages[0].layout_path == LayoutPath.MODEL
+
+    for page in text_pages:
+        assert page.layout_path == LayoutPath.TEXT_FAST_PATH
+        clusters = page.predictions.layout.clusters
+        # Every text line ends up in exactly one cluster
+        cells = [cell for cluster in clusters for cell in cluster.cells]
+        assert sorted(cell.index for cell in cells) == sorted(
+            cell.index for cell in page.cells if cell.text.strip()
+        )
+
+    clusters = text_pages[0].predictions.layout.clusters
+    assert clusters[0].label == DocItemLabel.SECTION_HEADER
+    assert clusters[0].cells[0].text.startswith("The Evolution of the Word Processor")
+    assert DocItemLabel.LIST_ITEM in {c.label for c in clusters}
+
+    unload_pages(text_res, text_pages)
+    unload_pages(table_res, table_pages)
+
+
+def test_path_rects_agree_between_backends():
+    path = Path("./tests/data/pdf/2305.03393v1-pg9.pdf")
+    rects = []
+    for backend in (DoclingParseV4DocumentBackend, PyPdfiumDocumentBackend):
+        in_doc = InputDocument(
+            path_or_stream=path, format=InputFormat.PDF, backend=backend
+        )
+        page_backend = in_doc._backend.load_page(0)
+        rects.append(list(page_backend.get_path_rects()))
+        page_backend.unload()
+        in_doc._backend.unload()
+
+    assert len(rects[0]) > 0
+    assert rects[0] == rects[1]
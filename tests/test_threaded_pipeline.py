@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import List
@@ -6,15 +8,119 @@ from typing import List
 import pytest
 
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    InputFormat,
+    LayoutPrediction,
+)
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
+    LayoutOptions,
     PdfPipelineOptions,
     ThreadedPdfPipelineOptions,
 )
+from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.base_layout_model import BaseLayoutModel
+from docling.models.page_assemble_model import PageAssembleModel, PageAssembleOptions
+from docling.models.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+from docling.models.readingorder_model import ReadingOrderModel, ReadingOrderOptions
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
 from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
+from docling.utils.conversion_control import PageProgressEvent
+
+SHORT_PDFS = [
+    "tests/data/pdf/multi_page.pdf",
+    "tests/data/pdf/2305.03393v1-pg9.pdf",
+    "tests/data/pdf/picture_classification.pdf",
+]
+
+
+class _PassThroughModel:
+    """Stands in for the OCR, layout and table models, which need model weights."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def __call__(self, conv_res, page_batch):
+        for page in page_batch:
+            time.sleep(self.delay)
+            if page.predictions.layout is None:
+                page.predictions.layout = LayoutPrediction()
+            yield page
+
+
+class _StubModelsPdfPipeline(StandardPdfPipeline):
+    model_delay: float = 0.0
+
+    def _init_models(self) -> None:
+        self.keep_images = False
+        self.keep_backend = False
+        self.preprocessing_model = PagePreprocessingModel(
+            options=PagePreprocessingOptions(images_scale=1.0)
+        )
+        self.ocr_model = _PassThroughModel()
+        self.layout_model = _PassThroughModel(delay=self.model_delay)
+        self.table_model = _PassThroughModel()
+        self.assemble_model = PageAssembleModel(options=PageAssembleOptions())
+        self.reading_order_model = ReadingOrderModel(options=ReadingOrderOptions())
+
+
+class _SlowStubModelsPdfPipeline(_StubModelsPdfPipeline):
+    model_delay = 0.5
+
+
+class _RecordingLayoutModel(BaseLayoutModel):
+    """Records which documents shared each layout inference call."""
+
+    def __init__(self, expected_documents: int):
+        self.expected_documents = expected_documents
+        self.documents_seen: set[str] = set()
+        self.calls: list[list[str]] = []
+
+    @classmethod
+    def get_options_type(cls) -> type[LayoutOptions]:
+        return LayoutOptions
+
+    def predict_layout(self, conv_res, pages):
+        return self.predict_layout_documents([(conv_res, pages)])[0]
+
+    def predict_layout_documents(self, batches):
+        if not self.calls:
+            # Hold the first call until all documents have pages queued behind it
+            deadline = time.monotonic() + 30
+            while (
+                len(self.documents_seen) < self.expected_documents
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.05)
+            time.sleep(0.2)
+        self.calls.append([conv_res.input.file.name for conv_res, _ in batches])
+        return [[LayoutPrediction() for _ in pages] for _, pages in batches]
+
+
+class _SeenDocumentsModel(_PassThroughModel):
+    def __init__(self, seen: set[str]):
+        super().__init__()
+        self.seen = seen
+
+    def __call__(self, conv_res, page_batch):
+        self.seen.add(conv_res.input.file.name)
+        yield from super().__call__(conv_res, page_batch)
+
+
+class _RecordingLayoutPdfPipeline(_StubModelsPdfPipeline):
+    def _init_models(self) -> None:
+        super()._init_models()
+        self.layout_model = _RecordingLayoutModel(expected_documents=len(SHORT_PDFS))
+        self.ocr_model = _SeenDocumentsModel(self.layout_model.documents_seen)
+
+
+def _stage_threads() -> set[threading.Thread]:
+    return {t for t in threading.enumerate() if t.name.startswith("Stage-")}
 
 
 def test_threaded_pipeline_multiple_documents():
@@ -193,6 +299,236 @@ def test_pypdfium_threaded_pipeline():
     print("All done!")
 
 
+def test_stage_threads_are_reused_across_documents():
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_cls=_StubModelsPdfPipeline)
+        }
+    )
+    converter.initialize_pipeline(InputFormat.PDF)
+    threads_before = _stage_threads()
+
+    results = list(converter.convert_all(SHORT_PDFS))
+    threads_first = _stage_threads() - threads_before
+    assert len(threads_first) == 5
+
+    results += list(converter.convert_all(SHORT_PDFS))
+    assert _stage_threads() - threads_before == threads_first
+
+    assert [r.input.file.name for r in results] == [
+        Path(f).name for f in SHORT_PDFS
+    ] * 2
+    for res in results:
+        assert res.status == ConversionStatus.SUCCESS
+        assert len(res.pages) == res.input.page_count
+
+    for pipeline in converter.initialized_pipelines.values():
+        assert isinstance(pipeline, StandardPdfPipeline)
+        pipeline.shutdown()
+    assert not (_stage_threads() & threads_first)
+
+
+def test_concurrent_documents_share_stage_graph(monkeypatch):
+    monkeypatch.setattr(settings.perf, "doc_batch_size", 3)
+    monkeypatch.setattr(settings.perf, "doc_batch_concurrency", 3)
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_cls=_StubModelsPdfPipeline)
+        }
+    )
+    results = list(converter.convert_all(SHORT_PDFS * 2))
+
+    assert [r.input.file.name for r in results] == [
+        Path(f).name for f in SHORT_PDFS
+    ] * 2
+    for res in results:
+        assert res.status == ConversionStatus.SUCCESS
+        assert [p.page_no for p in res.pages] == list(range(res.input.page_count))
+
+
+def test_layout_batches_fill_across_documents(monkeypatch):
+    monkeypatch.setattr(settings.perf, "doc_batch_size", 3)
+    monkeypatch.setattr(settings.perf, "doc_batch_concurrency", 3)
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=_RecordingLayoutPdfPipeline,
+                pipeline_options=ThreadedPdfPipelineOptions(layout_batch_size=16),
+            )
+        }
+    )
+    results = list(converter.convert_all(SHORT_PDFS))
+    for res in results:
+        assert res.status == ConversionStatus.SUCCESS
+
+    (pipeline,) = converter.initialized_pipelines.values()
+    assert isinstance(pipeline, _RecordingLayoutPdfPipeline)
+    calls = pipeline.layout_model.calls
+    assert any(len(call) > 1 for call in calls)
+    assert sum(len(call) for call in calls) < sum(r.input.page_count for r in results)
+
+
+def test_document_timeout_keeps_stage_graph_usable():
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=_SlowStubModelsPdfPipeline,
+                pipeline_options=ThreadedPdfPipelineOptions(
+                    document_timeout=0.1, layout_batch_size=1
+                ),
+            )
+        }
+    )
+    res = converter.convert("tests/data/pdf/redp5110_sampled.pdf")
+    assert res.status == ConversionStatus.PARTIAL_SUCCESS
+    assert len(res.pages) < res.input.page_count
+
+    # The same pipeline instance (and stage graph) must still convert documents
+    (pipeline,) = converter.initialized_pipelines.values()
+    pipeline.pipeline_options.document_timeout = None
+    res = converter.convert("tests/data/pdf/2305.03393v1-pg9.pdf")
+    assert res.status == ConversionStatus.SUCCESS
+
+
+def test_page_shards_match_unsharded_conversion():
+    source = "tests/data/pdf/redp5110_sampled.pdf"
+    expected = (
+        DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(pipeline_cls=_StubModelsPdfPipeline)
+            }
+        )
+        .convert(source)
+        .document.export_to_markdown()
+    )
+
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=_StubModelsPdfPipeline,
+                pipeline_options=ThreadedPdfPipelineOptions(
+                    page_shard_size=6, page_shard_workers=2
+                ),
+            )
+        }
+    )
+    pipeline = converter._get_pipeline(InputFormat.PDF)
+    assert isinstance(pipeline, StandardPdfPipeline)
+    try:
+        res = converter.convert(source, page_range=(2, 17))
+        full = converter.convert(source)
+    finally:
+        pipeline.shutdown()
+
+    assert res.status == ConversionStatus.SUCCESS
+    assert [p.page_no for p in res.pages] == list(range(1, 17))
+    assert full.status == ConversionStatus.SUCCESS
+    assert [p.page_no for p in full.pages] == list(range(full.input.page_count))
+    assert full.document.export_to_markdown() == expected
+
+
+def test_convert_async_reports_pages_then_result():
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_cls=_StubModelsPdfPipeline)
+        }
+    )
+
+    async def collect():
+        return [item async for item in converter.convert_async(SHORT_PDFS[0])]
+
+    try:
+        items = asyncio.run(collect())
+    finally:
+        converter.shutdown()
+
+    *events, res = items
+    assert isinstance(res, ConversionResult)
+    assert res.status == ConversionStatus.SUCCESS
+    assert all(isinstance(ev, PageProgressEvent) for ev in events)
+    assert sorted(ev.page_no for ev in events) == list(
+        range(1, res.input.page_count + 1)
+    )
+    assert [ev.pages_done for ev in events] == list(range(1, len(events) + 1))
+    assert {ev.pages_total for ev in events} == {res.input.page_count}
+
+
+def test_convert_async_cancellation_stops_the_pipeline():
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=_SlowStubModelsPdfPipeline,
+                pipeline_options=ThreadedPdfPipelineOptions(layout_batch_size=1),
+            )
+        }
+    )
+    source = "tests/data/pdf/redp5110_sampled.pdf"
+
+    async def first_page_only():
+        events = converter.convert_async(source)
+        event = await events.__anext__()
+        await events.aclose()
+        return event
+
+    event = asyncio.run(first_page_only())
+    assert isinstance(event, PageProgressEvent)
+
+    # The cancelled run drains quickly instead of building all pages
+    start = time.monotonic()
+    executor = converter._async_executor
+    assert executor is not None
+    executor.shutdown(wait=True)
+    full_build_time = event.pages_total * _SlowStubModelsPdfPipeline.model_delay
+    assert time.monotonic() - start < full_build_time / 2
+
+    # The pipeline is still usable afterwards
+    res = converter.convert("tests/data/pdf/2305.03393v1-pg9.pdf")
+    assert res.status == ConversionStatus.SUCCESS
+
+
+def test_cancelled_convert_async_returns_after_the_run_stopped():
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=_SlowStubModelsPdfPipeline,
+                pipeline_options=ThreadedPdfPipelineOptions(layout_batch_size=1),
+            )
+        }
+    )
+    source = "tests/data/pdf/redp5110_sampled.pdf"
+    running = threading.Event()
+    first_page = asyncio.Event()
+    convert_all = converter.convert_all
+
+    def convert_all_recorded(*args, **kwargs):
+        running.set()
+        try:
+            yield from convert_all(*args, **kwargs)
+        finally:
+            time.sleep(0.2)  # winding down takes a while
+            running.clear()
+
+    converter.convert_all = convert_all_recorded  # type: ignore[method-assign]
+
+    async def convert():
+        async for _ in converter.convert_async(source):
+            first_page.set()
+
+    async def cancel_after_first_page():
+        task = asyncio.create_task(convert())
+        await first_page.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Nothing is left running on the converter once the task is done
+        assert not running.is_set()
+
+    try:
+        asyncio.run(cancel_after_first_page())
+    finally:
+        converter.shutdown()
+
+
 if __name__ == "__main__":
     # Run basic performance test
     test_pipeline_comparison()